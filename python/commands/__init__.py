@@ -2,12 +2,18 @@
 KiCAD command implementations package
 """
 
-from .project import ProjectCommands
-from .board import BoardCommands
-from .component import ComponentCommands
-from .routing import RoutingCommands
-from .design_rules import DesignRuleCommands
-from .export import ExportCommands
+import importlib
+
+# Submodules are imported on first attribute access so that importing a
+# single command module does not pull in every other one.
+_LAZY_EXPORTS = {
+    'ProjectCommands': '.project',
+    'BoardCommands': '.board',
+    'ComponentCommands': '.component',
+    'RoutingCommands': '.routing',
+    'DesignRuleCommands': '.design_rules',
+    'ExportCommands': '.export',
+}
 
 __all__ = [
     'ProjectCommands',
@@ -17,3 +23,16 @@ __all__ = [
     'DesignRuleCommands',
     'ExportCommands'
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,6 +5,7 @@ Board-related command implementations for KiCAD interface
 import pcbnew
 import logging
 from typing import Dict, Any, Optional
+from commands.board_ref import BoardRef, SharedBoard
 
 # Import specialized modules
 from .size import BoardSizeCommands
@@ -17,31 +18,18 @@ logger = logging.getLogger('kicad_interface')
 class BoardCommands:
     """Handles board-related KiCAD operations"""
 
+    board = SharedBoard()
+
     def __init__(self, board: Optional[pcbnew.BOARD] = None):
         """Initialize with optional board instance"""
-        self._board = board
-
-        # Initialize specialized command classes
-        self.size_commands = BoardSizeCommands(board)
-        self.layer_commands = BoardLayerCommands(board)
-        self.outline_commands = BoardOutlineCommands(board)
-        self.view_commands = BoardViewCommands(board)
-
-    @property
-    def board(self):
-        """Get current board reference"""
-        return self._board
-
-    @board.setter
-    def board(self, value):
-        """Set board reference and propagate to all nested command handlers"""
-        self._board = value
-        # Automatically propagate to all nested command objects
-        self.size_commands.board = value
-        self.layer_commands.board = value
-        self.outline_commands.board = value
-        self.view_commands.board = value
-        logger.debug(f"BoardCommands: board reference updated and propagated to all sub-commands. board is None: {value is None}")
+        self._board_ref = BoardRef.of(board)
+
+        # Initialize specialized command classes. They share the board
+        # reference, so a board set here is seen by all of them.
+        self.size_commands = BoardSizeCommands(self._board_ref)
+        self.layer_commands = BoardLayerCommands(self._board_ref)
+        self.outline_commands = BoardOutlineCommands(self._board_ref)
+        self.view_commands = BoardViewCommands(self._board_ref)
 
     # Delegate board size commands
     def set_board_size(self, params: Dict[str, Any]) -> Dict[str, Any]:
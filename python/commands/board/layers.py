@@ -5,15 +5,18 @@ Board layer command implementations for KiCAD interface
 import pcbnew
 import logging
 from typing import Dict, Any, Optional
+from commands.board_ref import BoardRef, SharedBoard
 
 logger = logging.getLogger('kicad_interface')
 
 class BoardLayerCommands:
     """Handles board layer operations"""
 
+    board = SharedBoard()
+
     def __init__(self, board: Optional[pcbnew.BOARD] = None):
         """Initialize with optional board instance"""
-        self.board = board
+        self._board_ref = BoardRef.of(board)
 
     def add_layer(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Add a new layer to the PCB"""
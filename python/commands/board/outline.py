@@ -6,15 +6,18 @@ import pcbnew
 import logging
 import math
 from typing import Dict, Any, Optional
+from commands.board_ref import BoardRef, SharedBoard
 
 logger = logging.getLogger('kicad_interface')
 
 class BoardOutlineCommands:
     """Handles board outline operations"""
 
+    board = SharedBoard()
+
     def __init__(self, board: Optional[pcbnew.BOARD] = None):
         """Initialize with optional board instance"""
-        self.board = board
+        self._board_ref = BoardRef.of(board)
 
     def add_board_outline(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Add a board outline to the PCB"""
@@ -5,15 +5,18 @@ Board size command implementations for KiCAD interface
 import pcbnew
 import logging
 from typing import Dict, Any, Optional
+from commands.board_ref import BoardRef, SharedBoard
 
 logger = logging.getLogger('kicad_interface')
 
 class BoardSizeCommands:
     """Handles board size operations"""
 
+    board = SharedBoard()
+
     def __init__(self, board: Optional[pcbnew.BOARD] = None):
         """Initialize with optional board instance"""
-        self.board = board
+        self._board_ref = BoardRef.of(board)
 
     def set_board_size(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Set the size of the PCB board by creating edge cuts outline"""
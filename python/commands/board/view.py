@@ -9,15 +9,18 @@ from typing import Dict, Any, Optional, List, Tuple
 from PIL import Image
 import io
 import base64
+from commands.board_ref import BoardRef, SharedBoard
 
 logger = logging.getLogger('kicad_interface')
 
 class BoardViewCommands:
     """Handles board viewing operations"""
 
+    board = SharedBoard()
+
     def __init__(self, board: Optional[pcbnew.BOARD] = None):
         """Initialize with optional board instance"""
-        self.board = board
+        self._board_ref = BoardRef.of(board)
 
     def get_board_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get information about the current board"""
@@ -150,7 +153,8 @@ class BoardViewCommands:
                     img = Image.open(io.BytesIO(png_data))
                     jpg_buffer = io.BytesIO()
                     img.convert('RGB').save(jpg_buffer, format='JPEG')
-                    jpg_data = jpg_buffer.getvalue()
+                    # Encode straight from the buffer instead of copying it out
+                    jpg_data = jpg_buffer.getbuffer()
                     return {
                         "success": True,
                         "imageData": base64.b64encode(jpg_data).decode('utf-8'),
@@ -0,0 +1,35 @@
+"""
+Shared board reference for KiCAD command handlers
+"""
+
+from typing import Any, Optional
+
+
+class BoardRef:
+    """Mutable cell holding the board that every command handler works on"""
+
+    __slots__ = ("board",)
+
+    def __init__(self, board: Optional[Any] = None):
+        self.board = board
+
+    @classmethod
+    def of(cls, board: Any) -> "BoardRef":
+        """Return board if it is already a BoardRef, otherwise wrap it"""
+        return board if isinstance(board, cls) else cls(board)
+
+
+class SharedBoard:
+    """Descriptor exposing ``self._board_ref.board`` as ``self.board``
+
+    Handlers built from the same BoardRef see a board loaded by any of them
+    without the interface having to push it to each one.
+    """
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj._board_ref.board
+
+    def __set__(self, obj, value) -> None:
+        obj._board_ref.board = value
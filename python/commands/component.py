@@ -9,6 +9,7 @@ import math
 from typing import Dict, Any, Optional, List, Tuple
 import base64
 from commands.library import LibraryManager
+from commands.board_ref import BoardRef, SharedBoard
 
 logger = logging.getLogger("kicad_interface")
 
@@ -16,13 +17,15 @@ logger = logging.getLogger("kicad_interface")
 class ComponentCommands:
     """Handles component-related KiCAD operations"""
 
+    board = SharedBoard()
+
     def __init__(
         self,
         board: Optional[pcbnew.BOARD] = None,
         library_manager: Optional[LibraryManager] = None,
     ):
         """Initialize with optional board instance and library manager"""
-        self.board = board
+        self._board_ref = BoardRef.of(board)
         self.library_manager = library_manager or LibraryManager()
 
     def place_component(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -145,8 +145,7 @@ class ComponentManager:
 
         except Exception as e:
             logger.error(f"Dynamic loading failed: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
             # Fall back to static template if available
             fallback = cls.TEMPLATE_MAP.get(comp_type, '_TEMPLATE_R')
             return (fallback, False)
@@ -3,7 +3,7 @@ import os
 import logging
 import math
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -283,9 +283,7 @@ class ConnectionManager:
 
         except Exception as e:
             ConnectionManager._set_error(f"Error adding connection: {e}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
             return False
 
     @staticmethod
@@ -400,9 +398,7 @@ class ConnectionManager:
 
         except Exception as e:
             ConnectionManager._set_error(f"Error connecting to net: {e}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
             return False
 
     @staticmethod
@@ -421,9 +417,35 @@ class ConnectionManager:
             List of connections: [{"component": ref, "pin": pin_name}, ...]
         """
         try:
-            from commands.pin_locator import PinLocator
+            connections = ConnectionManager.get_net_index(
+                schematic, schematic_path, net_names={net_name}
+            ).get(net_name, [])
+        except Exception:
+            return []
+        logger.info(f"Found {len(connections)} connections for net '{net_name}'")
+        return connections
+
+    @staticmethod
+    def get_net_index(
+        schematic: Schematic,
+        schematic_path: Optional[Path] = None,
+        net_names: Optional[Set[str]] = None,
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Get the connections of every labelled net in one pass over the
+        schematic's labels, wires and symbols
 
-            connections = []
+        Args:
+            schematic: Schematic object
+            schematic_path: Optional path to schematic file (enables accurate pin matching)
+            net_names: Optional set of net names to restrict the index to
+
+        Returns:
+            Dict mapping each net name to its connections:
+            {"VCC": [{"component": ref, "pin": pin_name}, ...], ...}
+        """
+        try:
+            index: Dict[str, List[Dict[str, str]]] = {}
             tolerance = 0.5  # 0.5mm tolerance for point coincidence (grid spacing consideration)
 
             def points_coincide(p1, p2):
@@ -434,32 +456,59 @@ class ConnectionManager:
                 dy = abs(p1[1] - p2[1])
                 return dx < tolerance and dy < tolerance
 
-            # 1. Find all labels with this net name
+            def grid_cell(point):
+                return (
+                    math.floor(point[0] / tolerance),
+                    math.floor(point[1] / tolerance),
+                )
+
+            def build_point_index(entries):
+                """Bucket (point, net) pairs on a tolerance-sized grid for hashed lookups"""
+                point_index = {}
+                for point, net in entries:
+                    point_index.setdefault(grid_cell(point), []).append((point, net))
+                return point_index
+
+            def nets_at(point_index, point):
+                """Nets of the indexed points coinciding with point (neighbouring cells only)"""
+                cx, cy = grid_cell(point)
+                nets = set()
+                for dx in (-1, 0, 1):
+                    for dy in (-1, 0, 1):
+                        for other, net in point_index.get((cx + dx, cy + dy), ()):
+                            if points_coincide(point, other):
+                                nets.add(net)
+                return nets
+
+            # 1. Find all net labels
             if not hasattr(schematic, "label"):
                 logger.warning("Schematic has no labels")
-                return connections
+                return index
 
-            net_label_positions = []
+            label_points = []
             for label in schematic.label:
-                if hasattr(label, "value") and label.value == net_name:
-                    if hasattr(label, "at") and hasattr(label.at, "value"):
-                        pos = label.at.value
-                        net_label_positions.append([float(pos[0]), float(pos[1])])
+                if not hasattr(label, "value"):
+                    continue
+                if net_names is not None and label.value not in net_names:
+                    continue
+                if hasattr(label, "at") and hasattr(label.at, "value"):
+                    pos = label.at.value
+                    label_points.append(([float(pos[0]), float(pos[1])], label.value))
+                    index.setdefault(label.value, [])
 
-            if not net_label_positions:
-                logger.info(f"No labels found for net '{net_name}'")
-                return connections
+            if not label_points:
+                logger.info("No matching net labels found")
+                return index
 
-            logger.debug(
-                f"Found {len(net_label_positions)} labels for net '{net_name}'"
-            )
+            logger.debug(f"Found {len(label_points)} labels for {len(index)} nets")
 
-            # 2. Find all wires connected to these label positions
+            # 2. Find the wires touching each net's labels
             if not hasattr(schematic, "wire"):
                 logger.warning("Schematic has no wires")
-                return connections
+                return index
 
-            connected_wire_points = set()
+            label_index = build_point_index(label_points)
+            net_wire_points: Dict[str, set] = {}
             for wire in schematic.wire:
                 if hasattr(wire, "pts") and hasattr(wire.pts, "xy"):
                     # Get all points in this wire (polyline)
@@ -467,41 +516,46 @@ class ConnectionManager:
                     for point in wire.pts.xy:
                         if hasattr(point, "value"):
                             wire_points.append(
-                                [float(point.value[0]), float(point.value[1])]
+                                (float(point.value[0]), float(point.value[1]))
                             )
 
-                    # Check if any wire point touches a label
-                    wire_connected = False
+                    # A wire belongs to every net whose label it touches
+                    wire_nets = set()
                     for wire_pt in wire_points:
-                        for label_pt in net_label_positions:
-                            if points_coincide(wire_pt, label_pt):
-                                wire_connected = True
-                                break
-                        if wire_connected:
-                            break
-
-                    # If this wire is connected to the net, add all its points
-                    if wire_connected:
-                        for pt in wire_points:
-                            connected_wire_points.add((pt[0], pt[1]))
-
-            if not connected_wire_points:
-                logger.debug(f"No wires connected to net '{net_name}' labels")
-                return connections
-
-            logger.debug(
-                f"Found {len(connected_wire_points)} wire connection points for net '{net_name}'"
-            )
+                        wire_nets |= nets_at(label_index, wire_pt)
+                    for net in wire_nets:
+                        net_wire_points.setdefault(net, set()).update(wire_points)
+
+            if not net_wire_points:
+                logger.debug("No wires connected to net labels")
+                return index
 
-            # 3. Find component pins at wire endpoints
+            # 3. Find component pins at wire points
             if not hasattr(schematic, "symbol"):
                 logger.warning("Schematic has no symbols")
-                return connections
+                return index
 
-            # Create pin locator for accurate pin matching (if schematic_path available)
+            wire_index = build_point_index(
+                (point, net)
+                for net, points in net_wire_points.items()
+                for point in points
+            )
+
+            # Use the shared pin locator for accurate pin matching (if
+            # schematic_path available) so its parse and pin caches carry over
             locator = None
             if schematic_path and WIRE_MANAGER_AVAILABLE:
-                locator = PinLocator()
+                locator = ConnectionManager.get_pin_locator()
+
+            # Multi-unit symbols repeat their reference, so keep each
+            # (component, pin) pair once per net
+            seen = set()
+
+            def add_connection(net, ref, pin):
+                key = (net, ref, pin)
+                if key not in seen:
+                    seen.add(key)
+                    index[net].append({"component": ref, "pin": pin})
 
             for symbol in schematic.symbol:
                 # Skip template symbols
@@ -525,27 +579,19 @@ class ConnectionManager:
                         if not pins:
                             continue
 
-                        # Check each pin
-                        for pin_num, pin_data in pins.items():
-                            # Get pin location
+                        # Check each pin against the wire points of every net
+                        for pin_num in pins:
                             pin_loc = locator.get_pin_location(
                                 schematic_path, ref, pin_num
                             )
                             if not pin_loc:
                                 continue
 
-                            # Check if pin coincides with any wire point
-                            for wire_pt in connected_wire_points:
-                                if points_coincide(pin_loc, list(wire_pt)):
-                                    connections.append(
-                                        {"component": ref, "pin": pin_num}
-                                    )
-                                    break  # Pin found, no need to check more wire points
+                            for net in nets_at(wire_index, pin_loc):
+                                add_connection(net, ref, pin_num)
 
                     except Exception as e:
                         logger.warning(f"Error matching pins for {ref}: {e}")
-                        # Fall back to proximity matching
-                        pass
 
                 # Fallback: proximity-based matching if no PinLocator
                 if not locator or not schematic_path:
@@ -556,24 +602,25 @@ class ConnectionManager:
                     symbol_x = float(symbol_pos[0])
                     symbol_y = float(symbol_pos[1])
 
-                    # Check if symbol is near any wire point (within 10mm)
-                    for wire_pt in connected_wire_points:
-                        dist = (
-                            (symbol_x - wire_pt[0]) ** 2 + (symbol_y - wire_pt[1]) ** 2
-                        ) ** 0.5
-                        if dist < 10.0:  # 10mm proximity threshold
-                            connections.append({"component": ref, "pin": "unknown"})
-                            break  # Only add once per component
+                    # Check if symbol is near any of a net's wire points (within 10mm)
+                    for net, points in net_wire_points.items():
+                        for wire_pt in points:
+                            dist = (
+                                (symbol_x - wire_pt[0]) ** 2
+                                + (symbol_y - wire_pt[1]) ** 2
+                            ) ** 0.5
+                            if dist < 10.0:  # 10mm proximity threshold
+                                add_connection(net, ref, "unknown")
+                                break  # Only add once per component
 
-            logger.info(f"Found {len(connections)} connections for net '{net_name}'")
-            return connections
+            return index
 
         except Exception as e:
+            # Raised rather than returned as {} so callers never cache a
+            # failed scan as a schematic without nets
             logger.error(f"Error getting net connections: {e}")
-            import traceback
-
-            logger.error(traceback.format_exc())
-            return []
+            logger.debug("Traceback:", exc_info=True)
+            raise
 
     @staticmethod
     def generate_netlist(
@@ -632,11 +679,12 @@ class ConnectionManager:
                     if hasattr(label, "value"):
                         net_names.add(label.value)
 
-                # For each net, get connections
+                # Resolve every net's connections in one pass
+                net_index = ConnectionManager.get_net_index(
+                    schematic, schematic_path=schematic_path
+                )
                 for net_name in net_names:
-                    connections = ConnectionManager.get_net_connections(
-                        schematic, net_name, schematic_path=schematic_path
-                    )
+                    connections = net_index.get(net_name, [])
                     if connections:
                         netlist["nets"].append(
                             {"name": net_name, "connections": connections}
@@ -7,6 +7,7 @@ import pcbnew
 import logging
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Tuple
+from commands.board_ref import BoardRef, SharedBoard
 
 logger = logging.getLogger("kicad_interface")
 
@@ -14,9 +15,11 @@ logger = logging.getLogger("kicad_interface")
 class DesignRuleCommands:
     """Handles design rule checking and configuration"""
 
+    board = SharedBoard()
+
     def __init__(self, board: Optional[pcbnew.BOARD] = None):
         """Initialize with optional board instance"""
-        self.board = board
+        self._board_ref = BoardRef.of(board)
 
     def _get_drc_history_file(self, board_file: str) -> str:
         """Get path to persistent DRC history JSON file for a board."""
@@ -11,6 +11,7 @@ import os
 import re
 import uuid
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -29,8 +30,44 @@ class DynamicSymbolLoader:
     - Parent symbols must appear BEFORE child symbols that use (extends ...)
     """
 
+    # Schematic texts kept in memory, least recently used dropped first
+    SCHEMATIC_CACHE_SIZE = 8
+
     def __init__(self):
         self.symbol_cache = {}  # Cache: "lib:symbol" -> raw text block
+        # Cache: absolute schematic path -> ((mtime_ns, size), file text)
+        self.schematic_cache = OrderedDict()
+
+    def _remember_schematic(self, key: str, signature: tuple, content: str) -> None:
+        """Cache a schematic's text, evicting beyond SCHEMATIC_CACHE_SIZE"""
+        self.schematic_cache[key] = (signature, content)
+        self.schematic_cache.move_to_end(key)
+        while len(self.schematic_cache) > self.SCHEMATIC_CACHE_SIZE:
+            self.schematic_cache.popitem(last=False)
+
+    def _read_schematic(self, schematic_path: Path) -> str:
+        """Read a schematic, reusing the cached text while the file is unchanged"""
+        key = os.path.abspath(schematic_path)
+        stat = os.stat(key)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self.schematic_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            self.schematic_cache.move_to_end(key)
+            return cached[1]
+
+        with open(key, "r", encoding="utf-8") as f:
+            content = f.read()
+        self._remember_schematic(key, signature, content)
+        return content
+
+    def _write_schematic(self, schematic_path: Path, content: str) -> None:
+        """Write a schematic and remember the written text"""
+        key = os.path.abspath(schematic_path)
+        with open(key, "w", encoding="utf-8") as f:
+            f.write(content)
+        stat = os.stat(key)
+        self._remember_schematic(key, (stat.st_mtime_ns, stat.st_size), content)
 
     def find_kicad_symbol_libraries(self) -> List[Path]:
         """Find all KiCad symbol library directories"""
@@ -168,15 +205,28 @@ class DynamicSymbolLoader:
         Inject a symbol definition into a schematic's lib_symbols section.
         Uses text manipulation to preserve file formatting.
         """
-        full_name = f"{library_name}:{symbol_name}"
+        content = self._read_schematic(schematic_path)
+        updated = self._inject_symbol_text(content, library_name, symbol_name)
+        if updated is not content:
+            self._write_schematic(schematic_path, updated)
+            logger.info(
+                f"Injected symbol {library_name}:{symbol_name} into {schematic_path.name}"
+            )
+        return True
 
-        with open(schematic_path, "r", encoding="utf-8") as f:
-            content = f.read()
+    def _inject_symbol_text(
+        self, content: str, library_name: str, symbol_name: str
+    ) -> str:
+        """
+        Return the schematic text with the symbol definition in lib_symbols.
+        The same string is returned if the definition is already present.
+        """
+        full_name = f"{library_name}:{symbol_name}"
 
         # Check if symbol already exists
         if f'(symbol "{full_name}"' in content:
             logger.info(f"Symbol {full_name} already exists in schematic")
-            return True
+            return content
 
         # Extract symbol from library
         symbol_block = self.extract_symbol_from_library(library_name, symbol_name)
@@ -225,12 +275,7 @@ class DynamicSymbolLoader:
 
         # Insert the symbol block just before the closing ) of lib_symbols
         lines.insert(lib_sym_end, indented_block)
-
-        with open(schematic_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
-
-        logger.info(f"Injected symbol {full_name} into {schematic_path.name}")
-        return True
+        return "\n".join(lines)
 
     def create_component_instance(
         self,
@@ -246,18 +291,36 @@ class DynamicSymbolLoader:
         Add a component instance to the schematic.
         This creates the (symbol ...) block with lib_id reference.
         """
+        content = self._read_schematic(schematic_path)
+        updated = self._instance_text(
+            content, library_name, symbol_name, reference, value, x, y
+        )
+        if updated is not content:
+            self._write_schematic(schematic_path, updated)
+        return True
+
+    def _instance_text(
+        self,
+        content: str,
+        library_name: str,
+        symbol_name: str,
+        reference: str,
+        value: str = "",
+        x: float = 0,
+        y: float = 0,
+    ) -> str:
+        """
+        Return the schematic text with a new component instance inserted.
+        The same string is returned if the reference already exists.
+        """
         full_lib_id = f"{library_name}:{symbol_name}"
         new_uuid = str(uuid.uuid4())
 
-        with open(schematic_path, "r", encoding="utf-8") as f:
-            existing_content = f.read()
-
-        existing_ref_pattern = re.escape(f'(property "Reference" "{reference}"')
-        if re.search(existing_ref_pattern, existing_content):
+        if f'(property "Reference" "{reference}"' in content:
             logger.info(
                 f"Reference {reference} already exists in schematic, skipping duplicate insert"
             )
-            return True
+            return content
 
         instance_block = f'''  (symbol (lib_id "{full_lib_id}") (at {x} {y} 0) (unit 1)
     (in_bom yes) (on_board yes) (dnp no)
@@ -276,8 +339,6 @@ class DynamicSymbolLoader:
     )
   )'''
 
-        content = existing_content
-
         # Insert before (sheet_instances or at end before final )
         lines = content.split("\n")
         insert_pos = None
@@ -299,13 +360,10 @@ class DynamicSymbolLoader:
 
         lines.insert(insert_pos, instance_block)
 
-        with open(schematic_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
-
         logger.info(
             f"Added component instance {reference} ({full_lib_id}) at ({x}, {y})"
         )
-        return True
+        return "\n".join(lines)
 
     def load_symbol_dynamically(
         self, schematic_path: Path, library_name: str, symbol_name: str
@@ -324,10 +382,8 @@ class DynamicSymbolLoader:
         sym_clean = symbol_name.replace("-", "_").replace(".", "_")
         template_ref = f"_TEMPLATE_{lib_clean}_{sym_clean}"
 
-        with open(schematic_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        template_ref_pattern = re.escape(f'(property "Reference" "{template_ref}"')
-        if re.search(template_ref_pattern, content):
+        content = self._read_schematic(schematic_path)
+        if f'(property "Reference" "{template_ref}"' in content:
             logger.info(f"Template {template_ref} already present in schematic")
             return template_ref
 
@@ -372,6 +428,38 @@ class DynamicSymbolLoader:
             y=y,
         )
 
+    def add_components(self, schematic_path: Path, components: List[Dict]) -> int:
+        """
+        Add several components with a single read and a single write.
+
+        Each entry holds the add_component arguments: library_name,
+        symbol_name, reference and optionally value, x and y. Nothing is
+        written if any entry fails.
+
+        Returns:
+            Number of components processed
+        """
+        content = self._read_schematic(schematic_path)
+        original = content
+
+        for component in components:
+            content = self._inject_symbol_text(
+                content, component["library_name"], component["symbol_name"]
+            )
+            content = self._instance_text(
+                content,
+                component["library_name"],
+                component["symbol_name"],
+                reference=component["reference"],
+                value=component.get("value", ""),
+                x=component.get("x", 0),
+                y=component.get("y", 0),
+            )
+
+        if content is not original:
+            self._write_schematic(schematic_path, content)
+        return len(components)
+
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
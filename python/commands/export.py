@@ -5,12 +5,13 @@ Export command implementations for KiCAD interface
 import os
 import pcbnew
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Callable, Union
 import base64
 import csv
 import json
 
 from utils.kicad_cli import resolve_kicad_cli
+from commands.board_ref import BoardRef, SharedBoard
 
 logger = logging.getLogger("kicad_interface")
 
@@ -18,12 +19,39 @@ logger = logging.getLogger("kicad_interface")
 class ExportCommands:
     """Handles export-related KiCAD operations"""
 
-    def __init__(self, board: Optional[pcbnew.BOARD] = None, jlcpcb_parts_manager=None):
-        """Initialize with optional board instance"""
-        self.board = board
-        self.jlcpcb_parts_manager = jlcpcb_parts_manager
+    board = SharedBoard()
+
+    def __init__(
+        self,
+        board: Optional[pcbnew.BOARD] = None,
+        jlcpcb_parts_manager: Union[Any, Callable[[], Any], None] = None,
+    ):
+        """
+        Initialize with optional board instance
+
+        Args:
+            board: Board to export from
+            jlcpcb_parts_manager: JLCPCB parts manager, or a zero-argument
+                callable returning one. A callable is only invoked by the BOM
+                analysis, so the parts database stays closed for other exports.
+        """
+        self._board_ref = BoardRef.of(board)
+        self._jlcpcb_parts_manager = jlcpcb_parts_manager
         self._last_cli_resolution: Dict[str, Any] = {}
 
+    @property
+    def jlcpcb_parts_manager(self):
+        """JLCPCB parts manager, resolved from its provider on first use"""
+        manager = self._jlcpcb_parts_manager
+        if callable(manager):
+            manager = manager()
+            self._jlcpcb_parts_manager = manager
+        return manager
+
+    @jlcpcb_parts_manager.setter
+    def jlcpcb_parts_manager(self, manager) -> None:
+        self._jlcpcb_parts_manager = manager
+
     def export_gerber(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Export Gerber files"""
         try:
@@ -755,8 +783,7 @@ class ExportCommands:
                     }
                 )
 
-            stats = self.jlcpcb_parts_manager.get_database_stats()
-            if int(stats.get("total_parts", 0)) <= 0:
+            if not self.jlcpcb_parts_manager.has_parts():
                 return {
                     "success": False,
                     "message": "JLCPCB database is empty",
@@ -20,7 +20,7 @@ import string
 import base64
 import json
 import os
-from typing import Optional, Dict, List, Callable, Any
+from typing import Optional, Dict, List, Callable, Any, Iterator
 from pathlib import Path
 
 logger = logging.getLogger("kicad_interface")
@@ -180,7 +180,10 @@ class JLCPCBClient:
     def _get_cache_total_parts(cache_db_path: str) -> Optional[int]:
         if not os.path.exists(cache_db_path):
             return None
-        conn = sqlite3.connect(cache_db_path)
+        conn = sqlite3.connect(
+            f"{Path(cache_db_path).resolve().as_uri()}?mode=ro&immutable=1",
+            uri=True,
+        )
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         try:
@@ -592,8 +595,17 @@ class JLCPCBClient:
             int(os.getenv("JLCPCB_EXTRACT_THREADS", str(cpu_count))),
         )
 
+        # Only the SQLite snapshot is imported; the multi-volume zip cannot be
+        # opened in place, but nothing else in it needs to hit the disk
         extract = subprocess.run(
-            [seven_zip, "x", "-y", f"-mmt={extract_threads}", archive_path],
+            [
+                seven_zip,
+                "x",
+                "-y",
+                f"-mmt={extract_threads}",
+                archive_path,
+                "cache.sqlite3",
+            ],
             cwd=extraction_target_dir,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
@@ -782,19 +794,19 @@ class JLCPCBClient:
             logger.error(f"Failed to fetch parts page: {e}")
             raise Exception(f"JLCPCB API request failed: {e}")
 
-    def download_full_database(
+    def iter_parts_pages(
         self, callback: Optional[Callable[[int, int, str], None]] = None
-    ) -> List[Dict]:
+    ) -> Iterator[List[Dict]]:
         """
-        Download entire parts library from JLCPCB
+        Yield the JLCPCB parts library one API page at a time
 
         Args:
             callback: Optional progress callback function(current_page, total_parts, status_msg)
 
-        Returns:
-            List of all parts
+        Yields:
+            The parts of each page, in download order
         """
-        all_parts = []
+        downloaded = 0
         last_key = None
         page = 0
 
@@ -805,39 +817,52 @@ class JLCPCBClient:
 
             try:
                 data = self.fetch_parts_page(last_key)
+            except Exception as e:
+                logger.error(f"Error downloading parts at page {page}: {e}")
+                if downloaded > 0:
+                    logger.warning(f"Partial download available: {downloaded} parts")
+                    return
+                raise
 
-                parts = data.get("componentInfos", [])
-                all_parts.extend(parts)
+            parts = data.get("componentInfos", [])
+            downloaded += len(parts)
+            last_key = data.get("lastKey")
 
-                last_key = data.get("lastKey")
+            if callback:
+                callback(page, downloaded, f"Downloaded {downloaded} parts...")
+            else:
+                logger.info(f"Page {page}: Downloaded {downloaded} parts so far...")
 
-                if callback:
-                    callback(
-                        page, len(all_parts), f"Downloaded {len(all_parts)} parts..."
-                    )
-                else:
-                    logger.info(
-                        f"Page {page}: Downloaded {len(all_parts)} parts so far..."
-                    )
+            if parts:
+                yield parts
 
-                # Check if there are more pages
-                if not last_key or len(parts) == 0:
-                    break
+            # Check if there are more pages
+            if not last_key or len(parts) == 0:
+                break
 
-                # Rate limiting - be nice to the API
-                time.sleep(0.5)
+            # Rate limiting - be nice to the API
+            time.sleep(0.5)
 
-            except Exception as e:
-                logger.error(f"Error downloading parts at page {page}: {e}")
-                if len(all_parts) > 0:
-                    logger.warning(
-                        f"Partial download available: {len(all_parts)} parts"
-                    )
-                    return all_parts
-                else:
-                    raise
+        logger.info(f"Download complete: {downloaded} parts retrieved")
+
+    def download_full_database(
+        self, callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> List[Dict]:
+        """
+        Download entire parts library from JLCPCB
+
+        Prefer iter_parts_pages() for imports, which never holds the whole
+        catalog in memory.
 
-        logger.info(f"Download complete: {len(all_parts)} parts retrieved")
+        Args:
+            callback: Optional progress callback function(current_page, total_parts, status_msg)
+
+        Returns:
+            List of all parts
+        """
+        all_parts = []
+        for parts in self.iter_parts_pages(callback):
+            all_parts.extend(parts)
         return all_parts
 
     def get_part_by_lcsc(self, lcsc_number: str) -> Optional[Dict]:
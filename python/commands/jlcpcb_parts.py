@@ -6,18 +6,68 @@ and component selection.
 """
 
 import os
+import re
 import sqlite3
 import json
+import functools
+import threading
+from contextlib import contextmanager
+from collections import namedtuple
 import logging
 import platform
 import subprocess
 import ctypes
 from pathlib import Path
-from typing import List, Dict, Optional, cast, Any
+from typing import List, Dict, Iterable, Optional, cast, Any
 from datetime import datetime
 
 logger = logging.getLogger("kicad_interface")
 
+# A query that is just an LCSC number is answered by primary key
+_LCSC_NUMBER = re.compile(r"C\d+")
+
+# Lightweight row type for list-style searches; callers convert with
+# ``_asdict()`` at the MCP boundary. first_price (the unit price of the
+# first price break) is None unless requested.
+Part = namedtuple(
+    "Part",
+    [
+        "lcsc",
+        "mfr_part",
+        "manufacturer",
+        "description",
+        "package",
+        "category",
+        "subcategory",
+        "library_type",
+        "stock",
+        "first_price",
+    ],
+    defaults=(None,),
+)
+
+
+def _tracks_import(method):
+    """
+    Mark an importer as running while it executes
+
+    Stats polled during an import count a partly written table, so they are
+    not cached then; the cached stats are dropped once the import has ended.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._stats_lock:
+            self._imports_running += 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            with self._stats_lock:
+                self._imports_running -= 1
+                self._clear_stats_cache()
+
+    return wrapper
+
 
 class JLCPCBPartsManager:
     """
@@ -26,6 +76,59 @@ class JLCPCBPartsManager:
     Provides fast parametric search, filtering, and package-to-footprint mapping.
     """
 
+    # Incremental imports touching at least this many rows merge the FTS
+    # b-trees afterwards; smaller updates rely on FTS5's automerge.
+    FTS_OPTIMIZE_THRESHOLD = 50000
+
+    # Incremental imports rewriting more than this fraction of the table
+    # drop the secondary indexes and rebuild them once at the end.
+    INDEX_REBUILD_FRACTION = 0.1
+
+    # Rows sampled per index by ANALYZE; enough for the planner to choose
+    # between the FTS join and the filter indexes without a full scan.
+    ANALYSIS_LIMIT = 1000
+
+    # Shared by every importer. Rows carry the first 13 columns; first_price,
+    # the unit price of the first price break, is derived from price_json
+    # by SQLite so list searches and ranking never decode it in Python.
+    UPSERT_COMPONENT_SQL = """
+        INSERT OR REPLACE INTO components (
+            lcsc, category, subcategory, mfr_part, package,
+            solder_joints, manufacturer, library_type, description,
+            datasheet, stock, price_json, last_updated, first_price
+        ) VALUES (
+            ?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12, ?13,
+            CASE WHEN json_valid(?12) THEN json_extract(?12, '$[0].price') END
+        )
+    """
+
+    # sqlite3 keeps this many prepared statements per connection. The
+    # search_parts() filter combinations alone produce 2**7 SQL strings,
+    # which would fill the default cache of 128 and evict each other.
+    CACHED_STATEMENTS = 256
+
+    # Read-heavy FTS/index lookups: WAL so searches are not blocked by an
+    # import, in-memory temp b-trees, and a 256 MiB mmap window. Also run
+    # after imports to undo their tuning.
+    CONNECTION_PRAGMAS = """
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA cache_size = -20000;
+        PRAGMA threads = 0;
+    """
+
+    # Lookups go through a second, query-only connection that maps a larger
+    # window of the file, so they read committed data without sharing the
+    # writer's transaction while a download is importing.
+    READ_PRAGMAS = """
+        PRAGMA query_only = 1;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA mmap_size = 1073741824;
+        PRAGMA cache_size = -65536;
+    """
+
     def __init__(self, db_path: Optional[str] = None):
         """
         Initialize parts database manager
@@ -42,12 +145,23 @@ class JLCPCBPartsManager:
 
         self.db_path = db_path
         self.conn: sqlite3.Connection = cast(sqlite3.Connection, None)
+        self.read_conn: sqlite3.Connection = cast(sqlite3.Connection, None)
+        self._read_lock = threading.Lock()
+        self._meta_cache: Dict[str, Optional[str]] = {}
+        # Guards the stats cache against imports running on another thread
+        self._stats_lock = threading.Lock()
+        self._imports_running = 0
         self._init_database()
 
     def _init_database(self):
         """Initialize SQLite database with schema"""
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=self.CACHED_STATEMENTS,
+        )
         self.conn.row_factory = sqlite3.Row  # Return rows as dicts
+        self.conn.executescript(self.CONNECTION_PRAGMAS)
 
         cursor = self.conn.cursor()
 
@@ -66,9 +180,11 @@ class JLCPCBPartsManager:
                 datasheet TEXT,
                 stock INTEGER,
                 price_json TEXT,
-                last_updated INTEGER
+                last_updated INTEGER,
+                first_price REAL
             )
         """)
+        self._migrate_first_price(cursor)
 
         self._create_component_indexes(cursor)
 
@@ -92,7 +208,24 @@ class JLCPCBPartsManager:
             """
         )
 
+        # Databases imported before planner statistics were kept
+        has_stats = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        has_rows = cursor.execute("SELECT 1 FROM components LIMIT 1").fetchone()
+        if not has_stats and has_rows:
+            self._analyze_components(cursor)
+
         self.conn.commit()
+
+        self.read_conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=self.CACHED_STATEMENTS,
+        )
+        self.read_conn.row_factory = sqlite3.Row
+        self.read_conn.executescript(self.READ_PRAGMAS)
+
         logger.info(f"Initialized JLCPCB parts database at {self.db_path}")
 
     @staticmethod
@@ -219,18 +352,40 @@ class JLCPCBPartsManager:
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_manufacturer ON components(manufacturer)"
         )
+        # Covers get_database_stats(); superseded the plain library_type index
+        cursor.execute("DROP INDEX IF EXISTS idx_library_type")
         cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_library_type ON components(library_type)"
+            "CREATE INDEX IF NOT EXISTS idx_library_stock"
+            " ON components(library_type, stock)"
         )
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_mfr_part ON components(mfr_part)"
         )
 
+    def _migrate_first_price(self, cursor: sqlite3.Cursor) -> None:
+        """Add and fill first_price in databases created before it existed"""
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(components)")}
+        if "first_price" in columns:
+            return
+        logger.info("Adding first_price column to JLCPCB parts database")
+        cursor.execute("ALTER TABLE components ADD COLUMN first_price REAL")
+        cursor.execute(
+            "UPDATE components"
+            " SET first_price = json_extract(price_json, '$[0].price')"
+            " WHERE json_valid(price_json)"
+        )
+
+    def _analyze_components(self, cursor: sqlite3.Cursor) -> None:
+        """Refresh the statistics search_parts() query plans are chosen from"""
+        cursor.execute(f"PRAGMA analysis_limit = {self.ANALYSIS_LIMIT}")
+        cursor.execute("ANALYZE components")
+
     def _drop_component_indexes(self, cursor: sqlite3.Cursor) -> None:
         cursor.execute("DROP INDEX IF EXISTS idx_category")
         cursor.execute("DROP INDEX IF EXISTS idx_package")
         cursor.execute("DROP INDEX IF EXISTS idx_manufacturer")
         cursor.execute("DROP INDEX IF EXISTS idx_library_type")
+        cursor.execute("DROP INDEX IF EXISTS idx_library_stock")
         cursor.execute("DROP INDEX IF EXISTS idx_mfr_part")
 
     def get_metadata(self, key: str) -> Optional[str]:
@@ -246,18 +401,117 @@ class JLCPCBPartsManager:
             (key, value),
         )
         self.conn.commit()
+        self._meta_cache[key] = value
+
+    def cached_metadata(self, key: str) -> Optional[str]:
+        """get_metadata() for values read repeatedly, e.g. by polled estimates"""
+        if key not in self._meta_cache:
+            # Polls come from other threads than the importer; read committed
+            # data rather than the writer's open transaction
+            with self._reader() as cursor:
+                row = cursor.execute(
+                    "SELECT value FROM metadata WHERE key = ?", (key,)
+                ).fetchone()
+            self._meta_cache[key] = (
+                str(row["value"]) if row and row["value"] is not None else None
+            )
+        return self._meta_cache[key]
+
+    def _write_stats_metadata(self, sql: str, params: tuple = ()) -> None:
+        """
+        Write a stats cache entry on its own short-lived connection
+
+        Stats are cached from polling threads, and the writer connection may
+        hold an import's open transaction on the worker thread.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                conn.execute(sql, params)
+        finally:
+            conn.close()
+
+    def _store_cached_stat(self, key: str, value: str) -> None:
+        self._write_stats_metadata(
+            "INSERT OR REPLACE INTO metadata(key, value) VALUES(?, ?)", (key, value)
+        )
+        self._meta_cache[key] = value
+
+    @contextmanager
+    def _reader(self):
+        """Yield a cursor on the shared read connection, one thread at a time"""
+        with self._read_lock:
+            yield self.read_conn.cursor()
+
+    @contextmanager
+    def bulk_load(self, drop_indexes: bool = False):
+        """
+        Tune the connection for a large import, then restore it
+
+        Applies the cache/mmap/thread sizing of _auto_import_tuning() for the
+        duration of the block. With drop_indexes, the secondary indexes are
+        dropped first and rebuilt once at the end instead of being updated
+        row by row.
+        """
+        cursor = self.conn.cursor()
+        self.conn.commit()
+        self._apply_import_tuning(cursor, self._auto_import_tuning(None))
+        if drop_indexes:
+            self._drop_component_indexes(cursor)
+            self.conn.commit()
+        try:
+            yield
+        finally:
+            self.conn.commit()
+            if drop_indexes:
+                self._create_component_indexes(cursor)
+                self._analyze_components(cursor)
+                self.conn.commit()
+            self.conn.executescript(self.CONNECTION_PRAGMAS)
 
-    def import_parts(self, parts: List[Dict], progress_callback=None):
+    @staticmethod
+    def _apply_import_tuning(cursor: sqlite3.Cursor, tuning: Dict[str, int]) -> None:
+        cursor.execute(f"PRAGMA cache_size = {int(tuning['cacheSizeKb'])}")
+        cursor.execute(f"PRAGMA threads = {int(tuning['threads'])}")
+        cursor.execute(f"PRAGMA mmap_size = {int(tuning['mmapSizeBytes'])}")
+
+    @_tracks_import
+    def import_parts(
+        self,
+        parts: Iterable[Dict],
+        progress_callback=None,
+        total: Optional[int] = None,
+        batch_size: int = 10000,
+    ):
         """
         Import parts into database from JLCPCB API response
 
+        The import is a single transaction. If parts raises, e.g. because a
+        streamed download failed, everything written so far is rolled back
+        and the components table and its FTS index stay as they were.
+
         Args:
-            parts: List of part dicts from JLCPCB API
+            parts: Part dicts from JLCPCB API; may be a generator, in which
+                case rows are written as they arrive
             progress_callback: Optional callback(current, total, message)
+            total: Expected part count, if parts has no len()
+            batch_size: Rows written per executemany call
         """
+        try:
+            self._import_parts(parts, progress_callback, total, batch_size)
+        except BaseException:
+            self.conn.rollback()
+            raise
+
+    def _import_parts(self, parts, progress_callback, total, batch_size):
+        """Body of import_parts(), which rolls it back on failure"""
         cursor = self.conn.cursor()
         imported = 0
         skipped = 0
+        if total is None and hasattr(parts, "__len__"):
+            total = len(cast(List[Dict], parts))
+        insert_sql = self.UPSERT_COMPONENT_SQL
+        batch: List[tuple] = []
 
         for i, part in enumerate(parts):
             try:
@@ -267,14 +521,7 @@ class JLCPCBPartsManager:
                 # Determine library type
                 library_type = self._determine_library_type(part)
 
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO components (
-                        lcsc, category, subcategory, mfr_part, package,
-                        solder_joints, manufacturer, library_type, description,
-                        datasheet, stock, price_json, last_updated
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                batch.append(
                     (
                         part.get("componentCode"),  # lcsc
                         part.get("firstSortName"),  # category
@@ -289,25 +536,29 @@ class JLCPCBPartsManager:
                         part.get("stockCount", 0),  # stock
                         price_json,  # price_json
                         int(datetime.now().timestamp()),  # last_updated
-                    ),
+                    )
                 )
 
                 imported += 1
 
                 if progress_callback and (i + 1) % 1000 == 0:
-                    progress_callback(
-                        i + 1, len(parts), f"Imported {imported} parts..."
-                    )
+                    progress_callback(i + 1, total, f"Imported {imported} parts...")
 
             except Exception as e:
                 logger.error(f"Error importing part {part.get('componentCode')}: {e}")
                 skipped += 1
 
-        # Update FTS index
-        cursor.execute("""
-            INSERT INTO components_fts(components_fts, rowid, lcsc, description, mfr_part, manufacturer)
-            SELECT 'rebuild', rowid, lcsc, description, mfr_part, manufacturer FROM components
-        """)
+            if len(batch) >= batch_size:
+                cursor.executemany(insert_sql, batch)
+                batch.clear()
+
+        if batch:
+            cursor.executemany(insert_sql, batch)
+
+        # Rebuild the FTS index once; a 'rebuild' row per part re-indexes the
+        # whole table for every part imported
+        cursor.execute("INSERT INTO components_fts(components_fts) VALUES('rebuild')")
+        self._analyze_components(cursor)
 
         self.conn.commit()
         logger.info(f"Import complete: {imported} parts imported, {skipped} skipped")
@@ -326,6 +577,7 @@ class JLCPCBPartsManager:
         else:
             return "Extended"  # Default to Extended
 
+    @_tracks_import
     def import_jlcsearch_parts(self, parts: List[Dict], progress_callback=None):
         """
         Import parts into database from JLCSearch API response
@@ -372,13 +624,7 @@ class JLCPCBPartsManager:
                 description = part.get("description", " ".join(description_parts))
 
                 cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO components (
-                        lcsc, category, subcategory, mfr_part, package,
-                        solder_joints, manufacturer, library_type, description,
-                        datasheet, stock, price_json, last_updated
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                    self.UPSERT_COMPONENT_SQL,
                     (
                         lcsc,  # lcsc with C prefix
                         part.get("category", ""),  # category
@@ -412,10 +658,12 @@ class JLCPCBPartsManager:
             INSERT INTO components_fts(components_fts)
             VALUES('rebuild')
         """)
+        self._analyze_components(cursor)
 
         self.conn.commit()
         logger.info(f"Import complete: {imported} parts imported, {skipped} skipped")
 
+    @_tracks_import
     def import_yaqwsx_cache(
         self,
         cache_db_path: str,
@@ -423,7 +671,12 @@ class JLCPCBPartsManager:
         incremental_since: Optional[int] = None,
         progress_callback=None,
     ) -> Dict[str, Any]:
-        source = sqlite3.connect(cache_db_path)
+        # The extracted snapshot is never modified, so open it read-only and
+        # immutable: SQLite then skips locking and creates no journal files
+        source = sqlite3.connect(
+            f"{Path(cache_db_path).resolve().as_uri()}?mode=ro&immutable=1",
+            uri=True,
+        )
         source.row_factory = sqlite3.Row
         source_cursor = source.cursor()
         cursor = self.conn.cursor()
@@ -612,24 +865,30 @@ class JLCPCBPartsManager:
                 }
 
             imported = 0
-            batch = []
             now_ts = int(datetime.now().timestamp())
             tuning = self._auto_import_tuning(incremental_since)
             batch_size = int(tuning["batchSize"])
-            cpu_threads = int(tuning["threads"])
-            cache_size_kb = int(tuning["cacheSizeKb"])
-            mmap_size_bytes = int(tuning["mmapSizeBytes"])
-
-            cursor.execute("PRAGMA temp_store = MEMORY")
-            cursor.execute("PRAGMA synchronous = NORMAL")
-            cursor.execute(f"PRAGMA cache_size = {cache_size_kb}")
-            cursor.execute("PRAGMA journal_mode = WAL")
-            cursor.execute(f"PRAGMA threads = {cpu_threads}")
-            cursor.execute(f"PRAGMA mmap_size = {mmap_size_bytes}")
+
+            # The import can be re-run from the source archive, so skip fsyncs
+            # while it runs; CONNECTION_PRAGMAS are restored once it has finished.
+            cursor.execute("PRAGMA synchronous = OFF")
+            self._apply_import_tuning(cursor, tuning)
             cursor.execute("BEGIN IMMEDIATE")
 
-            if incremental_since is None:
+            rebuild_indexes = incremental_since is None
+            if not rebuild_indexes:
+                # MAX(rowid) is an index lookup, unlike COUNT(*); it can only
+                # overestimate the row count
+                existing_rows = cursor.execute(
+                    "SELECT MAX(rowid) FROM components"
+                ).fetchone()[0]
+                rebuild_indexes = (
+                    total > self.INDEX_REBUILD_FRACTION * (existing_rows or 0)
+                )
+            if rebuild_indexes:
                 self._drop_component_indexes(cursor)
+
+            if incremental_since is None:
                 cursor.execute("DELETE FROM components")
 
             if incremental_since is not None:
@@ -637,98 +896,104 @@ class JLCPCBPartsManager:
                     "CREATE TEMP TABLE IF NOT EXISTS updated_lcsc(lcsc TEXT PRIMARY KEY)"
                 )
 
-            for row in source_cursor.execute(select_sql):
-                lcsc_num = row["lcsc"]
+            def _write_batch(rows: List[tuple]) -> None:
+                if incremental_since is not None:
+                    lcsc_params = [
+                        (lcsc,) for lcsc in dict.fromkeys(item[0] for item in rows)
+                    ]
+                    # External-content FTS5 needs the *old* column values to
+                    # drop an entry, so issue 'delete' before REPLACE rewrites
+                    # the row. Rows already rewritten by an earlier batch are
+                    # not indexed yet and must be skipped.
+                    cursor.executemany(
+                        """
+                        INSERT INTO components_fts(components_fts, rowid, lcsc, description, mfr_part, manufacturer)
+                        SELECT 'delete', rowid, lcsc, description, mfr_part, manufacturer
+                        FROM components
+                        WHERE lcsc = ?
+                        AND lcsc NOT IN (SELECT lcsc FROM updated_lcsc)
+                        """,
+                        lcsc_params,
+                    )
+                    cursor.executemany(
+                        "INSERT OR IGNORE INTO updated_lcsc(lcsc) VALUES (?)",
+                        lcsc_params,
+                    )
+                cursor.executemany(self.UPSERT_COMPONENT_SQL, rows)
+
+            def _to_component(row: tuple) -> tuple:
+                (
+                    lcsc_num,
+                    category,
+                    subcategory,
+                    mfr,
+                    package,
+                    joints,
+                    manufacturer,
+                    basic,
+                    preferred,
+                    description,
+                    datasheet,
+                    stock,
+                    price_raw,
+                    last_update,
+                ) = row
                 lcsc = (
                     f"C{int(lcsc_num)}"
                     if isinstance(lcsc_num, int)
                     or (isinstance(lcsc_num, str) and lcsc_num.isdigit())
                     else str(lcsc_num)
                 )
-
-                basic = int(row["basic"] or 0)
-                preferred = int(row["preferred"] or 0)
                 library_type = (
-                    "Preferred" if preferred else ("Basic" if basic else "Extended")
+                    "Preferred"
+                    if int(preferred or 0)
+                    else ("Basic" if int(basic or 0) else "Extended")
                 )
-
-                price_raw = row["price"]
                 if isinstance(price_raw, str):
                     price_json = price_raw
                 else:
                     price_json = json.dumps(price_raw or [])
 
-                batch.append(
-                    (
-                        lcsc,
-                        row["category"] or "",
-                        row["subcategory"] or "",
-                        row["mfr"] or "",
-                        row["package"] or "",
-                        int(row["joints"] or 0),
-                        row["manufacturer"] or "",
-                        library_type,
-                        row["description"] or "",
-                        row["datasheet"] or "",
-                        int(row["stock"] or 0),
-                        price_json,
-                        int(row["last_update"] or now_ts),
-                    )
+                return (
+                    lcsc,
+                    category or "",
+                    subcategory or "",
+                    mfr or "",
+                    package or "",
+                    int(joints or 0),
+                    manufacturer or "",
+                    library_type,
+                    description or "",
+                    datasheet or "",
+                    int(stock or 0),
+                    price_json,
+                    int(last_update or now_ts),
                 )
 
-                if len(batch) >= batch_size:
-                    cursor.executemany(
-                        """
-                        INSERT OR REPLACE INTO components (
-                            lcsc, category, subcategory, mfr_part, package,
-                            solder_joints, manufacturer, library_type, description,
-                            datasheet, stock, price_json, last_updated
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        batch,
-                    )
-
-                    if incremental_since is not None:
-                        cursor.executemany(
-                            "INSERT OR IGNORE INTO updated_lcsc(lcsc) VALUES (?)",
-                            [(item[0],) for item in batch],
-                        )
-
-                    imported += len(batch)
-                    batch = []
-
-                    if progress_callback:
-                        progress_callback(
-                            imported, total, f"Imported {imported}/{total} parts"
-                        )
-
-            if batch:
-                cursor.executemany(
-                    """
-                    INSERT OR REPLACE INTO components (
-                        lcsc, category, subcategory, mfr_part, package,
-                        solder_joints, manufacturer, library_type, description,
-                        datasheet, stock, price_json, last_updated
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    batch,
-                )
-                if incremental_since is not None:
-                    cursor.executemany(
-                        "INSERT OR IGNORE INTO updated_lcsc(lcsc) VALUES (?)",
-                        [(item[0],) for item in batch],
+            # Plain tuples in fetchmany() chunks: no sqlite3.Row per part and
+            # one executemany() per batch
+            select_cursor = source.cursor()
+            select_cursor.row_factory = None
+            select_cursor.execute(select_sql)
+            while True:
+                rows = select_cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                _write_batch([_to_component(row) for row in rows])
+                imported += len(rows)
+
+                if progress_callback:
+                    progress_callback(
+                        imported, total, f"Imported {imported}/{total} parts"
                     )
-                imported += len(batch)
 
             if incremental_since is None:
                 cursor.execute(
                     "INSERT INTO components_fts(components_fts) VALUES('rebuild')"
                 )
-                self._create_component_indexes(cursor)
             else:
-                cursor.execute(
-                    "DELETE FROM components_fts WHERE lcsc IN (SELECT lcsc FROM updated_lcsc)"
-                )
+                # Stale entries were removed batch-by-batch before their rows
+                # were replaced; index the new rows in one pass.
                 cursor.execute(
                     """
                     INSERT INTO components_fts(rowid, lcsc, description, mfr_part, manufacturer)
@@ -738,6 +1003,14 @@ class JLCPCBPartsManager:
                     """
                 )
                 cursor.execute("DROP TABLE IF EXISTS updated_lcsc")
+                if imported >= self.FTS_OPTIMIZE_THRESHOLD:
+                    cursor.execute(
+                        "INSERT INTO components_fts(components_fts) VALUES('optimize')"
+                    )
+
+            if rebuild_indexes:
+                self._create_component_indexes(cursor)
+            self._analyze_components(cursor)
 
             self.conn.commit()
 
@@ -755,6 +1028,87 @@ class JLCPCBPartsManager:
             raise
         finally:
             source.close()
+            self.conn.executescript(self.CONNECTION_PRAGMAS)
+
+    # components_fts columns a query term may be restricted to (col:term)
+    FTS_COLUMNS = frozenset(("lcsc", "description", "mfr_part", "manufacturer"))
+
+    @classmethod
+    def _fts_match_query(cls, query: str) -> str:
+        """
+        Turn free text into a MATCH expression that cannot be a syntax error
+
+        Each whitespace-separated term is quoted, so punctuation such as
+        '10k,', '100nF/50V' or 'AND' is matched literally. A trailing '*'
+        keeps prefix matching and a 'column:' prefix naming an FTS column
+        keeps the column filter, e.g. 'mfr_part:74LV*'.
+        """
+        terms = []
+        for term in query.split():
+            column = None
+            head, sep, tail = term.partition(":")
+            if sep and head in cls.FTS_COLUMNS and tail:
+                column, term = head, tail
+            prefix = term.endswith("*")
+            term = term.rstrip("*")
+            if not term:
+                continue
+            quoted = '"' + term.replace('"', '""') + '"' + ("*" if prefix else "")
+            terms.append(f"{column}:{quoted}" if column else quoted)
+        return " ".join(terms)
+
+    @staticmethod
+    # Unbounded: the boolean flags allow at most 2**8 keys
+    @functools.lru_cache(maxsize=None)
+    def _build_search_sql(
+        has_query: bool,
+        has_category: bool,
+        has_package: bool,
+        has_library_type: bool,
+        has_manufacturer: bool,
+        in_stock: bool,
+        include_price: bool,
+        lcsc_lookup: bool = False,
+    ) -> str:
+        """Build the search_parts SQL for one filter combination"""
+        # Only columns that are returned to the caller are selected, and
+        # price_json never is, so there is no text left to keep undecoded
+        names = Part._fields if include_price else Part._fields[:-1]
+        columns = ", ".join(f"c.{name}" for name in names)
+
+        if lcsc_lookup:
+            sql_parts = [f"SELECT {columns} FROM components c WHERE c.lcsc = ?"]
+        elif has_query:
+            # Drive the search from FTS so results come back ranked by
+            # relevance and SQLite can stop once LIMIT rows are found.
+            sql_parts = [
+                f"SELECT {columns} FROM components_fts f "
+                "JOIN components c ON c.rowid = f.rowid "
+                "WHERE components_fts MATCH ?"
+            ]
+        else:
+            sql_parts = [f"SELECT {columns} FROM components c WHERE 1=1"]
+
+        if has_category:
+            sql_parts.append("AND c.category LIKE ?")
+
+        if has_package:
+            sql_parts.append("AND c.package LIKE ?")
+
+        if has_library_type:
+            sql_parts.append("AND c.library_type = ?")
+
+        if has_manufacturer:
+            sql_parts.append("AND c.manufacturer LIKE ?")
+
+        if in_stock:
+            sql_parts.append("AND c.stock > 0")
+
+        if has_query and not lcsc_lookup:
+            sql_parts.append("ORDER BY bm25(components_fts)")
+
+        sql_parts.append("LIMIT ?")
+        return " ".join(sql_parts)
 
     def search_parts(
         self,
@@ -765,66 +1119,63 @@ class JLCPCBPartsManager:
         manufacturer: Optional[str] = None,
         in_stock: bool = True,
         limit: int = 20,
-    ) -> List[Dict]:
+        include_price: bool = False,
+    ) -> List[Part]:
         """
         Search for parts with filters
 
         Args:
-            query: Free-text search (searches description, mfr part, LCSC)
+            query: Free-text search (searches description, mfr part, LCSC);
+                supports 'term*' prefixes and 'mfr_part:term' column filters;
+                a bare LCSC number (e.g. "C25804") is looked up directly
             category: Filter by category name
             package: Filter by package type
             library_type: Filter by "Basic", "Extended", or "Preferred"
             manufacturer: Filter by manufacturer name
             in_stock: Only return parts with stock > 0
             limit: Maximum number of results
+            include_price: Also return first_price, without decoding price_json
+                in Python
 
         Returns:
-            List of matching parts
+            List of matching parts as Part tuples
         """
-        cursor = self.conn.cursor()
-
-        # Build query
-        sql_parts = ["SELECT * FROM components WHERE 1=1"]
-        params = []
-
+        lcsc_lookup = bool(query and _LCSC_NUMBER.fullmatch(query.strip().upper()))
+        if lcsc_lookup:
+            query = cast(str, query).strip().upper()
+        elif query:
+            query = self._fts_match_query(query)
+
+        # One SQL string per filter combination keeps sqlite3's statement
+        # cache hot instead of re-preparing a freshly built string each call.
+        sql = self._build_search_sql(
+            bool(query),
+            bool(category),
+            bool(package),
+            bool(library_type),
+            bool(manufacturer),
+            bool(in_stock),
+            bool(include_price),
+            lcsc_lookup,
+        )
+        params: List[Any] = []
         if query:
-            # Use FTS for text search
-            sql_parts.append("""
-                AND lcsc IN (
-                    SELECT lcsc FROM components_fts
-                    WHERE components_fts MATCH ?
-                )
-            """)
             params.append(query)
-
         if category:
-            sql_parts.append("AND category LIKE ?")
             params.append(f"%{category}%")
-
         if package:
-            sql_parts.append("AND package LIKE ?")
             params.append(f"%{package}%")
-
         if library_type:
-            sql_parts.append("AND library_type = ?")
             params.append(library_type)
-
         if manufacturer:
-            sql_parts.append("AND manufacturer LIKE ?")
             params.append(f"%{manufacturer}%")
-
-        if in_stock:
-            sql_parts.append("AND stock > 0")
-
-        sql_parts.append("LIMIT ?")
         params.append(limit)
 
-        sql = " ".join(sql_parts)
-
         try:
-            cursor.execute(sql, params)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            with self._reader() as cursor:
+                cursor.row_factory = None
+                cursor.execute(sql, params)
+                return [Part(*row) for row in cursor.fetchall()]
         except Exception as e:
             logger.error(f"Search error: {e}")
             return []
@@ -839,9 +1190,9 @@ class JLCPCBPartsManager:
         Returns:
             Part info dict or None if not found
         """
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM components WHERE lcsc = ?", (lcsc_number,))
-        row = cursor.fetchone()
+        with self._reader() as cursor:
+            cursor.execute("SELECT * FROM components WHERE lcsc = ?", (lcsc_number,))
+            row = cursor.fetchone()
 
         if row:
             part = dict(row)
@@ -856,23 +1207,22 @@ class JLCPCBPartsManager:
 
     def get_database_stats(self) -> Dict:
         """Get statistics about the database"""
-        cursor = self.conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) as total FROM components")
-        total = cursor.fetchone()["total"]
-
-        cursor.execute(
-            "SELECT COUNT(*) as basic FROM components WHERE library_type = 'Basic'"
-        )
-        basic = cursor.fetchone()["basic"]
-
-        cursor.execute(
-            "SELECT COUNT(*) as extended FROM components WHERE library_type = 'Extended'"
-        )
-        extended = cursor.fetchone()["extended"]
-
-        cursor.execute("SELECT COUNT(*) as in_stock FROM components WHERE stock > 0")
-        in_stock = cursor.fetchone()["in_stock"]
+        with self._reader() as cursor:
+            cursor.execute("""
+                SELECT
+                    COUNT(*) AS total,
+                    SUM(CASE WHEN library_type = 'Basic' THEN 1 ELSE 0 END) AS basic,
+                    SUM(CASE WHEN library_type = 'Extended' THEN 1 ELSE 0 END)
+                        AS extended,
+                    SUM(CASE WHEN stock > 0 THEN 1 ELSE 0 END) AS in_stock
+                FROM components
+            """)
+            row = cursor.fetchone()
+        # SUM() over an empty table is NULL, COUNT(*) is 0
+        total = row["total"]
+        basic = row["basic"] or 0
+        extended = row["extended"] or 0
+        in_stock = row["in_stock"] or 0
 
         return {
             "total_parts": total,
@@ -882,10 +1232,62 @@ class JLCPCBPartsManager:
             "db_path": self.db_path,
         }
 
+    def get_cached_database_stats(self) -> Dict:
+        """
+        get_database_stats(), remembered in metadata until the next import
+
+        Counting a full catalog takes seconds, so callers that only need the
+        stats of an unchanged database should use this. Repeated calls, e.g.
+        from polled status requests, are served from memory. While an import
+        runs the committed rows are counted and nothing is cached.
+        """
+        with self._stats_lock:
+            if self._imports_running:
+                return self.get_database_stats()
+
+            cached = self.cached_metadata("stats_cache_json")
+            if cached:
+                try:
+                    stats = json.loads(cached)
+                    stats["db_path"] = self.db_path
+                    return stats
+                except ValueError:
+                    pass
+
+            stats = self.get_database_stats()
+            self._store_cached_stat("stats_cache_json", json.dumps(stats))
+            return stats
+
+    def get_cached_db_size_mb(self) -> float:
+        """Database file size in MB, remembered like get_cached_database_stats()"""
+        with self._stats_lock:
+            if self._imports_running:
+                return round(os.path.getsize(self.db_path) / (1024 * 1024), 2)
+
+            cached = self.cached_metadata("stats_cache_db_size_mb")
+            if cached:
+                try:
+                    return float(cached)
+                except ValueError:
+                    pass
+
+            size_mb = round(os.path.getsize(self.db_path) / (1024 * 1024), 2)
+            self._store_cached_stat("stats_cache_db_size_mb", str(size_mb))
+            return size_mb
+
+    def _clear_stats_cache(self) -> None:
+        """Drop the cached stats; runs once an import has committed or failed"""
+        self._write_stats_metadata(
+            "DELETE FROM metadata"
+            " WHERE key IN ('stats_cache_json', 'stats_cache_db_size_mb')"
+        )
+        self._meta_cache.pop("stats_cache_json", None)
+        self._meta_cache.pop("stats_cache_db_size_mb", None)
+
     def has_parts(self) -> bool:
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT 1 FROM components LIMIT 1")
-        return cursor.fetchone() is not None
+        with self._reader() as cursor:
+            cursor.execute("SELECT 1 FROM components LIMIT 1")
+            return cursor.fetchone() is not None
 
     def map_package_to_footprint(self, package: str) -> List[str]:
         """
@@ -935,7 +1337,7 @@ class JLCPCBPartsManager:
 
         return []
 
-    def suggest_alternatives(self, lcsc_number: str, limit: int = 5) -> List[Dict]:
+    def suggest_alternatives(self, lcsc_number: str, limit: int = 5) -> List[Part]:
         """
         Find alternative parts similar to the given LCSC number
 
@@ -958,20 +1360,20 @@ class JLCPCBPartsManager:
             package=part["package"],
             in_stock=True,
             limit=limit * 3,
+            include_price=True,
         )
 
         # Filter out the original part
-        alternatives = [p for p in alternatives if p["lcsc"] != lcsc_number]
+        alternatives = [p for p in alternatives if p.lcsc != lcsc_number]
 
         # Sort by: Basic first, then by price, then by stock
         def sort_key(p):
-            is_basic = 1 if p.get("library_type") == "Basic" else 0
+            is_basic = 1 if p.library_type == "Basic" else 0
             try:
-                prices = json.loads(p.get("price_json", "[]"))
-                price = float(prices[0].get("price", 999)) if prices else 999
-            except:
+                price = float(p.first_price) if p.first_price is not None else 999
+            except (TypeError, ValueError):
                 price = 999
-            stock = p.get("stock", 0)
+            stock = p.stock or 0
 
             return (-is_basic, price, -stock)
 
@@ -980,8 +1382,14 @@ class JLCPCBPartsManager:
         return alternatives[:limit]
 
     def close(self):
-        """Close database connection"""
+        """Close database connections"""
+        if self.read_conn:
+            self.read_conn.close()
         if self.conn:
+            try:
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
             self.conn.close()
 
 
@@ -1005,5 +1413,5 @@ if __name__ == "__main__":
         results = manager.search_parts(query="10k resistor", limit=5)
         for part in results:
             print(
-                f"  {part['lcsc']}: {part['mfr_part']} - {part['description']} ({part['library_type']})"
+                f"  {part.lcsc}: {part.mfr_part} - {part.description} ({part.library_type})"
             )
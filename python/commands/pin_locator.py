@@ -7,6 +7,8 @@ Uses S-expression parsing to extract pin data from symbol definitions.
 
 import logging
 import math
+import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, List, Tuple, Optional, Dict
 import sexpdata
@@ -19,15 +21,51 @@ logger = logging.getLogger("kicad_interface")
 class PinLocator:
     """Locate pins on symbol instances in KiCad schematics"""
 
+    # Schematics kept in memory, least recently used dropped first
+    SCHEMATIC_CACHE_SIZE = 32
+
     def __init__(self):
         """Initialize pin locator with empty cache"""
         self.pin_definition_cache = {}  # Cache: "lib_id:symbol_name" -> pin_data
+        # Parsed schematics and resolved pins, reused while the file's
+        # (st_mtime_ns, st_size) is unchanged:
+        # path -> (signature, Schematic) and path -> (signature, {(ref, pin): info}),
+        # each keeping the SCHEMATIC_CACHE_SIZE most recently used paths
+        self.schematic_cache: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = (
+            OrderedDict()
+        )
+        self.pin_info_cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict]]" = (
+            OrderedDict()
+        )
         self.last_error: str = ""
 
     def _set_error(self, message: str) -> None:
         self.last_error = message
         logger.error(message)
 
+    def _cache_store(self, cache: OrderedDict, key: str, value: Any) -> None:
+        """Store value as the most recent entry, evicting the least recent"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.SCHEMATIC_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _file_signature(schematic_path: Path) -> Tuple[int, int]:
+        st = os.stat(schematic_path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def _load_schematic(self, schematic_path: Path, signature: Tuple[int, int]):
+        """Parse the schematic with kicad-skip, reusing the last parse if unchanged"""
+        key = str(schematic_path)
+        cached = self.schematic_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            self.schematic_cache.move_to_end(key)
+            return cached[1]
+        sch = Schematic(key)
+        self._cache_store(self.schematic_cache, key, (signature, sch))
+        return sch
+
     @staticmethod
     def _normalize_pin_identifier(pin_identifier: str) -> str:
         return str(pin_identifier).strip()
@@ -195,9 +233,7 @@ class PinLocator:
 
         except Exception as e:
             logger.error(f"Error getting symbol pins: {e}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
             return {}
 
     @staticmethod
@@ -241,8 +277,38 @@ class PinLocator:
         """
         try:
             self.last_error = ""
+            signature = self._file_signature(schematic_path)
+        except OSError as e:
+            self._set_error(f"Error getting pin location: {e}")
+            return None
+
+        # Connecting many pins of one schematic resolves the same pins
+        # repeatedly; any edit to the file changes the signature
+        key = str(schematic_path)
+        cached = self.pin_info_cache.get(key)
+        if cached is None or cached[0] != signature:
+            cached = (signature, {})
+        self._cache_store(self.pin_info_cache, key, cached)
+        pin_info = cached[1].get((symbol_reference, pin_number))
+        if pin_info is None:
+            pin_info = self._locate_pin(
+                schematic_path, signature, symbol_reference, pin_number
+            )
+            if pin_info is not None:
+                cached[1][(symbol_reference, pin_number)] = pin_info
+        return dict(pin_info) if pin_info is not None else None
+
+    def _locate_pin(
+        self,
+        schematic_path: Path,
+        signature: Tuple[int, int],
+        symbol_reference: str,
+        pin_number: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Resolve a pin's absolute location; see get_pin_info"""
+        try:
             # Load schematic with kicad-skip to get symbol instance
-            sch = Schematic(str(schematic_path))
+            sch = self._load_schematic(schematic_path, signature)
 
             # Find the symbol instance
             resolved_ref = self._resolve_symbol_reference(sch.symbol, symbol_reference)
@@ -336,9 +402,7 @@ class PinLocator:
 
         except Exception as e:
             self._set_error(f"Error getting pin location: {e}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
             return None
 
     def get_pin_location(
@@ -365,7 +429,9 @@ class PinLocator:
         """
         try:
             # Load schematic
-            sch = Schematic(str(schematic_path))
+            sch = self._load_schematic(
+                schematic_path, self._file_signature(schematic_path)
+            )
 
             # Find symbol
             target_symbol = None
@@ -7,15 +7,18 @@ import pcbnew  # type: ignore
 import logging
 import shutil
 from typing import Dict, Any, Optional
+from commands.board_ref import BoardRef, SharedBoard
 
 logger = logging.getLogger('kicad_interface')
 
 class ProjectCommands:
     """Handles project-related KiCAD operations"""
 
+    board = SharedBoard()
+
     def __init__(self, board: Optional[pcbnew.BOARD] = None):
         """Initialize with optional board instance"""
-        self.board = board
+        self._board_ref = BoardRef.of(board)
 
     def create_project(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new KiCAD project"""
@@ -7,6 +7,7 @@ import pcbnew
 import logging
 import math
 from typing import Dict, Any, Optional, List, Tuple
+from commands.board_ref import BoardRef, SharedBoard
 
 logger = logging.getLogger("kicad_interface")
 
@@ -14,9 +15,11 @@ logger = logging.getLogger("kicad_interface")
 class RoutingCommands:
     """Handles routing-related KiCAD operations"""
 
+    board = SharedBoard()
+
     def __init__(self, board: Optional[pcbnew.BOARD] = None):
         """Initialize with optional board instance"""
-        self.board = board
+        self._board_ref = BoardRef.of(board)
 
     def add_net(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Add a new net to the PCB"""
@@ -3,12 +3,18 @@ import os
 import shutil
 import logging
 import uuid
+from collections import OrderedDict
 
 logger = logging.getLogger('kicad_interface')
 
 class SchematicManager:
     """Core schematic operations using kicad-skip"""
 
+    # Parsed schematics for read-only callers, most recently used last:
+    # abspath -> ((st_mtime_ns, st_size), Schematic)
+    _schematic_cache = OrderedDict()
+    SCHEMATIC_CACHE_SIZE = 32
+
     @staticmethod
     def create_schematic(name, metadata=None):
         """Create a new empty schematic from template"""
@@ -63,12 +69,56 @@ class SchematicManager:
             logger.error(f"Error loading schematic from {file_path}: {e}")
             return None
 
+    @classmethod
+    def load_schematic_cached(cls, file_path):
+        """
+        Load a schematic for reading, reusing the parsed tree while the file
+        is unchanged on disk.
+
+        The returned object is shared between callers and must not be
+        modified; use load_schematic() to edit a schematic.
+        """
+        key = os.path.abspath(file_path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            cls._schematic_cache.pop(key, None)
+            logger.error(f"Schematic file not found at {file_path}")
+            return None
+
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = cls._schematic_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            cls._schematic_cache.move_to_end(key)
+            logger.debug(f"Using cached schematic for: {file_path}")
+            return cached[1]
+
+        sch = SchematicManager.load_schematic(file_path)
+        if sch is None:
+            cls._schematic_cache.pop(key, None)
+            return None
+
+        cls._schematic_cache[key] = (signature, sch)
+        cls._schematic_cache.move_to_end(key)
+        while len(cls._schematic_cache) > cls.SCHEMATIC_CACHE_SIZE:
+            cls._schematic_cache.popitem(last=False)
+        return sch
+
+    @classmethod
+    def invalidate_cache(cls, file_path=None):
+        """Drop the cached parse of file_path, or of every schematic"""
+        if file_path is None:
+            cls._schematic_cache.clear()
+        else:
+            cls._schematic_cache.pop(os.path.abspath(file_path), None)
+
     @staticmethod
     def save_schematic(schematic, file_path):
         """Save a schematic to file"""
         try:
             # kicad-skip uses write method, not save
             schematic.write(file_path)
+            SchematicManager.invalidate_cache(file_path)
             logger.info(f"Saved schematic to: {file_path}")
             return True
         except Exception as e:
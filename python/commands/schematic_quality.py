@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import math
 import re
@@ -12,6 +13,18 @@ from commands.connection_schematic import ConnectionManager
 
 logger = logging.getLogger("kicad_interface")
 
+_BUCKET_BY_FIRST_CHAR = {
+    "J": "connector",
+    "U": "ic",
+    "R": "passive",
+    "C": "passive",
+    "L": "passive",
+    "D": "passive",
+    "Q": "passive",
+    "Y": "passive",
+}
+_PASSIVE_TWO_CHAR_PREFIXES = ("SW", "FB")
+
 
 class SchematicQualityManager:
     @staticmethod
@@ -21,13 +34,14 @@ class SchematicQualityManager:
     @staticmethod
     def _component_bucket(reference: str) -> str:
         ref = reference.upper()
+        if not ref:
+            return "other"
+        bucket = _BUCKET_BY_FIRST_CHAR.get(ref[0])
+        if bucket is not None:
+            return bucket
         if ref.startswith("#PWR"):
             return "power"
-        if ref.startswith("J"):
-            return "connector"
-        if ref.startswith("U"):
-            return "ic"
-        if ref.startswith(("R", "C", "L", "D", "Q", "Y", "SW", "FB")):
+        if ref[:2] in _PASSIVE_TWO_CHAR_PREFIXES:
             return "passive"
         return "other"
 
@@ -53,15 +67,27 @@ class SchematicQualityManager:
             memberships[net_name] = members
         return memberships
 
+    @staticmethod
+    def _membership_digests(
+        membership: Dict[str, Set[Tuple[str, str]]],
+    ) -> Dict[str, int]:
+        digests: Dict[str, int] = {}
+        for net_name, members in membership.items():
+            if not members:
+                continue
+            canonical = "\n".join(f"{comp}\x00{pin}" for comp, pin in sorted(members))
+            digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=8).digest()
+            digests[net_name] = int.from_bytes(digest, "big")
+        return digests
+
     @staticmethod
     def _membership_equal(
-        before: Dict[str, Set[Tuple[str, str]]],
-        after: Dict[str, Set[Tuple[str, str]]],
+        before: Dict[str, int],
+        after: Dict[str, int],
     ) -> Tuple[bool, List[str]]:
         mismatches: List[str] = []
-        for net_name, before_members in before.items():
-            after_members = after.get(net_name, set())
-            if before_members != after_members:
+        for net_name in sorted(before.keys() | after.keys()):
+            if before.get(net_name) != after.get(net_name):
                 mismatches.append(net_name)
         return len(mismatches) == 0, mismatches
 
@@ -85,10 +111,7 @@ class SchematicQualityManager:
         return len(failures) == 0, failures
 
     @staticmethod
-    def _clear_connectivity_primitives(schematic_path: Path) -> Dict[str, int]:
-        content = schematic_path.read_text(encoding="utf-8")
-        data = sexpdata.loads(content)
-
+    def _strip_connectivity_primitives(data: List[Any]) -> Dict[str, int]:
         removable = {
             "wire",
             "junction",
@@ -110,7 +133,15 @@ class SchematicQualityManager:
                         continue
             kept.append(item)
 
-        schematic_path.write_text(sexpdata.dumps(kept), encoding="utf-8")
+        data[:] = kept
+        return counts
+
+    @staticmethod
+    def _clear_connectivity_primitives(schematic_path: Path) -> Dict[str, int]:
+        content = schematic_path.read_text(encoding="utf-8")
+        data = sexpdata.loads(content)
+        counts = SchematicQualityManager._strip_connectivity_primitives(data)
+        schematic_path.write_text(sexpdata.dumps(data), encoding="utf-8")
         return counts
 
     @staticmethod
@@ -136,7 +167,10 @@ class SchematicQualityManager:
         baseline_membership = SchematicQualityManager._extract_membership(
             baseline_netlist
         )
-        had_connectivity = any(len(v) > 0 for v in baseline_membership.values())
+        baseline_digests = SchematicQualityManager._membership_digests(
+            baseline_membership
+        )
+        had_connectivity = len(baseline_digests) > 0
 
         if had_connectivity and (not preserve_connectivity) and (not allow_unsafe):
             return {
@@ -205,12 +239,20 @@ class SchematicQualityManager:
                     }
                 )
 
+        rebuilding = preserve_connectivity and had_connectivity
+        cleared: Dict[str, int] = {}
+        # Strip wires/labels from the already-parsed tree so the layout is
+        # written once instead of written, re-read, re-parsed and re-written.
+        tree = getattr(sch, "tree", None)
+        cleared_in_memory = rebuilding and has_wires and isinstance(tree, list)
+        if cleared_in_memory:
+            cleared = SchematicQualityManager._strip_connectivity_primitives(tree)
+
         sch.write(str(schematic_path))
 
         rebuilt_count = 0
-        cleared: Dict[str, int] = {}
-        if preserve_connectivity and had_connectivity:
-            if has_wires:
+        if rebuilding:
+            if has_wires and not cleared_in_memory:
                 cleared = SchematicQualityManager._clear_connectivity_primitives(
                     schematic_path
                 )
@@ -229,18 +271,23 @@ class SchematicQualityManager:
                 }
 
             rebuilt_count = sum(len(v) for v in baseline_membership.values())
+            # Labels and pin-to-pin contacts connect by position, so moved
+            # symbols can change connectivity even without wires.
             after_sch = Schematic(str(schematic_path))
             after_netlist = ConnectionManager.generate_netlist(
                 after_sch,
                 schematic_path=schematic_path,
                 include_templates=False,
             )
-            after_membership = SchematicQualityManager._extract_membership(
-                after_netlist
+            after_digests = SchematicQualityManager._membership_digests(
+                SchematicQualityManager._extract_membership(after_netlist)
             )
-            membership_ok, mismatched_nets = SchematicQualityManager._membership_equal(
-                baseline_membership,
-                after_membership,
+            (
+                membership_ok,
+                mismatched_nets,
+            ) = SchematicQualityManager._membership_equal(
+                baseline_digests,
+                after_digests,
             )
             if not membership_ok:
                 schematic_path.write_text(original_text, encoding="utf-8")
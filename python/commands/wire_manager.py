@@ -84,8 +84,7 @@ class WireManager:
 
         except Exception as e:
             logger.error(f"Error adding wire: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
             return False
 
     @staticmethod
@@ -155,8 +154,7 @@ class WireManager:
 
         except Exception as e:
             logger.error(f"Error adding polyline wire: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
             return False
 
     @staticmethod
@@ -221,8 +219,7 @@ class WireManager:
 
         except Exception as e:
             logger.error(f"Error adding label: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
             return False
 
     @staticmethod
@@ -280,8 +277,7 @@ class WireManager:
 
         except Exception as e:
             logger.error(f"Error adding junction: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
             return False
 
     @staticmethod
@@ -336,8 +332,7 @@ class WireManager:
 
         except Exception as e:
             logger.error(f"Error adding no-connect: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
             return False
 
     @staticmethod
@@ -5,7 +5,7 @@ Defines the interface that all KiCAD backends must implement.
 """
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -238,6 +238,63 @@ class BoardAPI(ABC):
         """
         raise NotImplementedError()
 
+    def add_text(
+        self,
+        text: str,
+        x: float,
+        y: float,
+        layer: str = "F.SilkS",
+        size: float = 1.0,
+        rotation: float = 0
+    ) -> bool:
+        """
+        Add a text item to the board
+
+        Args:
+            text: Text to place
+            x: X position (mm)
+            y: Y position (mm)
+            layer: Layer name
+            size: Text size (mm)
+            rotation: Rotation angle (degrees)
+
+        Returns:
+            True if successful
+        """
+        raise NotImplementedError()
+
+    # Batch operations. Each entry is a tuple of the positional arguments
+    # of the single-item method; backends that can create many items in
+    # one round trip override these.
+    def add_tracks(self, tracks: List[Tuple]) -> Dict[str, Any]:
+        """
+        Add several tracks
+
+        Returns:
+            {"added": count, "failed_indices": [indices of failed entries]}
+        """
+        return self._add_each(self.add_track, tracks)
+
+    def add_vias(self, vias: List[Tuple]) -> Dict[str, Any]:
+        """Add several vias (see add_tracks)"""
+        return self._add_each(self.add_via, vias)
+
+    def add_texts(self, texts: List[Tuple]) -> Dict[str, Any]:
+        """Add several text items (see add_tracks)"""
+        return self._add_each(self.add_text, texts)
+
+    @staticmethod
+    def _add_each(add_one, specs: List[Tuple]) -> Dict[str, Any]:
+        failed = []
+        for index, spec in enumerate(specs):
+            try:
+                if not add_one(*spec):
+                    failed.append(index)
+            except Exception as e:
+                logger.warning(f"Batch entry {index} failed: {e}")
+                failed.append(index)
+        return {"added": len(specs) - len(failed), "failed_indices": failed}
+
     # Transaction support for undo/redo
     def begin_transaction(self, description: str = "MCP Operation") -> None:
         """Begin a transaction for grouping operations."""
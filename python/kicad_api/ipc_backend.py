@@ -13,10 +13,12 @@ Key Benefits over SWIG:
 - Stable API that won't break between versions
 - Multi-language support
 """
+import inspect
 import logging
 import os
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Tuple
 
 from kicad_api.base import (
     KiCADBackend,
@@ -274,11 +276,24 @@ class IPCBoardAPI(BoardAPI):
     Uses transactions for proper undo/redo support.
     """
 
+    # Seconds a footprint fetch is reused outside a transaction, so the
+    # lookups made while handling one request share a single round-trip
+    FOOTPRINT_CACHE_TTL = 0.1
+
+    # Seconds the enabled layer list is reused; layers only change on
+    # explicit user action, while clients may poll them often
+    LAYER_CACHE_TTL = 1.0
+
     def __init__(self, kicad_instance, notify_callback: Callable):
         self._kicad = kicad_instance
         self._board = None
         self._notify = notify_callback
         self._current_commit = None
+        self._footprint_cache = None
+        self._footprint_cache_time = 0.0
+        # (footprints list, component dicts) built by list_components
+        self._components_cache = None
+        self._layers_cache = None
 
     def _get_board(self):
         """Get board instance, connecting if needed."""
@@ -294,6 +309,7 @@ class IPCBoardAPI(BoardAPI):
         """Begin a transaction for grouping operations into a single undo step."""
         board = self._get_board()
         self._current_commit = board.begin_commit()
+        self._invalidate_footprints()
         logger.debug(f"Started transaction: {description}")
 
     def commit_transaction(self, description: str = "MCP Operation") -> None:
@@ -310,8 +326,90 @@ class IPCBoardAPI(BoardAPI):
             board = self._get_board()
             board.drop_commit(self._current_commit)
             self._current_commit = None
+            self._invalidate_footprints()
             logger.debug("Rolled back transaction")
 
+    def _begin_commit(self, board):
+        """
+        Begin a commit for a single edit.
+
+        Returns None while a transaction is open, so the edit becomes part of
+        the transaction's commit instead of getting its own.
+        """
+        if self._current_commit:
+            return None
+        return board.begin_commit()
+
+    def _push_commit(self, board, commit, description: str) -> None:
+        """Push a commit from _begin_commit (no-op inside a transaction)."""
+        if commit is not None:
+            board.push_commit(commit, description)
+
+    def create_items(self, items, description: str) -> None:
+        """
+        Create board items in one commit.
+
+        Inside a transaction the items join the transaction's commit instead.
+        If creation fails, the commit is dropped and the error re-raised.
+        """
+        board = self._get_board()
+        commit = self._begin_commit(board)
+        try:
+            board.create_items(items)
+        except Exception:
+            if commit is not None:
+                board.drop_commit(commit)
+            raise
+        self._push_commit(board, commit, description)
+
+    def _invalidate_footprints(self) -> None:
+        """Drop the cached footprints so the next lookup refetches them."""
+        self._footprint_cache = None
+
+    def _get_footprints(self):
+        """
+        Get the board footprints and a reference -> footprint index.
+
+        The fetch is reused for FOOTPRINT_CACHE_TTL seconds, or for as long
+        as a transaction is open, since only our own edits can change the
+        board then. Moves and deletions made here keep the cached footprints
+        and the index up to date; placements drop the cache.
+        """
+        now = time.monotonic()
+        if self._footprint_cache is not None and (
+            self._current_commit
+            or now - self._footprint_cache_time < self.FOOTPRINT_CACHE_TTL
+        ):
+            return self._footprint_cache
+
+        board = self._get_board()
+        return self._cache_footprints(list(board.get_footprints()))
+
+    def _cache_footprints(self, footprints):
+        """Store a fresh footprint fetch and index it by reference."""
+        by_ref = {}
+        for fp in footprints:
+            if fp.reference_field:
+                by_ref.setdefault(fp.reference_field.text.value, fp)
+
+        self._footprint_cache = (footprints, by_ref)
+        self._footprint_cache_time = time.monotonic()
+        return self._footprint_cache
+
+    def _forget_footprint(self, reference: str, target_fp) -> None:
+        """Remove a deleted footprint from the cache, keeping the rest of it."""
+        if self._footprint_cache is None:
+            return
+        footprints, by_ref = self._footprint_cache
+        footprints[:] = [fp for fp in footprints if fp is not target_fp]
+        self._components_cache = None
+        by_ref.pop(reference, None)
+        # Another footprint may share the reference
+        for fp in footprints:
+            if fp.reference_field and fp.reference_field.text.value == reference:
+                by_ref[reference] = fp
+                break
+
     def save(self) -> bool:
         """Save the board immediately."""
         try:
@@ -355,9 +453,9 @@ class IPCBoardAPI(BoardAPI):
             rect.width = from_mm(0.1)  # Standard edge cut width
 
             # Begin transaction for undo support
-            commit = board.begin_commit()
+            commit = self._begin_commit(board)
             board.create_items(rect)
-            board.push_commit(commit, f"Set board size to {width}x{height} {unit}")
+            self._push_commit(board, commit, f"Set board size to {width}x{height} {unit}")
 
             self._notify("board_size", {"width": width, "height": height, "unit": unit})
 
@@ -409,53 +507,89 @@ class IPCBoardAPI(BoardAPI):
     def add_layer(self, layer_name: str, layer_type: str) -> bool:
         """Add layer to the board (layers are typically predefined in KiCAD)."""
         logger.warning("Layer management via IPC is limited - layers are predefined")
+        self._invalidate_layers()
         return False
 
+    def _invalidate_layers(self) -> None:
+        """Drop the cached layer list so the next lookup refetches it."""
+        self._layers_cache = None
+
     def get_enabled_layers(self) -> List[str]:
-        """Get list of enabled layers."""
+        """Get list of enabled layers (cached for LAYER_CACHE_TTL seconds)."""
+        now = time.monotonic()
+        if self._layers_cache is not None:
+            fetched_at, layers = self._layers_cache
+            if now - fetched_at < self.LAYER_CACHE_TTL:
+                return list(layers)
+
         try:
             board = self._get_board()
-            layers = board.get_enabled_layers()
-            return [str(layer) for layer in layers]
+            layers = [str(layer) for layer in board.get_enabled_layers()]
+            self._layers_cache = (now, layers)
+            return list(layers)
         except Exception as e:
             logger.error(f"Failed to get enabled layers: {e}")
             return []
 
+    @staticmethod
+    def _component_info(fp) -> Dict[str, Any]:
+        """Describe a footprint as a component dict."""
+        from kipy.util.units import to_mm
+
+        pos = fp.position
+        return {
+            "reference": fp.reference_field.text.value if fp.reference_field else "",
+            "value": fp.value_field.text.value if fp.value_field else "",
+            "footprint": str(fp.definition.library_link) if fp.definition else "",
+            "position": {
+                "x": to_mm(pos.x) if pos else 0,
+                "y": to_mm(pos.y) if pos else 0,
+                "unit": "mm"
+            },
+            "rotation": fp.orientation.degrees if fp.orientation else 0,
+            "layer": str(fp.layer) if hasattr(fp, 'layer') else "F.Cu",
+            "id": str(fp.id) if hasattr(fp, 'id') else ""
+        }
+
+    @staticmethod
+    def _copy_component(component: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a memoized component dict so callers cannot edit the memo"""
+        return {**component, "position": dict(component["position"])}
+
     def list_components(self) -> List[Dict[str, Any]]:
         """List all components (footprints) on the board."""
         try:
-            from kipy.util.units import to_mm
-
-            board = self._get_board()
-            footprints = board.get_footprints()
+            footprints, _ = self._get_footprints()
+            cached = self._components_cache
+            if cached is not None and cached[0] is footprints:
+                return [self._copy_component(c) for c in cached[1]]
 
             components = []
             for fp in footprints:
                 try:
-                    pos = fp.position
-                    components.append({
-                        "reference": fp.reference_field.text.value if fp.reference_field else "",
-                        "value": fp.value_field.text.value if fp.value_field else "",
-                        "footprint": str(fp.definition.library_link) if fp.definition else "",
-                        "position": {
-                            "x": to_mm(pos.x) if pos else 0,
-                            "y": to_mm(pos.y) if pos else 0,
-                            "unit": "mm"
-                        },
-                        "rotation": fp.orientation.degrees if fp.orientation else 0,
-                        "layer": str(fp.layer) if hasattr(fp, 'layer') else "F.Cu",
-                        "id": str(fp.id) if hasattr(fp, 'id') else ""
-                    })
+                    components.append(self._component_info(fp))
                 except Exception as e:
                     logger.warning(f"Error processing footprint: {e}")
                     continue
 
-            return components
+            self._components_cache = (footprints, components)
+            return [self._copy_component(c) for c in components]
 
         except Exception as e:
             logger.error(f"Failed to list components: {e}")
             return []
 
+    def get_component(self, reference: str) -> Optional[Dict[str, Any]]:
+        """Get a single component by reference, or None if it is not on the board."""
+        try:
+            _, by_ref = self._get_footprints()
+            target_fp = by_ref.get(reference)
+            return self._component_info(target_fp) if target_fp else None
+
+        except Exception as e:
+            logger.error(f"Failed to get component {reference}: {e}")
+            return None
+
     def place_component(
         self,
         reference: str,
@@ -484,6 +618,7 @@ class IPCBoardAPI(BoardAPI):
             layer: Layer name ("F.Cu" for top, "B.Cu" for bottom)
             value: Component value (optional)
         """
+        self._invalidate_footprints()
         try:
             # First, try to load the footprint from library using pcbnew SWIG
             loaded_fp = self._load_footprint_from_library(footprint)
@@ -637,6 +772,7 @@ class IPCBoardAPI(BoardAPI):
                 board.revert()  # Reload from disk to sync IPC
             except Exception as e:
                 logger.debug(f"Could not refresh IPC board: {e}")
+            self._invalidate_layers()
 
             self._notify("component_placed", {
                 "reference": reference,
@@ -698,9 +834,9 @@ class IPCBoardAPI(BoardAPI):
                 fp.value_field.text.value = value if value else footprint
 
             # Begin transaction
-            commit = board.begin_commit()
+            commit = self._begin_commit(board)
             board.create_items(fp)
-            board.push_commit(commit, f"Placed component {reference}")
+            self._push_commit(board, commit, f"Placed component {reference}")
 
             self._notify("component_placed", {
                 "reference": reference,
@@ -726,14 +862,10 @@ class IPCBoardAPI(BoardAPI):
             from kipy.util.units import from_mm
 
             board = self._get_board()
-            footprints = board.get_footprints()
+            _, by_ref = self._get_footprints()
 
             # Find the footprint by reference
-            target_fp = None
-            for fp in footprints:
-                if fp.reference_field and fp.reference_field.text.value == reference:
-                    target_fp = fp
-                    break
+            target_fp = by_ref.get(reference)
 
             if not target_fp:
                 logger.error(f"Component not found: {reference}")
@@ -744,11 +876,12 @@ class IPCBoardAPI(BoardAPI):
 
             if rotation is not None:
                 target_fp.orientation = Angle.from_degrees(rotation)
+            self._components_cache = None
 
             # Apply changes
-            commit = board.begin_commit()
+            commit = self._begin_commit(board)
             board.update_items([target_fp])
-            board.push_commit(commit, f"Moved component {reference}")
+            self._push_commit(board, commit, f"Moved component {reference}")
 
             self._notify("component_moved", {
                 "reference": reference,
@@ -760,29 +893,66 @@ class IPCBoardAPI(BoardAPI):
 
         except Exception as e:
             logger.error(f"Failed to move component: {e}")
+            self._invalidate_footprints()
             return False
 
+    def rotate_component(self, reference: str, angle: float) -> Optional[float]:
+        """
+        Rotate a component in place by angle degrees (updates UI immediately).
+
+        Returns:
+            The new rotation in degrees, or None if the rotation failed
+        """
+        try:
+            from kipy.geometry import Angle
+
+            board = self._get_board()
+            _, by_ref = self._get_footprints()
+
+            target_fp = by_ref.get(reference)
+            if not target_fp:
+                logger.error(f"Component not found: {reference}")
+                return None
+
+            current = target_fp.orientation.degrees if target_fp.orientation else 0
+            new_rotation = (current + angle) % 360
+            target_fp.orientation = Angle.from_degrees(new_rotation)
+            self._components_cache = None
+
+            commit = self._begin_commit(board)
+            board.update_items([target_fp])
+            self._push_commit(board, commit, f"Rotated component {reference}")
+
+            self._notify("component_moved", {
+                "reference": reference,
+                "rotation": new_rotation
+            })
+
+            return new_rotation
+
+        except Exception as e:
+            logger.error(f"Failed to rotate component: {e}")
+            self._invalidate_footprints()
+            return None
+
     def delete_component(self, reference: str) -> bool:
         """Delete a component from the board."""
         try:
             board = self._get_board()
-            footprints = board.get_footprints()
+            _, by_ref = self._get_footprints()
 
             # Find the footprint by reference
-            target_fp = None
-            for fp in footprints:
-                if fp.reference_field and fp.reference_field.text.value == reference:
-                    target_fp = fp
-                    break
+            target_fp = by_ref.get(reference)
 
             if not target_fp:
                 logger.error(f"Component not found: {reference}")
                 return False
 
             # Remove component
-            commit = board.begin_commit()
+            commit = self._begin_commit(board)
             board.remove_items([target_fp])
-            board.push_commit(commit, f"Deleted component {reference}")
+            self._push_commit(board, commit, f"Deleted component {reference}")
+            self._forget_footprint(reference, target_fp)
 
             self._notify("component_deleted", {"reference": reference})
 
@@ -790,8 +960,105 @@ class IPCBoardAPI(BoardAPI):
 
         except Exception as e:
             logger.error(f"Failed to delete component: {e}")
+            self._invalidate_footprints()
             return False
 
+    @staticmethod
+    def _make_track(
+        start_x: float,
+        start_y: float,
+        end_x: float,
+        end_y: float,
+        width: float = 0.25,
+        layer: str = "F.Cu",
+    ):
+        """Build an (uncommitted) kipy Track; the caller sets its net."""
+        from kipy.board_types import Track
+        from kipy.geometry import Vector2
+        from kipy.util.units import from_mm
+        from kipy.proto.board.board_types_pb2 import BoardLayer
+
+        track = Track()
+        track.start = Vector2.from_xy(from_mm(start_x), from_mm(start_y))
+        track.end = Vector2.from_xy(from_mm(end_x), from_mm(end_y))
+        track.width = from_mm(width)
+
+        # Set layer
+        layer_map = {
+            "F.Cu": BoardLayer.BL_F_Cu,
+            "B.Cu": BoardLayer.BL_B_Cu,
+            "In1.Cu": BoardLayer.BL_In1_Cu,
+            "In2.Cu": BoardLayer.BL_In2_Cu,
+        }
+        track.layer = layer_map.get(layer, BoardLayer.BL_F_Cu)
+        return track
+
+    @staticmethod
+    def _make_via(
+        x: float,
+        y: float,
+        diameter: float = 0.8,
+        drill: float = 0.4,
+        via_type: str = "through",
+    ):
+        """Build an (uncommitted) kipy Via; the caller sets its net."""
+        from kipy.board_types import Via
+        from kipy.geometry import Vector2
+        from kipy.util.units import from_mm
+        from kipy.proto.board.board_types_pb2 import ViaType
+
+        via = Via()
+        via.position = Vector2.from_xy(from_mm(x), from_mm(y))
+        via.diameter = from_mm(diameter)
+        via.drill_diameter = from_mm(drill)
+
+        # Set via type (enum values: VT_THROUGH=1, VT_BLIND_BURIED=2, VT_MICRO=3)
+        type_map = {
+            "through": ViaType.VT_THROUGH,
+            "blind": ViaType.VT_BLIND_BURIED,
+            "micro": ViaType.VT_MICRO,
+        }
+        via.type = type_map.get(via_type, ViaType.VT_THROUGH)
+        return via
+
+    @staticmethod
+    def _make_text(
+        text: str,
+        x: float,
+        y: float,
+        layer: str = "F.SilkS",
+        size: float = 1.0,
+        rotation: float = 0,
+    ):
+        """Build an (uncommitted) kipy BoardText."""
+        from kipy.board_types import BoardText
+        from kipy.geometry import Vector2, Angle
+        from kipy.util.units import from_mm
+        from kipy.proto.board.board_types_pb2 import BoardLayer
+
+        board_text = BoardText()
+        board_text.value = text
+        board_text.position = Vector2.from_xy(from_mm(x), from_mm(y))
+        board_text.angle = Angle.from_degrees(rotation)
+
+        # Set layer
+        layer_map = {
+            "F.SilkS": BoardLayer.BL_F_SilkS,
+            "B.SilkS": BoardLayer.BL_B_SilkS,
+            "F.Cu": BoardLayer.BL_F_Cu,
+            "B.Cu": BoardLayer.BL_B_Cu,
+        }
+        board_text.layer = layer_map.get(layer, BoardLayer.BL_F_SilkS)
+        return board_text
+
+    @staticmethod
+    def _find_net(board, net_name: str):
+        """Return the board net called net_name, or None."""
+        for net in board.get_nets():
+            if net.name == net_name:
+                return net
+        return None
+
     def add_track(
         self,
         start_x: float,
@@ -808,40 +1075,20 @@ class IPCBoardAPI(BoardAPI):
         The track appears immediately in the KiCAD UI.
         """
         try:
-            from kipy.board_types import Track
-            from kipy.geometry import Vector2
-            from kipy.util.units import from_mm
-            from kipy.proto.board.board_types_pb2 import BoardLayer
-
             board = self._get_board()
 
-            # Create track
-            track = Track()
-            track.start = Vector2.from_xy(from_mm(start_x), from_mm(start_y))
-            track.end = Vector2.from_xy(from_mm(end_x), from_mm(end_y))
-            track.width = from_mm(width)
-
-            # Set layer
-            layer_map = {
-                "F.Cu": BoardLayer.BL_F_Cu,
-                "B.Cu": BoardLayer.BL_B_Cu,
-                "In1.Cu": BoardLayer.BL_In1_Cu,
-                "In2.Cu": BoardLayer.BL_In2_Cu,
-            }
-            track.layer = layer_map.get(layer, BoardLayer.BL_F_Cu)
+            track = self._make_track(start_x, start_y, end_x, end_y, width, layer)
 
             # Set net if specified
             if net_name:
-                nets = board.get_nets()
-                for net in nets:
-                    if net.name == net_name:
-                        track.net = net
-                        break
+                net = self._find_net(board, net_name)
+                if net is not None:
+                    track.net = net
 
             # Add track with transaction
-            commit = board.begin_commit()
+            commit = self._begin_commit(board)
             board.create_items(track)
-            board.push_commit(commit, "Added track")
+            self._push_commit(board, commit, "Added track")
 
             self._notify("track_added", {
                 "start": {"x": start_x, "y": start_y},
@@ -873,39 +1120,20 @@ class IPCBoardAPI(BoardAPI):
         The via appears immediately in the KiCAD UI.
         """
         try:
-            from kipy.board_types import Via
-            from kipy.geometry import Vector2
-            from kipy.util.units import from_mm
-            from kipy.proto.board.board_types_pb2 import ViaType
-
             board = self._get_board()
 
-            # Create via
-            via = Via()
-            via.position = Vector2.from_xy(from_mm(x), from_mm(y))
-            via.diameter = from_mm(diameter)
-            via.drill_diameter = from_mm(drill)
-
-            # Set via type (enum values: VT_THROUGH=1, VT_BLIND_BURIED=2, VT_MICRO=3)
-            type_map = {
-                "through": ViaType.VT_THROUGH,
-                "blind": ViaType.VT_BLIND_BURIED,
-                "micro": ViaType.VT_MICRO,
-            }
-            via.type = type_map.get(via_type, ViaType.VT_THROUGH)
+            via = self._make_via(x, y, diameter, drill, via_type)
 
             # Set net if specified
             if net_name:
-                nets = board.get_nets()
-                for net in nets:
-                    if net.name == net_name:
-                        via.net = net
-                        break
+                net = self._find_net(board, net_name)
+                if net is not None:
+                    via.net = net
 
             # Add via with transaction
-            commit = board.begin_commit()
+            commit = self._begin_commit(board)
             board.create_items(via)
-            board.push_commit(commit, "Added via")
+            self._push_commit(board, commit, "Added via")
 
             self._notify("via_added", {
                 "position": {"x": x, "y": y},
@@ -933,32 +1161,14 @@ class IPCBoardAPI(BoardAPI):
     ) -> bool:
         """Add text to the board."""
         try:
-            from kipy.board_types import BoardText
-            from kipy.geometry import Vector2, Angle
-            from kipy.util.units import from_mm
-            from kipy.proto.board.board_types_pb2 import BoardLayer
-
             board = self._get_board()
 
-            # Create text
-            board_text = BoardText()
-            board_text.value = text
-            board_text.position = Vector2.from_xy(from_mm(x), from_mm(y))
-            board_text.angle = Angle.from_degrees(rotation)
-
-            # Set layer
-            layer_map = {
-                "F.SilkS": BoardLayer.BL_F_SilkS,
-                "B.SilkS": BoardLayer.BL_B_SilkS,
-                "F.Cu": BoardLayer.BL_F_Cu,
-                "B.Cu": BoardLayer.BL_B_Cu,
-            }
-            board_text.layer = layer_map.get(layer, BoardLayer.BL_F_SilkS)
+            board_text = self._make_text(text, x, y, layer, size, rotation)
 
             # Add text with transaction
-            commit = board.begin_commit()
+            commit = self._begin_commit(board)
             board.create_items(board_text)
-            board.push_commit(commit, f"Added text: {text}")
+            self._push_commit(board, commit, f"Added text: {text}")
 
             self._notify("text_added", {
                 "text": text,
@@ -972,6 +1182,63 @@ class IPCBoardAPI(BoardAPI):
             logger.error(f"Failed to add text: {e}")
             return False
 
+    def add_tracks(self, tracks: List[Tuple]) -> Dict[str, Any]:
+        """Add several tracks with one create_items call and one commit."""
+        return self._add_items("track", tracks, self._make_track, self.add_track)
+
+    def add_vias(self, vias: List[Tuple]) -> Dict[str, Any]:
+        """Add several vias with one create_items call and one commit."""
+        return self._add_items("via", vias, self._make_via, self.add_via)
+
+    def add_texts(self, texts: List[Tuple]) -> Dict[str, Any]:
+        """Add several text items with one create_items call and one commit."""
+        return self._add_items("text", texts, self._make_text, self.add_text)
+
+    def _add_items(
+        self,
+        kind: str,
+        specs: List[Tuple],
+        make: Callable,
+        add_one: Callable,
+    ) -> Dict[str, Any]:
+        """
+        Build one item per spec and create them all in a single round trip.
+
+        Each spec holds the positional arguments of the single-item add_one
+        method. They are bound to its parameter names, and everything except
+        net_name is passed to make by keyword. Entries that cannot be built
+        are reported in failed_indices; the rest are still added. Net names
+        are resolved against one get_nets().
+        """
+        board = self._get_board()
+        signature = inspect.signature(add_one)
+        nets = None
+        items = []
+        failed = []
+
+        for index, spec in enumerate(specs):
+            try:
+                kwargs = signature.bind(*spec).arguments
+                net_name = kwargs.pop("net_name", None)
+                item = make(**kwargs)
+                if net_name:
+                    if nets is None:
+                        nets = {net.name: net for net in board.get_nets()}
+                    if net_name in nets:
+                        item.net = nets[net_name]
+                items.append(item)
+            except Exception as e:
+                logger.warning(f"Skipping {kind} {index}: {e}")
+                failed.append(index)
+
+        if items:
+            self.create_items(items, f"Added {len(items)} {kind}s")
+
+            self._notify(f"{kind}s_added", {"count": len(items)})
+            logger.info(f"Added {len(items)} {kind}s")
+
+        return {"added": len(items), "failed_indices": failed}
+
     def get_tracks(self) -> List[Dict[str, Any]]:
         """Get all tracks on the board."""
         try:
@@ -1039,6 +1306,43 @@ class IPCBoardAPI(BoardAPI):
             logger.error(f"Failed to get vias: {e}")
             return []
 
+    def get_item_counts(self) -> Dict[str, int]:
+        """
+        Count the components, tracks, vias and nets on the board.
+
+        Footprints, tracks and vias are fetched with a single GetItems request
+        (which also refreshes the footprint cache) instead of one per type.
+        """
+        try:
+            from kipy.board_types import ArcTrack, FootprintInstance, Track, Via
+            from kipy.proto.common.types.enums_pb2 import KiCadObjectType
+
+            board = self._get_board()
+            items = board.get_items([
+                KiCadObjectType.KOT_PCB_FOOTPRINT,
+                KiCadObjectType.KOT_PCB_TRACE,
+                KiCadObjectType.KOT_PCB_ARC,
+                KiCadObjectType.KOT_PCB_VIA,
+            ])
+            footprints = [item for item in items if isinstance(item, FootprintInstance)]
+            self._cache_footprints(footprints)
+
+            return {
+                "components": len(footprints),
+                "tracks": sum(isinstance(item, (Track, ArcTrack)) for item in items),
+                "vias": sum(isinstance(item, Via) for item in items),
+                "nets": len(board.get_nets()),
+            }
+
+        except Exception as e:
+            logger.warning(f"Batched item count failed, counting each type: {e}")
+            return {
+                "components": len(self.list_components()),
+                "tracks": len(self.get_tracks()),
+                "vias": len(self.get_vias()),
+                "nets": len(self.get_nets()),
+            }
+
     def get_nets(self) -> List[Dict[str, Any]]:
         """Get all nets on the board."""
         try:
@@ -1090,7 +1394,6 @@ class IPCBoardAPI(BoardAPI):
         """
         try:
             from kipy.board_types import Zone, ZoneFillMode, ZoneType
-            from kipy.geometry import PolyLine, PolyLineNode, Vector2
             from kipy.util.units import from_mm
             from kipy.proto.board.board_types_pb2 import BoardLayer
 
@@ -1137,26 +1440,22 @@ class IPCBoardAPI(BoardAPI):
             else:
                 zone.fill_mode = ZoneFillMode.ZFM_SOLID
 
-            # Create outline polyline
-            outline = PolyLine()
+            # Write the outline straight into the zone's proto: kipy doesn't
+            # expose a setter for new zones, and filling the nodes in place
+            # avoids a wrapper object per point and a copy of the polyline
+            outline = zone._proto.outline.polygons.add().outline
             outline.closed = True
+            nodes = outline.nodes
 
             for point in points:
-                x = point.get("x", 0)
-                y = point.get("y", 0)
-                node = PolyLineNode.from_xy(from_mm(x), from_mm(y))
-                outline.append(node)
-
-            # Set the outline on the zone
-            # Note: Zone outline is set via the proto directly since kipy
-            # doesn't expose a direct setter for creating new zones
-            zone._proto.outline.polygons.add()
-            zone._proto.outline.polygons[0].outline.CopyFrom(outline._proto)
+                node = nodes.add()
+                node.point.x_nm = from_mm(point.get("x", 0))
+                node.point.y_nm = from_mm(point.get("y", 0))
 
             # Add zone with transaction
-            commit = board.begin_commit()
+            commit = self._begin_commit(board)
             board.create_items(zone)
-            board.push_commit(commit, f"Added copper zone on {layer}")
+            self._push_commit(board, commit, f"Added copper zone on {layer}")
 
             self._notify("zone_added", {
                 "layer": layer,
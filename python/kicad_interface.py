@@ -9,43 +9,234 @@ JSON and returns responses via stdout also as JSON.
 
 import sys
 import json
+import subprocess
+import importlib
 import traceback
 import logging
+import logging.handlers
 import os
-import time
+import queue
+import re
+import reprlib
+import atexit
 import threading
-import shutil
-from typing import Dict, Any, Optional
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, TypedDict
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional, json is used instead
+    orjson = None
+
 # Import tool schemas and resource definitions
 from schemas.tool_schemas import TOOL_SCHEMAS
+from schemas.command_specs import COMMAND_SPECS
 from resources.resource_definitions import RESOURCE_DEFINITIONS, handle_resource_read
 
-# Configure logging
-log_dir = os.path.join(os.path.expanduser("~"), ".kicad-mcp", "logs")
-os.makedirs(log_dir, exist_ok=True)
-log_file = os.path.join(log_dir, "kicad_interface.log")
+JSON_SEPARATORS = (",", ":")
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[logging.FileHandler(log_file), logging.StreamHandler(sys.stderr)],
-)
+
+def _escape_non_ascii(match: "re.Match[str]") -> str:
+    """JSON \\u escape for one non-ASCII character, as json.dumps writes it"""
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return "\\u%04x\\u%04x" % (0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+    return "\\u%04x" % code
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize a response to compact ASCII JSON, using orjson when installed"""
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers wider than 64 bits, which json handles
+            pass
+        else:
+            if data.isascii():
+                return data
+            # Keep stdout ASCII-only like json.dumps does: the TypeScript side
+            # decodes each chunk separately, which can split multi-byte
+            # characters. Non-ASCII only occurs inside strings, so escaping
+            # it in place matches json.dumps without serializing again.
+            text = _NON_ASCII.sub(_escape_non_ascii, data.decode("utf-8"))
+            return text.encode("ascii")
+    return json.dumps(obj, separators=JSON_SEPARATORS, default=str).encode("ascii")
+
+
+def _dumps(obj: Any) -> str:
+    """_dumps_bytes() as text, for JSON nested inside a response"""
+    return _dumps_bytes(obj).decode("ascii")
+
+
+def _loads(text: Any) -> Any:
+    """Parse one JSON request line (str or bytes), using orjson when installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. NaN literals); let json decide
+            pass
+    return json.loads(text)
+
+
+def _tool_result_response(request_id: Any, result: Any) -> bytes:
+    """
+    Serialize a tools/call response whose text content is the JSON of result
+
+    MCP text content must be a string, so result is serialized once and
+    that string is escaped once into the envelope, instead of building the
+    envelope as a dict and walking it again.
+    """
+    return b"".join(
+        (
+            b'{"jsonrpc":"2.0","id":',
+            _dumps_bytes(request_id),
+            b',"result":{"content":[{"type":"text","text":',
+            _dumps_bytes(_dumps(result)),
+            b"}]}}",
+        )
+    )
+
+
+# Constant parts of the JSON-RPC answers, shared by every request
+_INITIALIZE_RESULT = {
+    "protocolVersion": "2025-06-18",
+    "capabilities": {
+        "tools": {"listChanged": True},
+        "resources": {
+            "subscribe": False,
+            "listChanged": True,
+        },
+    },
+    "serverInfo": {
+        "name": "kicad-mcp-server",
+        "title": "KiCAD PCB Design Assistant",
+        "version": "2.1.0-alpha",
+    },
+    "instructions": "AI-assisted PCB design with KiCAD. Use tools to create projects, design boards, place components, route traces, and export manufacturing files.",
+}
+_RESOURCES_LIST_RESULT = {"resources": RESOURCE_DEFINITIONS}
+
+
+def _jsonrpc_result(request_id: Any, result: Any) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _jsonrpc_error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": code, "message": message},
+    }
+
+
+def _write_response(obj: Any) -> None:
+    """Write one JSON response line to stdout; bytes are written as they are"""
+    # Bytes go straight to the binary buffer, skipping the text layer's
+    # re-encoding of the (often large) serialized response
+    out = sys.stdout.buffer
+    out.write(obj if isinstance(obj, bytes) else _dumps_bytes(obj))
+    out.write(b"\n")
+    out.flush()
+
+
+class _LogFileHandler(logging.FileHandler):
+    """FileHandler that creates the log directory when the file is opened"""
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue stays idle"""
+
+    FLUSH_INTERVAL = 1.0  # seconds
+
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.FLUSH_INTERVAL)
+            except queue.Empty:
+                if not block:
+                    raise
+                # Buffered records reach the file within FLUSH_INTERVAL even
+                # if the process is killed without running atexit
+                for handler in self.handlers:
+                    handler.flush()
+
+
+def _configure_logging() -> None:
+    """
+    Configure logging for the interface.
+
+    Handlers run on a background QueueListener thread so file and stderr
+    writes stay off the startup and request path. The log file, and its
+    directory, are only created when the first batch of records is written.
+    """
+    log_file = Path.home() / ".kicad-mcp" / "logs" / "kicad_interface.log"
+
+    log_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+    file_handler = _LogFileHandler(log_file, delay=True)
+    file_handler.setFormatter(log_formatter)
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setFormatter(log_formatter)
+
+    # The log file is written in batches: on WARNING or above, when the
+    # buffer is full, once the queue has been idle for a second, and at
+    # shutdown
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        64, flushLevel=logging.WARNING, target=file_handler
+    )
+
+    log_listener = _FlushingQueueListener(
+        queue.Queue(-1), buffered_file_handler, stderr_handler
+    )
+    queue_handler = logging.handlers.QueueHandler(log_listener.queue)
+    # Only merge the message here; the listener's handlers apply the layout
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    # LOG_LEVEL is shared with the TypeScript server; everything is logged
+    # when it is unset
+    level = logging.getLevelName(os.environ.get("LOG_LEVEL", "DEBUG").upper())
+    if not isinstance(level, int):
+        level = logging.DEBUG
+    logging.basicConfig(level=level, handlers=[queue_handler])
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+
+_configure_logging()
 logger = logging.getLogger("kicad_interface")
 
-# Log Python environment details
-logger.info(f"Python version: {sys.version}")
-logger.info(f"Python executable: {sys.executable}")
-logger.info(f"Platform: {sys.platform}")
-logger.info(f"Working directory: {os.getcwd()}")
+# Environment diagnostics are opt-in (KICAD_MCP_DIAG=1)
+DIAGNOSTICS_ENABLED = logger.isEnabledFor(logging.DEBUG) and bool(
+    os.environ.get("KICAD_MCP_DIAG")
+)
+
+if DIAGNOSTICS_ENABLED:
+    # Log Python environment details
+    logger.info(f"Python version: {sys.version}")
+    logger.info(f"Python executable: {sys.executable}")
+    logger.info(f"Platform: {sys.platform}")
+    logger.info(f"Working directory: {os.getcwd()}")
+
+    # Windows-specific diagnostics
+    if sys.platform == "win32":
+        logger.info("=== Windows Environment Diagnostics ===")
+        logger.info(f"PYTHONPATH: {os.environ.get('PYTHONPATH', 'NOT SET')}")
+        logger.info(
+            f"PATH: {os.environ.get('PATH', 'NOT SET')[:200]}..."
+        )  # Truncate PATH
+        logger.info("========================================")
 
-# Windows-specific diagnostics
-if sys.platform == "win32":
-    logger.info("=== Windows Environment Diagnostics ===")
-    logger.info(f"PYTHONPATH: {os.environ.get('PYTHONPATH', 'NOT SET')}")
-    logger.info(f"PATH: {os.environ.get('PATH', 'NOT SET')[:200]}...")  # Truncate PATH
 
+def _log_windows_kicad_installations():
+    """Log the KiCAD installations found in the standard Windows locations"""
     # Check for common KiCAD installations
     common_kicad_paths = [r"C:\Program Files\KiCad", r"C:\Program Files (x86)\KiCad"]
 
@@ -53,13 +244,11 @@ if sys.platform == "win32":
     for base_path in common_kicad_paths:
         if os.path.exists(base_path):
             logger.info(f"Found KiCAD installation at: {base_path}")
-            # List versions
+            # List versions (scandir entries carry the directory flag, so no
+            # extra stat per entry)
             try:
-                versions = [
-                    d
-                    for d in os.listdir(base_path)
-                    if os.path.isdir(os.path.join(base_path, d))
-                ]
+                with os.scandir(base_path) as entries:
+                    versions = [entry.name for entry in entries if entry.is_dir()]
                 logger.info(f"  Versions found: {', '.join(versions)}")
                 for version in versions:
                     python_path = os.path.join(
@@ -79,7 +268,6 @@ if sys.platform == "win32":
             "Please ensure KiCAD 9.0+ is installed from https://www.kicad.org/download/windows/"
         )
 
-    logger.info("========================================")
 
 # Add utils directory to path for imports
 utils_dir = os.path.join(os.path.dirname(__file__))
@@ -90,9 +278,21 @@ if utils_dir not in sys.path:
 from utils.platform_helper import PlatformHelper
 from utils.kicad_process import check_and_launch_kicad, KiCADProcessManager
 from utils.kicad_cli import resolve_kicad_cli
+from commands.board_ref import BoardRef
 
-logger.info(f"Detecting KiCAD Python paths for {PlatformHelper.get_platform_name()}...")
-paths_added = PlatformHelper.add_kicad_to_python_path()
+
+def discover_kicad_paths() -> bool:
+    """Add KiCAD Python paths to sys.path, rescanning only when installs changed"""
+    logger.info(
+        f"Detecting KiCAD Python paths for {PlatformHelper.get_platform_name()}..."
+    )
+    kicad_paths = PlatformHelper.get_cached_kicad_python_paths()
+    if not kicad_paths and sys.platform == "win32":
+        _log_windows_kicad_installations()
+    return PlatformHelper.add_kicad_to_python_path(kicad_paths)
+
+
+paths_added = discover_kicad_paths()
 
 if paths_added:
     logger.info("Successfully added KiCAD Python paths to sys.path")
@@ -101,7 +301,8 @@ else:
         "No KiCAD Python paths found - attempting to import pcbnew from system path"
     )
 
-logger.info(f"Current Python path: {sys.path}")
+if DIAGNOSTICS_ENABLED:
+    logger.info(f"Current Python path: {sys.path}")
 
 # Check if auto-launch is enabled
 AUTO_LAUNCH_KICAD = os.environ.get("KICAD_AUTO_LAUNCH", "false").lower() == "true"
@@ -113,6 +314,13 @@ if AUTO_LAUNCH_KICAD:
 KICAD_BACKEND = os.environ.get("KICAD_BACKEND", "auto").lower()
 logger.info(f"KiCAD backend preference: {KICAD_BACKEND}")
 
+# Official JLCPCB API credentials are read once; the server's environment
+# does not change while it runs
+HAS_OFFICIAL_JLCPCB_CREDS = all(
+    os.environ.get(name)
+    for name in ("JLCPCB_APP_ID", "JLCPCB_API_KEY", "JLCPCB_API_SECRET")
+)
+
 # Try to use IPC backend first if available and preferred
 USE_IPC_BACKEND = False
 ipc_backend = None
@@ -137,6 +345,18 @@ if KICAD_BACKEND in ("auto", "ipc"):
         logger.info(f"IPC backend connection failed: {e}")
         ipc_backend = None
 
+# Geometry types for the IPC board handlers, imported once instead of on
+# every call. They stay None unless the IPC backend is in use.
+BoardSegment = BoardCircle = Vector2 = from_mm = BoardLayer = None
+if USE_IPC_BACKEND:
+    try:
+        from kipy.board_types import BoardCircle, BoardSegment
+        from kipy.geometry import Vector2
+        from kipy.util.units import from_mm
+        from kipy.proto.board.board_types_pb2 import BoardLayer
+    except ImportError as e:
+        logger.warning(f"kicad-python geometry types unavailable: {e}")
+
 # Fall back to SWIG backend if IPC not available
 if not USE_IPC_BACKEND and KICAD_BACKEND != "ipc":
     # Import KiCAD's Python API (SWIG)
@@ -151,32 +371,7 @@ if not USE_IPC_BACKEND and KICAD_BACKEND != "ipc":
         logger.error(f"Failed to import pcbnew module: {e}")
         logger.error(f"Current sys.path: {sys.path}")
 
-        # Platform-specific help message
-        help_message = ""
-        if sys.platform == "win32":
-            help_message = """
-Windows Troubleshooting:
-1. Verify KiCAD is installed: C:\\Program Files\\KiCad\\9.0
-2. Check PYTHONPATH environment variable points to:
-   C:\\Program Files\\KiCad\\9.0\\lib\\python3\\dist-packages
-3. Test with: "C:\\Program Files\\KiCad\\9.0\\bin\\python.exe" -c "import pcbnew"
-4. Log file location: %USERPROFILE%\\.kicad-mcp\\logs\\kicad_interface.log
-5. Run setup-windows.ps1 for automatic configuration
-"""
-        elif sys.platform == "darwin":
-            help_message = """
-macOS Troubleshooting:
-1. Verify KiCAD is installed: /Applications/KiCad/KiCad.app
-2. Check PYTHONPATH points to KiCAD's Python packages
-3. Run: python3 -c "import pcbnew" to test
-"""
-        else:  # Linux
-            help_message = """
-Linux Troubleshooting:
-1. Verify KiCAD is installed: apt list --installed | grep kicad
-2. Check: /usr/lib/kicad/lib/python3/dist-packages exists
-3. Test: python3 -c "import pcbnew"
-"""
+        from utils.pcbnew_help import PLATFORM_HELP as help_message
 
         logger.error(help_message)
 
@@ -185,17 +380,16 @@ Linux Troubleshooting:
             "message": "Failed to import pcbnew module - KiCAD Python API not found",
             "errorDetails": f"Error: {str(e)}\n\n{help_message}\n\nPython sys.path:\n{chr(10).join(sys.path)}",
         }
-        print(json.dumps(error_response))
+        _write_response(error_response)
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Unexpected error importing pcbnew: {e}")
-        logger.error(traceback.format_exc())
+        logger.error(f"Unexpected error importing pcbnew: {e}", exc_info=True)
         error_response = {
             "success": False,
             "message": "Error importing pcbnew module",
             "errorDetails": str(e),
         }
-        print(json.dumps(error_response))
+        _write_response(error_response)
         sys.exit(1)
 
 # If IPC-only mode requested but not available, exit with error
@@ -205,49 +399,236 @@ elif KICAD_BACKEND == "ipc" and not USE_IPC_BACKEND:
         "message": "IPC backend requested but not available",
         "errorDetails": "KiCAD must be running with IPC API enabled. Enable at: Preferences > Plugins > Enable IPC API Server",
     }
-    print(json.dumps(error_response))
+    _write_response(error_response)
     sys.exit(1)
 
-# Import command handlers
-try:
-    logger.info("Importing command handlers...")
-    from commands.project import ProjectCommands
-    from commands.board import BoardCommands
-    from commands.component import ComponentCommands
-    from commands.routing import RoutingCommands
-    from commands.design_rules import DesignRuleCommands
-    from commands.export import ExportCommands
-    from commands.schematic import SchematicManager
-    from commands.component_schematic import ComponentManager
-    from commands.connection_schematic import ConnectionManager
-    from commands.schematic_quality import SchematicQualityManager
-    from commands.library_schematic import LibraryManager as SchematicLibraryManager
-    from commands.library import (
-        LibraryManager as FootprintLibraryManager,
-        LibraryCommands,
+# Command handlers are imported on first use. A typical invocation routes to a
+# single handler, so importing every command module up front only costs
+# startup time and memory. Each entry maps the KiCADInterface attribute to
+# (module, class, constructor argument attributes).
+_HANDLER_SPECS = {
+    "footprint_library": ("commands.library", "LibraryManager", ()),
+    "project_commands": ("commands.project", "ProjectCommands", ("_board_ref",)),
+    "board_commands": ("commands.board", "BoardCommands", ("_board_ref",)),
+    "component_commands": (
+        "commands.component",
+        "ComponentCommands",
+        ("_board_ref", "footprint_library"),
+    ),
+    "routing_commands": ("commands.routing", "RoutingCommands", ("_board_ref",)),
+    "design_rule_commands": (
+        "commands.design_rules",
+        "DesignRuleCommands",
+        ("_board_ref",),
+    ),
+    "library_commands": (
+        "commands.library",
+        "LibraryCommands",
+        ("footprint_library",),
+    ),
+    "symbol_library_commands": (
+        "commands.library_symbol",
+        "SymbolLibraryCommands",
+        (),
+    ),
+    "jlcpcb_client": ("commands.jlcpcb", "JLCPCBClient", ()),
+    "jlcpcb_parts": ("commands.jlcpcb_parts", "JLCPCBPartsManager", ()),
+    # Takes a provider so the JLCPCB database is only opened by BOM analysis
+    "export_commands": (
+        "commands.export",
+        "ExportCommands",
+        ("_board_ref", "_jlcpcb_parts_provider"),
+    ),
+    # Shared so library symbols and schematic text stay cached between adds
+    "symbol_loader": (
+        "commands.dynamic_symbol_loader",
+        "DynamicSymbolLoader",
+        (),
+    ),
+}
+
+# Debug logs show a bounded preview of payloads; reprlib stops rendering at
+# these limits instead of building the whole repr and truncating it
+_LOG_PREVIEW = reprlib.Repr()
+_LOG_PREVIEW.maxlevel = 4
+_LOG_PREVIEW.maxdict = _LOG_PREVIEW.maxlist = 20
+_LOG_PREVIEW.maxstring = _LOG_PREVIEW.maxother = 200
+
+
+def _log_preview(obj: Any) -> Any:
+    """Return a cheap, size-capped stand-in for obj in a debug log call"""
+    if isinstance(obj, bytes):
+        # Raw request lines log as text, not as a b'...' repr
+        return obj[:500].decode("utf-8", "replace")
+    if isinstance(obj, str):
+        return obj[:500]
+    return _LOG_PREVIEW.repr(obj)
+
+
+# Maximum number of commands accepted in one batch request
+MAX_BATCH_SIZE = int(os.environ.get("KICAD_MCP_MAX_BATCH", "64"))
+
+# Include tracebacks in errorDetails for every failed command
+DEBUG_TRACEBACKS = os.environ.get("KICAD_MCP_DEBUG_TB") == "1"
+
+
+def _error_details(error: Exception, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build errorDetails for a failed command.
+
+    The traceback is only formatted when KICAD_MCP_DEBUG_TB=1 or the request
+    sets "_debug"; otherwise the exception message is enough for the client
+    and the full traceback is in the log.
+    """
+    if DEBUG_TRACEBACKS or (isinstance(params, dict) and params.get("_debug")):
+        return "".join(traceback.TracebackException.from_exception(error).format())
+    return str(error)
+
+
+# Commands that edit the schematic named by their schematicPath parameter
+_SCHEMATIC_WRITE_COMMANDS = frozenset(
+    (
+        "add_schematic_component",
+        "add_schematic_wire",
+        "add_schematic_connection",
+        "add_schematic_net_label",
+        "connect_to_net",
+        "auto_layout_schematic",
     )
-    from commands.library_symbol import SymbolLibraryManager, SymbolLibraryCommands
-    from commands.jlcpcb import JLCPCBClient, test_jlcpcb_connection
-    from commands.jlcpcb_parts import JLCPCBPartsManager
+)
 
-    logger.info("Successfully imported all command handlers")
-except ImportError as e:
-    logger.error(f"Failed to import command handlers: {e}")
-    error_response = {
-        "success": False,
-        "message": "Failed to import command handlers",
-        "errorDetails": str(e),
-    }
-    print(json.dumps(error_response))
-    sys.exit(1)
+# generate_netlist results: (abspath, includeTemplates) ->
+# ((st_mtime_ns, st_size), netlist)
+_NETLIST_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# get_net_connections index of every net: abspath -> ((st_mtime_ns, st_size), index)
+_NET_INDEX_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+
+# Schematics kept in each of the caches above, least recently used dropped first
+SCHEMATIC_RESULT_CACHE_SIZE = 32
+
+
+def _cache_store(cache: OrderedDict, key, value) -> None:
+    """Insert into an LRU cache, evicting beyond SCHEMATIC_RESULT_CACHE_SIZE"""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > SCHEMATIC_RESULT_CACHE_SIZE:
+        cache.popitem(last=False)
+
+# Progress callbacks publish to jlcpcb_download_status at most this often
+DOWNLOAD_STATUS_INTERVAL_NS = 100_000_000
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+# check_kicad_ui answers are reused for this many seconds, since clients
+# poll it and each check runs pgrep/ps
+KICAD_STATUS_TTL = 0.25
+# (time.monotonic(), running, processes) from the last check, or None
+_kicad_status: Optional[tuple] = None
+
+
+def _invalidate_kicad_status() -> None:
+    """Make the next check_kicad_ui look at the processes again"""
+    global _kicad_status
+    _kicad_status = None
+
+
+class AddTrackParams(TypedDict, total=False):
+    startX: float
+    startY: float
+    endX: float
+    endY: float
+    width: float
+    layer: str
+    net: str
+
+
+class AddViaParams(TypedDict, total=False):
+    x: float
+    y: float
+    diameter: float
+    drill: float
+    net: str
+    type: str
+
+
+class AddTextParams(TypedDict, total=False):
+    text: str
+    x: float
+    y: float
+    layer: str
+    size: float
+    rotation: float
+
+
+# The parsers return the positional arguments of the matching IPCBoardAPI
+# add_* method, so batches of N items are read in a single pass each.
+def _parse_add_track(p: AddTrackParams) -> Tuple:
+    get = p.get
+    return (
+        get("startX", 0),
+        get("startY", 0),
+        get("endX", 0),
+        get("endY", 0),
+        get("width", 0.25),
+        get("layer", "F.Cu"),
+        get("net"),
+    )
+
+
+def _parse_add_via(p: AddViaParams) -> Tuple:
+    get = p.get
+    return (
+        get("x", 0),
+        get("y", 0),
+        get("diameter", 0.8),
+        get("drill", 0.4),
+        get("net"),
+        get("type", "through"),
+    )
+
+
+def _parse_add_text(p: AddTextParams) -> Tuple:
+    get = p.get
+    return (
+        get("text", ""),
+        get("x", 0),
+        get("y", 0),
+        get("layer", "F.SilkS"),
+        get("size", 1.0),
+        get("rotation", 0),
+    )
 
 
 class KiCADInterface:
     """Main interface class to handle KiCAD operations"""
 
+    # Lazily constructed handlers get a slot too; __getattr__ only runs while
+    # a handler slot is still empty.
+    __slots__ = (
+        "_board_ref",
+        "project_filename",
+        "use_ipc",
+        "ipc_backend",
+        "ipc_board_api",
+        "jlcpcb_download_status",
+        "jlcpcb_download_thread",
+        "jlcpcb_download_last_result",
+        "_public_estimate_cache",
+        "_yaqwsx_cache_dir",
+        "_last_status_update_ns",
+        "_download_started_mono",
+        "_status_lock",
+        "command_routes",
+        "_dispatch",
+        "_ipc_commands",
+        "tools_list",
+    ) + tuple(_HANDLER_SPECS)
+
     def __init__(self):
         """Initialize the interface and command handlers"""
-        self.board = None
+        # Shared with every board-backed handler, so a board opened by
+        # project_commands is visible to the others without copying it
+        self._board_ref = BoardRef()
         self.project_filename = None
         self.use_ipc = USE_IPC_BACKEND
         self.ipc_backend = ipc_backend
@@ -263,26 +644,8 @@ class KiCADInterface:
         else:
             logger.info("Initializing with SWIG backend")
 
-        logger.info("Initializing command handlers...")
-
-        # Initialize footprint library manager
-        self.footprint_library = FootprintLibraryManager()
-
-        # Initialize command handlers
-        self.project_commands = ProjectCommands(self.board)
-        self.board_commands = BoardCommands(self.board)
-        self.component_commands = ComponentCommands(self.board, self.footprint_library)
-        self.routing_commands = RoutingCommands(self.board)
-        self.design_rule_commands = DesignRuleCommands(self.board)
-        self.library_commands = LibraryCommands(self.footprint_library)
-
-        # Initialize symbol library manager (for searching local KiCad symbol libraries)
-        self.symbol_library_commands = SymbolLibraryCommands()
-
-        # Initialize JLCPCB API integration
-        self.jlcpcb_client = JLCPCBClient()  # Official API (requires auth)
-
-        self.jlcpcb_parts = JLCPCBPartsManager()
+        # Command handlers are constructed lazily by __getattr__ (see
+        # _HANDLER_SPECS), so only the modules a command needs get imported.
         self.jlcpcb_download_status = {
             "isRunning": False,
             "stage": "idle",
@@ -299,209 +662,300 @@ class KiCADInterface:
         }
         self.jlcpcb_download_thread = None
         self.jlcpcb_download_last_result = None
-        self.export_commands = ExportCommands(self.board, self.jlcpcb_parts)
+        self._last_status_update_ns = 0
+        self._download_started_mono = 0.0
+        # Guards swapping jlcpcb_download_status between the worker thread
+        # and request handlers
+        self._status_lock = threading.Lock()
+        # (key, time.monotonic(), estimate) for the public archive estimate
+        self._public_estimate_cache = None
+        self._yaqwsx_cache_dir = None
 
         # Schematic-related classes don't need board reference
         # as they operate directly on schematic files
 
-        # Command routing dictionary
+        # Command routing dictionary. Handler-backed commands are stored as
+        # (handler attribute, method name) and resolved at dispatch time so
+        # building the table does not construct any handler.
         self.command_routes = {
-            # Project commands
-            "create_project": self.project_commands.create_project,
-            "open_project": self.project_commands.open_project,
-            "save_project": self.project_commands.save_project,
-            "get_project_info": self.project_commands.get_project_info,
-            # Board commands
-            "set_board_size": self.board_commands.set_board_size,
-            "add_layer": self.board_commands.add_layer,
-            "set_active_layer": self.board_commands.set_active_layer,
-            "get_board_info": self.board_commands.get_board_info,
-            "get_layer_list": self.board_commands.get_layer_list,
-            "get_board_2d_view": self.board_commands.get_board_2d_view,
-            "get_board_extents": self.board_commands.get_board_extents,
-            "add_board_outline": self.board_commands.add_board_outline,
-            "add_mounting_hole": self.board_commands.add_mounting_hole,
-            "add_text": self.board_commands.add_text,
-            "add_board_text": self.board_commands.add_text,  # Alias for TypeScript tool
-            # Component commands
-            "place_component": self.component_commands.place_component,
-            "move_component": self.component_commands.move_component,
-            "rotate_component": self.component_commands.rotate_component,
-            "delete_component": self.component_commands.delete_component,
-            "edit_component": self.component_commands.edit_component,
-            "get_component_properties": self.component_commands.get_component_properties,
-            "get_component_list": self.component_commands.get_component_list,
-            "find_component": self.component_commands.find_component,
-            "get_component_pads": self.component_commands.get_component_pads,
-            "get_pad_position": self.component_commands.get_pad_position,
-            "set_pad_net": self.component_commands.set_pad_net,
-            "get_component_connections": self.component_commands.get_component_connections,
-            "place_component_array": self.component_commands.place_component_array,
-            "align_components": self.component_commands.align_components,
-            "duplicate_component": self.component_commands.duplicate_component,
-            # Routing commands
-            "add_net": self.routing_commands.add_net,
-            "route_trace": self.routing_commands.route_trace,
-            "add_via": self.routing_commands.add_via,
-            "delete_trace": self.routing_commands.delete_trace,
-            "query_traces": self.routing_commands.query_traces,
-            "modify_trace": self.routing_commands.modify_trace,
-            "analyze_nets": self.routing_commands.analyze_nets,
-            "copy_routing_pattern": self.routing_commands.copy_routing_pattern,
-            "get_nets_list": self.routing_commands.get_nets_list,
-            "create_netclass": self.routing_commands.create_netclass,
-            "add_copper_pour": self.routing_commands.add_copper_pour,
-            "route_differential_pair": self.routing_commands.route_differential_pair,
-            "refill_zones": self._handle_refill_zones,
-            # Design rule commands
-            "set_design_rules": self.design_rule_commands.set_design_rules,
-            "get_design_rules": self.design_rule_commands.get_design_rules,
-            "run_drc": self.design_rule_commands.run_drc,
-            "get_drc_violations": self.design_rule_commands.get_drc_violations,
-            "get_drc_history": self.design_rule_commands.get_drc_history,
-            # Export commands
-            "export_gerber": self.export_commands.export_gerber,
-            "export_pdf": self.export_commands.export_pdf,
-            "export_svg": self.export_commands.export_svg,
-            "export_3d": self.export_commands.export_3d,
-            "export_bom": self.export_commands.export_bom,
-            "analyze_bom_jlcpcb": self.export_commands.analyze_bom_jlcpcb,
-            # Library commands (footprint management)
-            "list_libraries": self.library_commands.list_libraries,
-            "search_footprints": self.library_commands.search_footprints,
-            "list_library_footprints": self.library_commands.list_library_footprints,
-            "get_footprint_info": self.library_commands.get_footprint_info,
-            # Symbol library commands (local KiCad symbol library search)
-            "list_symbol_libraries": self.symbol_library_commands.list_symbol_libraries,
-            "search_symbols": self.symbol_library_commands.search_symbols,
-            "list_library_symbols": self.symbol_library_commands.list_library_symbols,
-            "get_symbol_info": self.symbol_library_commands.get_symbol_info,
-            # JLCPCB API commands (complete parts catalog via API)
-            "download_jlcpcb_database": self._handle_download_jlcpcb_database,
-            "get_jlcpcb_download_status": self._handle_get_jlcpcb_download_status,
-            "search_jlcpcb_parts": self._handle_search_jlcpcb_parts,
-            "get_jlcpcb_part": self._handle_get_jlcpcb_part,
-            "get_jlcpcb_database_stats": self._handle_get_jlcpcb_database_stats,
-            "suggest_jlcpcb_alternatives": self._handle_suggest_jlcpcb_alternatives,
-            # Schematic commands
-            "create_schematic": self._handle_create_schematic,
-            "load_schematic": self._handle_load_schematic,
-            "add_schematic_component": self._handle_add_schematic_component,
-            "add_schematic_wire": self._handle_add_schematic_wire,
-            "add_schematic_connection": self._handle_add_schematic_connection,
-            "add_schematic_net_label": self._handle_add_schematic_net_label,
-            "connect_to_net": self._handle_connect_to_net,
-            "get_net_connections": self._handle_get_net_connections,
-            "generate_netlist": self._handle_generate_netlist,
-            "list_schematic_libraries": self._handle_list_schematic_libraries,
-            "export_schematic_pdf": self._handle_export_schematic_pdf,
-            "auto_layout_schematic": self._handle_auto_layout_schematic,
-            "validate_schematic": self._handle_validate_schematic,
-            # UI/Process management commands
-            "check_kicad_ui": self._handle_check_kicad_ui,
-            "launch_kicad_ui": self._handle_launch_kicad_ui,
-            "open_schematic_editor": self._handle_open_schematic_editor,
-            # IPC-specific commands (real-time operations)
-            "get_backend_info": self._handle_get_backend_info,
-            "ipc_add_track": self._handle_ipc_add_track,
-            "ipc_add_via": self._handle_ipc_add_via,
-            "ipc_add_text": self._handle_ipc_add_text,
-            "ipc_list_components": self._handle_ipc_list_components,
-            "ipc_get_tracks": self._handle_ipc_get_tracks,
-            "ipc_get_vias": self._handle_ipc_get_vias,
-            "ipc_save_board": self._handle_ipc_save_board,
+            command: (getattr(self, method) if holder is None else (holder, method))
+            for command, holder, method, _ in COMMAND_SPECS
         }
 
+        self._dispatch, self._ipc_commands = self._build_dispatch()
+        # The answer to every tools/list request; routes and schemas are
+        # fixed once the interface exists
+        self.tools_list = self._build_tools_list()
+
         logger.info(
             f"KiCAD interface initialized (backend: {'IPC' if self.use_ipc else 'SWIG'})"
         )
 
+    # Seconds a public JLCPCB archive estimate is reused while its cache
+    # directory is unchanged
+    PUBLIC_ESTIMATE_TTL = 60.0
+
     # Commands that can be handled via IPC for real-time updates
     IPC_CAPABLE_COMMANDS = {
-        # Routing commands
-        "route_trace": "_ipc_route_trace",
-        "add_via": "_ipc_add_via",
-        "add_net": "_ipc_add_net",
-        "delete_trace": "_ipc_delete_trace",
-        "get_nets_list": "_ipc_get_nets_list",
-        # Zone commands
-        "add_copper_pour": "_ipc_add_copper_pour",
-        "refill_zones": "_ipc_refill_zones",
-        # Board commands
-        "add_text": "_ipc_add_text",
-        "add_board_text": "_ipc_add_text",
-        "set_board_size": "_ipc_set_board_size",
-        "get_board_info": "_ipc_get_board_info",
-        "add_board_outline": "_ipc_add_board_outline",
-        "add_mounting_hole": "_ipc_add_mounting_hole",
-        "get_layer_list": "_ipc_get_layer_list",
-        # Component commands
-        "place_component": "_ipc_place_component",
-        "move_component": "_ipc_move_component",
-        "rotate_component": "_ipc_rotate_component",
-        "delete_component": "_ipc_delete_component",
-        "get_component_list": "_ipc_get_component_list",
-        "get_component_properties": "_ipc_get_component_properties",
-        # Save command
-        "save_project": "_ipc_save_project",
+        command: ipc_method
+        for command, _, _, ipc_method in COMMAND_SPECS
+        if ipc_method is not None
     }
 
-    def handle_command(self, command: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Route command to appropriate handler, preferring IPC when available"""
-        logger.info(f"Handling command: {command}")
-        logger.debug(f"Command parameters: {params}")
+    def _build_dispatch(self):
+        """
+        Build the command table for the active backend.
+
+        With the IPC backend, IPC-capable commands are routed to their _ipc_*
+        handlers and everything else to command_routes. Without it, the table
+        is a copy of command_routes. It is always a separate dict, since
+        handle_command memoizes resolved handlers into it.
+
+        Returns:
+            Tuple of (dispatch table, commands served by IPC)
+        """
+        dispatch = dict(self.command_routes)
+        if not self.use_ipc:
+            return dispatch, frozenset()
+
+        if not self.ipc_board_api:
+            logger.warning(
+                "IPC board API not available, IPC-capable commands fall back to SWIG (deprecated)"
+            )
+            return dispatch, frozenset()
 
-        try:
-            # Check if we can use IPC for this command (real-time UI sync)
-            if (
-                self.use_ipc
-                and self.ipc_board_api
-                and command in self.IPC_CAPABLE_COMMANDS
-            ):
-                ipc_handler_name = self.IPC_CAPABLE_COMMANDS[command]
-                ipc_handler = getattr(self, ipc_handler_name, None)
+        ipc_commands = set()
+        for command, ipc_handler_name in self.IPC_CAPABLE_COMMANDS.items():
+            ipc_handler = getattr(self, ipc_handler_name, None)
+            if ipc_handler is None:
+                logger.warning(
+                    f"IPC handler not available for {command}, falling back to SWIG (deprecated)"
+                )
+                continue
+            dispatch[command] = ipc_handler
+            ipc_commands.add(command)
+
+        return dispatch, frozenset(ipc_commands)
+
+    def _build_tools_list(self) -> List[Dict[str, Any]]:
+        """Tool definitions for command_routes, with a stub for unknown schemas"""
+        tools = []
+        for cmd_name in self.command_routes:
+            if cmd_name in TOOL_SCHEMAS:
+                tools.append(TOOL_SCHEMAS[cmd_name])
+                continue
+            logger.warning(f"No schema defined for tool: {cmd_name}")
+            tools.append(
+                {
+                    "name": cmd_name,
+                    "description": f"KiCAD command: {cmd_name}",
+                    "inputSchema": {"type": "object", "properties": {}},
+                }
+            )
+        return tools
+
+    def handle_batch(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run a list of {"id", "command", "params"} requests in order
+
+        Each entry of the returned list is {"id": ..., "result": ...} for the
+        request with that id. Requests with a missing, null or duplicate id
+        are answered with an error and not executed.
+        """
+        if len(batch) > MAX_BATCH_SIZE:
+            return [
+                {
+                    "id": None,
+                    "result": {
+                        "success": False,
+                        "message": f"Batch of {len(batch)} requests exceeds the limit of {MAX_BATCH_SIZE}",
+                        "errorDetails": "Split the batch or raise KICAD_MCP_MAX_BATCH",
+                    },
+                }
+            ]
 
-                if ipc_handler:
-                    logger.info(f"Using IPC backend for {command} (real-time sync)")
-                    result = ipc_handler(params)
+        logger.info(f"Handling batch of {len(batch)} commands")
+        seen_ids = set()
+        # (id, command, params) for runnable requests, (id, None, error) otherwise
+        entries = []
 
-                    # Add indicator that IPC was used
-                    if isinstance(result, dict):
-                        result["_backend"] = "ipc"
-                        result["_realtime"] = True
+        for request in batch:
+            request_id = request.get("id") if isinstance(request, dict) else None
+            error = None
 
-                    logger.debug(f"IPC command result: {result}")
-                    return result
+            if request_id is None or not isinstance(request_id, (str, int)):
+                request_id = None
+                error = {
+                    "success": False,
+                    "message": "Batch request requires a string or number id",
+                }
+            elif request_id in seen_ids:
+                error = {
+                    "success": False,
+                    "message": f"Duplicate batch request id: {request_id}",
+                }
+            elif not request.get("command"):
+                error = {
+                    "success": False,
+                    "message": "Missing command",
+                    "errorDetails": "The command field is required",
+                }
+            elif not isinstance(request.get("params") or {}, dict):
+                error = {
+                    "success": False,
+                    "message": "Batch request params must be an object",
+                }
 
-            # Fall back to SWIG-based handler
-            if self.use_ipc and command in self.IPC_CAPABLE_COMMANDS:
-                logger.warning(
-                    f"IPC handler not available for {command}, falling back to SWIG (deprecated)"
-                )
+            if request_id is not None:
+                seen_ids.add(request_id)
+            if error is not None:
+                entries.append((request_id, None, error))
+            else:
+                command = request["command"]
+                entries.append((request_id, command, request.get("params") or {}))
 
-            # Get the handler for the command
-            handler = self.command_routes.get(command)
+        # Under the IPC backend, edits in one batch share a single KiCAD
+        # commit (one undo step) instead of pushing one commit each
+        use_transaction = any(entry[1] in self._ipc_commands for entry in entries)
+        if use_transaction:
+            try:
+                self.ipc_board_api.begin_transaction("MCP batch")
+            except Exception as e:
+                logger.warning(f"Could not open IPC transaction for batch: {e}")
+                use_transaction = False
 
-            if handler:
-                # Execute the command
-                result = handler(params)
-                logger.debug(f"Command result: {result}")
+        commit_error = None
+        try:
+            responses = self._run_batch_entries(entries)
+        finally:
+            if use_transaction:
+                commit_error = self._commit_batch_transaction(len(entries))
 
-                # Add backend indicator
-                if isinstance(result, dict):
-                    result["_backend"] = "swig"
-                    result["_realtime"] = False
+        if commit_error:
+            responses.append(
+                {
+                    "id": None,
+                    "result": {
+                        "success": False,
+                        "message": "Failed to commit batch to KiCAD",
+                        "errorDetails": commit_error,
+                    },
+                }
+            )
+        return responses
 
-                # Update board reference if command was successful
-                if result.get("success", False):
-                    if command == "create_project" or command == "open_project":
-                        logger.info("Updating board reference...")
-                        # Get board from the project commands handler
-                        self.board = self.project_commands.board
-                        self._update_command_handlers()
+    def _commit_batch_transaction(self, count):
+        """Push the batch's IPC commit, dropping it if the push fails
 
-                return result
-            else:
+        Returns the error message on failure, None on success.
+        """
+        try:
+            self.ipc_board_api.commit_transaction(f"MCP batch of {count} commands")
+            return None
+        except Exception as e:
+            logger.error(f"Could not commit IPC transaction for batch: {e}")
+            try:
+                self.ipc_board_api.rollback_transaction()
+            except Exception as rollback_error:
+                logger.warning(f"Could not roll back IPC transaction: {rollback_error}")
+                # Never leave later commands inside a dead commit
+                self.ipc_board_api._current_commit = None
+            return str(e)
+
+    def _run_batch_entries(self, entries):
+        """Run validated batch entries in order; see handle_batch"""
+        responses = []
+        index = 0
+        while index < len(entries):
+            request_id, command, params = entries[index]
+            if command is None:
+                responses.append({"id": request_id, "result": params})
+                index += 1
+                continue
+
+            # Consecutive component adds to one schematic share a single write
+            if command == "add_schematic_component":
+                end = index + 1
+                while (
+                    end < len(entries)
+                    and entries[end][1] == command
+                    and entries[end][2].get("schematicPath")
+                    == params.get("schematicPath")
+                ):
+                    end += 1
+                if end - index > 1:
+                    run = entries[index:end]
+                    results = self._add_schematic_components([e[2] for e in run])
+                    if results is not None:
+                        for (run_id, _, _), result in zip(run, results):
+                            result["_backend"] = "swig"
+                            result["_realtime"] = False
+                            responses.append({"id": run_id, "result": result})
+                        index = end
+                        continue
+
+            # kicad-cli has no long-running mode, so consecutive schematic PDF
+            # exports overlap their process startup and rendering instead
+            if command == "export_schematic_pdf":
+                output_paths = {params.get("outputPath")}
+                end = index + 1
+                while (
+                    end < len(entries)
+                    and entries[end][1] == command
+                    and entries[end][2].get("outputPath") not in output_paths
+                ):
+                    output_paths.add(entries[end][2].get("outputPath"))
+                    end += 1
+                if end - index > 1:
+                    run = entries[index:end]
+                    results = self._export_schematic_pdfs([e[2] for e in run])
+                    for (run_id, _, _), result in zip(run, results):
+                        responses.append({"id": run_id, "result": result})
+                    index = end
+                    continue
+
+            result = self.handle_command(command, params)
+            responses.append({"id": request_id, "result": result})
+            index += 1
+
+        return responses
+
+    def _export_schematic_pdfs(self, params_list):
+        """
+        Run several export_schematic_pdf requests concurrently, one kicad-cli
+        process per request and at most one per CPU. Results are returned in
+        request order.
+        """
+        import asyncio
+
+        async def export_all():
+            slots = asyncio.Semaphore(os.cpu_count() or 1)
+
+            async def export_one(params):
+                async with slots:
+                    return await self._export_schematic_pdf_async(params)
+
+            return await asyncio.gather(*(export_one(p) for p in params_list))
+
+        logger.info(f"Exporting {len(params_list)} schematics concurrently")
+        results = asyncio.run(export_all())
+        for result in results:
+            result["_backend"] = "swig"
+            result["_realtime"] = False
+        return results
+
+    def handle_command(self, command: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Route command to appropriate handler, preferring IPC when available"""
+        logger.info(f"Handling command: {command}")
+        # Payloads can be large; only preview them when DEBUG is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Command parameters: %s", _log_preview(params))
+
+        try:
+            # Get the handler for the command (IPC handlers were swapped in at
+            # init when the IPC backend is active)
+            handler = self._dispatch.get(command)
+            if handler is None:
                 logger.error(f"Unknown command: {command}")
                 return {
                     "success": False,
@@ -509,31 +963,85 @@ class KiCADInterface:
                     "errorDetails": "The specified command is not supported",
                 }
 
+            if isinstance(handler, tuple):
+                holder_attr, method_name = handler
+                handler = getattr(getattr(self, holder_attr), method_name)
+                # The holder now exists, so later calls can use the bound method
+                self._dispatch[command] = handler
+
+            # Execute the command
+            result = handler(params)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Command result: %s", _log_preview(result))
+
+            if command in _SCHEMATIC_WRITE_COMMANDS:
+                self._schematic_changed(params.get("schematicPath"))
+
+            # Add backend indicator
+            if isinstance(result, dict):
+                realtime = command in self._ipc_commands
+                result["_backend"] = "ipc" if realtime else "swig"
+                result["_realtime"] = realtime
+
+            return result
+
         except Exception as e:
-            # Get the full traceback
-            traceback_str = traceback.format_exc()
-            logger.error(f"Error handling command {command}: {str(e)}\n{traceback_str}")
+            logger.error(f"Error handling command {command}: {str(e)}", exc_info=True)
             return {
                 "success": False,
                 "message": f"Error handling command: {command}",
-                "errorDetails": f"{str(e)}\n{traceback_str}",
+                "errorDetails": _error_details(e, params),
             }
 
-    def _update_command_handlers(self):
-        """Update board reference in all command handlers"""
-        logger.debug("Updating board reference in command handlers")
-        self.project_commands.board = self.board
-        self.board_commands.board = self.board
-        self.component_commands.board = self.board
-        self.routing_commands.board = self.board
-        self.design_rule_commands.board = self.board
-        self.export_commands.board = self.board
+    @staticmethod
+    def _schematic_changed(schematic_path):
+        """Drop cached reads of a schematic that a command may have written"""
+        if not schematic_path:
+            return
+        abs_path = os.path.abspath(schematic_path)
+        for include_templates in (False, True):
+            _NETLIST_CACHE.pop((abs_path, include_templates), None)
+        _NET_INDEX_CACHE.pop(abs_path, None)
+
+        schematic_module = sys.modules.get("commands.schematic")
+        if schematic_module is not None:
+            schematic_module.SchematicManager.invalidate_cache(schematic_path)
+
+    def __getattr__(self, name):
+        """Construct a command handler from _HANDLER_SPECS on first access"""
+        spec = _HANDLER_SPECS.get(name)
+        if spec is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+        module_name, class_name, arg_names = spec
+        logger.debug(f"Loading command handler {module_name}.{class_name}")
+        handler_class = getattr(importlib.import_module(module_name), class_name)
+        handler = handler_class(*(getattr(self, arg) for arg in arg_names))
+        setattr(self, name, handler)
+        return handler
+
+    def _jlcpcb_parts_provider(self):
+        """Return the JLCPCB parts manager, opening its database if needed"""
+        return self.jlcpcb_parts
+
+    @property
+    def board(self):
+        """Board currently loaded by the project commands"""
+        return self._board_ref.board
+
+    @board.setter
+    def board(self, value):
+        self._board_ref.board = value
 
     # Schematic command handlers
     def _handle_create_schematic(self, params):
         """Create a new schematic"""
         logger.info("Creating schematic")
         try:
+            from commands.schematic import SchematicManager
+
             # Support multiple parameter naming conventions for compatibility:
             # - TypeScript tools use: name, path
             # - Python schema uses: filename, title
@@ -573,6 +1081,8 @@ class KiCADInterface:
         """Load an existing schematic"""
         logger.info("Loading schematic")
         try:
+            from commands.schematic import SchematicManager
+
             filename = params.get("filename")
 
             if not filename:
@@ -594,9 +1104,6 @@ class KiCADInterface:
         """Add a component to a schematic using text-based injection (no sexpdata)"""
         logger.info("Adding component to schematic")
         try:
-            from pathlib import Path
-            from commands.dynamic_symbol_loader import DynamicSymbolLoader
-
             schematic_path = params.get("schematicPath")
             component = params.get("component", {})
 
@@ -605,41 +1112,71 @@ class KiCADInterface:
             if not component:
                 return {"success": False, "message": "Component definition is required"}
 
-            comp_type = component.get("type", "R")
-            library = component.get("library", "Device")
-            reference = component.get("reference", "X?")
-            value = component.get("value", comp_type)
-            x = component.get("x", 0)
-            y = component.get("y", 0)
-
-            loader = DynamicSymbolLoader()
-            loader.add_component(
+            args = self._schematic_component_args(component)
+            self.symbol_loader.add_component(
                 Path(schematic_path),
-                library,
-                comp_type,
-                reference=reference,
-                value=value,
-                x=x,
-                y=y,
+                args["library_name"],
+                args["symbol_name"],
+                reference=args["reference"],
+                value=args["value"],
+                x=args["x"],
+                y=args["y"],
             )
 
-            return {
-                "success": True,
-                "component_reference": reference,
-                "symbol_source": f"{library}:{comp_type}",
-            }
+            return self._schematic_component_result(args)
         except Exception as e:
-            logger.error(f"Error adding component to schematic: {str(e)}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error adding component to schematic: {str(e)}")
             return {"success": False, "message": str(e)}
 
+    def _add_schematic_components(self, params_list):
+        """
+        Add a run of add_schematic_component requests for one schematic with a
+        single write. Returns None if the run cannot be applied as a whole, in
+        which case nothing was written.
+        """
+        schematic_path = params_list[0].get("schematicPath")
+        components = [params.get("component") for params in params_list]
+        if not schematic_path or not all(components):
+            return None
+
+        args_list = [self._schematic_component_args(c) for c in components]
+        try:
+            self.symbol_loader.add_components(Path(schematic_path), args_list)
+        except Exception as e:
+            logger.warning(
+                f"Batched component add failed, adding one at a time: {str(e)}"
+            )
+            return None
+
+        self._schematic_changed(schematic_path)
+        logger.info(f"Added {len(args_list)} components to {schematic_path}")
+        return [self._schematic_component_result(args) for args in args_list]
+
+    @staticmethod
+    def _schematic_component_args(component):
+        """Map an add_schematic_component definition to loader arguments"""
+        comp_type = component.get("type", "R")
+        return {
+            "library_name": component.get("library", "Device"),
+            "symbol_name": comp_type,
+            "reference": component.get("reference", "X?"),
+            "value": component.get("value", comp_type),
+            "x": component.get("x", 0),
+            "y": component.get("y", 0),
+        }
+
+    @staticmethod
+    def _schematic_component_result(args):
+        return {
+            "success": True,
+            "component_reference": args["reference"],
+            "symbol_source": f"{args['library_name']}:{args['symbol_name']}",
+        }
+
     def _handle_add_schematic_wire(self, params):
         """Add a wire to a schematic using WireManager"""
         logger.info("Adding wire to schematic")
         try:
-            from pathlib import Path
             from commands.wire_manager import WireManager
 
             schematic_path = params.get("schematicPath")
@@ -673,20 +1210,21 @@ class KiCADInterface:
             else:
                 return {"success": False, "message": "Failed to add wire"}
         except Exception as e:
-            logger.error(f"Error adding wire to schematic: {str(e)}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error adding wire to schematic: {str(e)}")
             return {
                 "success": False,
                 "message": str(e),
-                "errorDetails": traceback.format_exc(),
+                "errorDetails": _error_details(e, params),
             }
 
     def _handle_list_schematic_libraries(self, params):
         """List available symbol libraries"""
         logger.info("Listing schematic libraries")
         try:
+            from commands.library_schematic import (
+                LibraryManager as SchematicLibraryManager,
+            )
+
             search_paths = params.get("searchPaths")
 
             libraries = SchematicLibraryManager.list_available_libraries(search_paths)
@@ -695,64 +1233,116 @@ class KiCADInterface:
             logger.error(f"Error listing schematic libraries: {str(e)}")
             return {"success": False, "message": str(e)}
 
-    def _handle_export_schematic_pdf(self, params):
-        """Export schematic to PDF"""
-        logger.info("Exporting schematic to PDF")
-        try:
-            schematic_path = params.get("schematicPath")
-            output_path = params.get("outputPath")
-
-            if not schematic_path:
-                return {"success": False, "message": "Schematic path is required"}
-            if not output_path:
-                return {"success": False, "message": "Output path is required"}
-
-            import subprocess
-
-            resolved_cli = resolve_kicad_cli()
-            if not resolved_cli.get("found"):
-                searched_paths = resolved_cli.get("searched", [])
-                return {
+    @staticmethod
+    def _schematic_pdf_command(params):
+        """
+        Build the kicad-cli command line for export_schematic_pdf
+
+        Returns:
+            (command, resolved kicad-cli info, None), or (None, None, error
+            result) if the request cannot be run
+        """
+        schematic_path = params.get("schematicPath")
+        output_path = params.get("outputPath")
+
+        if not schematic_path:
+            error = {"success": False, "message": "Schematic path is required"}
+            return None, None, error
+        if not output_path:
+            error = {"success": False, "message": "Output path is required"}
+            return None, None, error
+
+        resolved_cli = resolve_kicad_cli()
+        if not resolved_cli.get("found"):
+            searched_paths = resolved_cli.get("searched", [])
+            return (
+                None,
+                None,
+                {
                     "success": False,
                     "message": "kicad-cli not found",
                     "errorDetails": "Searched paths: " + ", ".join(searched_paths),
-                }
+                },
+            )
 
-            cmd = [
-                resolved_cli["path"],
-                "sch",
-                "export",
-                "pdf",
-                "--output",
-                output_path,
-                schematic_path,
-            ]
+        cmd = [
+            resolved_cli["path"],
+            "sch",
+            "export",
+            "pdf",
+            "--output",
+            output_path,
+            schematic_path,
+        ]
+        return cmd, resolved_cli, None
+
+    @staticmethod
+    def _schematic_pdf_result(returncode, stdout, stderr, resolved_cli):
+        """
+        Build the export_schematic_pdf result from a finished kicad-cli run.
+
+        The output is raw bytes and is only decoded when the run failed.
+        """
+        if returncode == 0:
+            return {
+                "success": True,
+                "message": "",
+                "cliPath": resolved_cli["path"],
+            }
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60,
+        stderr = (stderr or b"").decode("utf-8", errors="replace").strip()
+        stdout = (stdout or b"").decode("utf-8", errors="replace").strip()
+        return {
+            "success": False,
+            "message": stderr or stdout or "kicad-cli failed",
+            "errorDetails": {
+                "cliPath": resolved_cli["path"],
+                "searched": resolved_cli.get("searched", []),
+            },
+        }
+
+    def _handle_export_schematic_pdf(self, params):
+        """Export schematic to PDF"""
+        logger.info("Exporting schematic to PDF")
+        try:
+            cmd, resolved_cli, error = self._schematic_pdf_command(params)
+            if error is not None:
+                return error
+
+            result = subprocess.run(cmd, capture_output=True, timeout=60)
+            return self._schematic_pdf_result(
+                result.returncode, result.stdout, result.stderr, resolved_cli
             )
+        except Exception as e:
+            logger.error(f"Error exporting schematic to PDF: {str(e)}")
+            return {"success": False, "message": str(e)}
 
-            success = result.returncode == 0
-            if success:
-                return {
-                    "success": True,
-                    "message": "",
-                    "cliPath": resolved_cli["path"],
-                }
+    async def _export_schematic_pdf_async(self, params):
+        """export_schematic_pdf on the running asyncio loop; see _export_schematic_pdfs"""
+        import asyncio
 
-            stderr = (result.stderr or "").strip()
-            stdout = (result.stdout or "").strip()
-            return {
-                "success": False,
-                "message": stderr or stdout or "kicad-cli failed",
-                "errorDetails": {
-                    "cliPath": resolved_cli["path"],
-                    "searched": resolved_cli.get("searched", []),
-                },
-            }
+        try:
+            cmd, resolved_cli, error = self._schematic_pdf_command(params)
+            if error is not None:
+                return error
+
+            # communicate() drains both pipes together, so a chatty kicad-cli
+            # cannot block on a full pipe
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=60)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise TimeoutError(f"kicad-cli timed out after 60 seconds: {cmd}")
+
+            return self._schematic_pdf_result(
+                proc.returncode, stdout, stderr, resolved_cli
+            )
         except Exception as e:
             logger.error(f"Error exporting schematic to PDF: {str(e)}")
             return {"success": False, "message": str(e)}
@@ -760,6 +1350,8 @@ class KiCADInterface:
     def _handle_auto_layout_schematic(self, params):
         logger.info("Auto-layout schematic")
         try:
+            from commands.schematic_quality import SchematicQualityManager
+
             schematic_path = params.get("schematicPath")
             if not schematic_path:
                 return {"success": False, "message": "Schematic path is required"}
@@ -782,6 +1374,8 @@ class KiCADInterface:
     def _handle_validate_schematic(self, params):
         logger.info("Validate schematic")
         try:
+            from commands.schematic_quality import SchematicQualityManager
+
             schematic_path = params.get("schematicPath")
             if not schematic_path:
                 return {"success": False, "message": "Schematic path is required"}
@@ -798,22 +1392,20 @@ class KiCADInterface:
     def _handle_add_schematic_connection(self, params):
         """Add a pin-to-pin connection in schematic with automatic pin discovery and routing"""
         logger.info("Adding pin-to-pin connection in schematic")
-        try:
-            from pathlib import Path
+        schematic_path = params.get("schematicPath")
+        source_ref = params.get("sourceRef")
+        source_pin = params.get("sourcePin")
+        target_ref = params.get("targetRef")
+        target_pin = params.get("targetPin")
+        routing = params.get(
+            "routing", "direct"
+        )  # 'direct', 'orthogonal_h', 'orthogonal_v'
+
+        if not all([schematic_path, source_ref, source_pin, target_ref, target_pin]):
+            return {"success": False, "message": "Missing required parameters"}
 
-            schematic_path = params.get("schematicPath")
-            source_ref = params.get("sourceRef")
-            source_pin = params.get("sourcePin")
-            target_ref = params.get("targetRef")
-            target_pin = params.get("targetPin")
-            routing = params.get(
-                "routing", "direct"
-            )  # 'direct', 'orthogonal_h', 'orthogonal_v'
-
-            if not all(
-                [schematic_path, source_ref, source_pin, target_ref, target_pin]
-            ):
-                return {"success": False, "message": "Missing required parameters"}
+        try:
+            from commands.connection_schematic import ConnectionManager
 
             # Use ConnectionManager with new PinLocator and WireManager integration
             success = ConnectionManager.add_connection(
@@ -842,33 +1434,29 @@ class KiCADInterface:
                     "errorDetails": details,
                 }
         except Exception as e:
-            logger.error(f"Error adding schematic connection: {str(e)}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error adding schematic connection: {str(e)}")
             return {
                 "success": False,
                 "message": str(e),
-                "errorDetails": traceback.format_exc(),
+                "errorDetails": _error_details(e, params),
             }
 
     def _handle_add_schematic_net_label(self, params):
         """Add a net label to schematic using WireManager"""
         logger.info("Adding net label to schematic")
-        try:
-            from pathlib import Path
-            from commands.wire_manager import WireManager
+        schematic_path = params.get("schematicPath")
+        net_name = params.get("netName")
+        position = params.get("position")
+        label_type = params.get(
+            "labelType", "label"
+        )  # 'label', 'global_label', 'hierarchical_label'
+        orientation = params.get("orientation", 0)  # 0, 90, 180, 270
 
-            schematic_path = params.get("schematicPath")
-            net_name = params.get("netName")
-            position = params.get("position")
-            label_type = params.get(
-                "labelType", "label"
-            )  # 'label', 'global_label', 'hierarchical_label'
-            orientation = params.get("orientation", 0)  # 0, 90, 180, 270
+        if not all([schematic_path, net_name, position]):
+            return {"success": False, "message": "Missing required parameters"}
 
-            if not all([schematic_path, net_name, position]):
-                return {"success": False, "message": "Missing required parameters"}
+        try:
+            from commands.wire_manager import WireManager
 
             # Use WireManager for S-expression manipulation
             success = WireManager.add_label(
@@ -887,29 +1475,26 @@ class KiCADInterface:
             else:
                 return {"success": False, "message": "Failed to add net label"}
         except Exception as e:
-            logger.error(f"Error adding net label: {str(e)}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error adding net label: {str(e)}")
             return {
                 "success": False,
                 "message": str(e),
-                "errorDetails": traceback.format_exc(),
+                "errorDetails": _error_details(e, params),
             }
 
     def _handle_connect_to_net(self, params):
         """Connect a component pin to a named net using wire stub and label"""
         logger.info("Connecting component pin to net")
-        try:
-            from pathlib import Path
+        schematic_path = params.get("schematicPath")
+        component_ref = params.get("componentRef")
+        pin_name = params.get("pinName")
+        net_name = params.get("netName")
 
-            schematic_path = params.get("schematicPath")
-            component_ref = params.get("componentRef")
-            pin_name = params.get("pinName")
-            net_name = params.get("netName")
+        if not all([schematic_path, component_ref, pin_name, net_name]):
+            return {"success": False, "message": "Missing required parameters"}
 
-            if not all([schematic_path, component_ref, pin_name, net_name]):
-                return {"success": False, "message": "Missing required parameters"}
+        try:
+            from commands.connection_schematic import ConnectionManager
 
             # Use ConnectionManager with new WireManager integration
             success = ConnectionManager.connect_to_net(
@@ -933,31 +1518,49 @@ class KiCADInterface:
                     "errorDetails": details,
                 }
         except Exception as e:
-            logger.error(f"Error connecting to net: {str(e)}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error connecting to net: {str(e)}")
             return {
                 "success": False,
                 "message": str(e),
-                "errorDetails": traceback.format_exc(),
+                "errorDetails": _error_details(e, params),
             }
 
     def _handle_get_net_connections(self, params):
         """Get all connections for a named net"""
         logger.info("Getting net connections")
+        schematic_path = params.get("schematicPath")
+        net_name = params.get("netName")
+
+        if not all([schematic_path, net_name]):
+            return {"success": False, "message": "Missing required parameters"}
+
         try:
-            schematic_path = params.get("schematicPath")
-            net_name = params.get("netName")
+            from commands.schematic import SchematicManager
+            from commands.connection_schematic import ConnectionManager
 
-            if not all([schematic_path, net_name]):
-                return {"success": False, "message": "Missing required parameters"}
+            # Index every net at once so further queries on the same
+            # schematic version are dict lookups
+            abs_path = os.path.abspath(schematic_path)
+            try:
+                st = os.stat(schematic_path)
+                signature = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                signature = None
+
+            cached = _NET_INDEX_CACHE.get(abs_path)
+            if signature is not None and cached is not None and cached[0] == signature:
+                _NET_INDEX_CACHE.move_to_end(abs_path)
+                net_index = cached[1]
+            else:
+                schematic = SchematicManager.load_schematic_cached(schematic_path)
+                if not schematic:
+                    return {"success": False, "message": "Failed to load schematic"}
 
-            schematic = SchematicManager.load_schematic(schematic_path)
-            if not schematic:
-                return {"success": False, "message": "Failed to load schematic"}
+                net_index = ConnectionManager.get_net_index(schematic)
+                if signature is not None:
+                    _cache_store(_NET_INDEX_CACHE, abs_path, (signature, net_index))
 
-            connections = ConnectionManager.get_net_connections(schematic, net_name)
+            connections = net_index.get(net_name, [])
             return {"success": True, "connections": connections}
         except Exception as e:
             logger.error(f"Error getting net connections: {str(e)}")
@@ -966,21 +1569,40 @@ class KiCADInterface:
     def _handle_generate_netlist(self, params):
         """Generate netlist from schematic"""
         logger.info("Generating netlist from schematic")
-        try:
-            schematic_path = params.get("schematicPath")
+        schematic_path = params.get("schematicPath")
 
-            if not schematic_path:
-                return {"success": False, "message": "Schematic path is required"}
+        if not schematic_path:
+            return {"success": False, "message": "Schematic path is required"}
+
+        try:
+            from commands.schematic import SchematicManager
+            from commands.connection_schematic import ConnectionManager
 
-            schematic = SchematicManager.load_schematic(schematic_path)
+            include_templates = bool(params.get("includeTemplates", False))
+            cache_key = (os.path.abspath(schematic_path), include_templates)
+            try:
+                st = os.stat(schematic_path)
+                signature = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                signature = None
+
+            cached = _NETLIST_CACHE.get(cache_key)
+            if signature is not None and cached is not None and cached[0] == signature:
+                _NETLIST_CACHE.move_to_end(cache_key)
+                logger.debug(f"Using cached netlist for {schematic_path}")
+                return {"success": True, "netlist": cached[1]}
+
+            schematic = SchematicManager.load_schematic_cached(schematic_path)
             if not schematic:
                 return {"success": False, "message": "Failed to load schematic"}
 
             netlist = ConnectionManager.generate_netlist(
                 schematic,
                 schematic_path=Path(schematic_path),
-                include_templates=bool(params.get("includeTemplates", False)),
+                include_templates=include_templates,
             )
+            if signature is not None:
+                _cache_store(_NETLIST_CACHE, cache_key, (signature, netlist))
             return {"success": True, "netlist": netlist}
         except Exception as e:
             logger.error(f"Error generating netlist: {str(e)}")
@@ -988,11 +1610,16 @@ class KiCADInterface:
 
     def _handle_check_kicad_ui(self, params):
         """Check if KiCAD UI is running"""
+        global _kicad_status
         logger.info("Checking if KiCAD UI is running")
         try:
-            manager = KiCADProcessManager()
-            is_running = manager.is_running()
-            processes = manager.get_process_info() if is_running else []
+            now = time.monotonic()
+            if _kicad_status is not None and now - _kicad_status[0] < KICAD_STATUS_TTL:
+                _, is_running, processes = _kicad_status
+            else:
+                is_running = KiCADProcessManager.is_running()
+                processes = KiCADProcessManager.get_process_info() if is_running else []
+                _kicad_status = (now, is_running, processes)
 
             return {
                 "success": True,
@@ -1012,11 +1639,10 @@ class KiCADInterface:
             auto_launch = params.get("autoLaunch", AUTO_LAUNCH_KICAD)
 
             # Convert project path to Path object if provided
-            from pathlib import Path
-
             path_obj = Path(project_path) if project_path else None
 
             result = check_and_launch_kicad(path_obj, auto_launch)
+            _invalidate_kicad_status()
 
             return {"success": True, **result}
         except Exception as e:
@@ -1030,8 +1656,6 @@ class KiCADInterface:
             schematic_path = params.get("schematicPath")
             project_path = params.get("projectPath")
 
-            from pathlib import Path
-
             target_path: Optional[Path] = None
             if schematic_path:
                 target_path = Path(schematic_path)
@@ -1073,6 +1697,7 @@ class KiCADInterface:
                 result.get("openedProject", result.get("running", False))
             )
             opened_editor = KiCADProcessManager.open_schematic_editor(target_path)
+            _invalidate_kicad_status()
 
             return {
                 "success": opened_project and opened_editor,
@@ -1245,15 +1870,10 @@ class KiCADInterface:
                     "message": "At least 3 points are required for copper pour outline",
                 }
 
-            # Convert points format if needed (handle both {x, y} and {x, y, unit})
-            formatted_points = []
-            for point in points:
-                formatted_points.append(
-                    {"x": point.get("x", 0), "y": point.get("y", 0)}
-                )
-
+            # add_zone reads only x/y from each point (any unit key is
+            # ignored), so the points are passed through without a copy
             success = self.ipc_board_api.add_zone(
-                points=formatted_points,
+                points=points,
                 layer=layer,
                 net_name=net,
                 clearance=clearance,
@@ -1354,19 +1974,16 @@ class KiCADInterface:
         """IPC handler for get_board_info"""
         try:
             size = self.ipc_board_api.get_size()
-            components = self.ipc_board_api.list_components()
-            tracks = self.ipc_board_api.get_tracks()
-            vias = self.ipc_board_api.get_vias()
-            nets = self.ipc_board_api.get_nets()
+            counts = self.ipc_board_api.get_item_counts()
 
             return {
                 "success": True,
                 "boardInfo": {
                     "size": size,
-                    "componentCount": len(components),
-                    "trackCount": len(tracks),
-                    "viaCount": len(vias),
-                    "netCount": len(nets),
+                    "componentCount": counts["components"],
+                    "trackCount": counts["tracks"],
+                    "viaCount": counts["vias"],
+                    "netCount": counts["nets"],
                     "backend": "ipc",
                     "realtime": True,
                 },
@@ -1514,14 +2131,9 @@ class KiCADInterface:
 
     def _ipc_add_board_outline(self, params):
         """IPC handler for add_board_outline - adds board edge with real-time UI update"""
+        if BoardSegment is None:
+            return {"success": False, "message": "kicad-python (kipy) is not installed"}
         try:
-            from kipy.board_types import BoardSegment
-            from kipy.geometry import Vector2
-            from kipy.util.units import from_mm
-            from kipy.proto.board.board_types_pb2 import BoardLayer
-
-            board = self.ipc_board_api._get_board()
-
             points = params.get("points", [])
             width = params.get("width", 0.1)
 
@@ -1531,28 +2143,25 @@ class KiCADInterface:
                     "message": "At least 2 points required for board outline",
                 }
 
-            commit = board.begin_commit()
-            lines_created = 0
-
-            # Create line segments connecting the points
-            for i in range(len(points)):
-                start = points[i]
-                end = points[(i + 1) % len(points)]  # Wrap around to close the outline
-
+            # Build every line segment first so the whole outline is sent in
+            # a single create_items call
+            stroke_width = from_mm(width)
+            vertices = [
+                Vector2.from_xy(from_mm(point.get("x", 0)), from_mm(point.get("y", 0)))
+                for point in points
+            ]
+            segments = []
+            for i, start in enumerate(vertices):
                 segment = BoardSegment()
-                segment.start = Vector2.from_xy(
-                    from_mm(start.get("x", 0)), from_mm(start.get("y", 0))
-                )
-                segment.end = Vector2.from_xy(
-                    from_mm(end.get("x", 0)), from_mm(end.get("y", 0))
-                )
+                segment.start = start
+                # Wrap around to close the outline
+                segment.end = vertices[(i + 1) % len(vertices)]
                 segment.layer = BoardLayer.BL_Edge_Cuts
-                segment.attributes.stroke.width = from_mm(width)
+                segment.attributes.stroke.width = stroke_width
+                segments.append(segment)
 
-                board.create_items(segment)
-                lines_created += 1
-
-            board.push_commit(commit, "Added board outline")
+            self.ipc_board_api.create_items(segments, "Added board outline")
+            lines_created = len(segments)
 
             return {
                 "success": True,
@@ -1565,20 +2174,13 @@ class KiCADInterface:
 
     def _ipc_add_mounting_hole(self, params):
         """IPC handler for add_mounting_hole - adds mounting hole with real-time UI update"""
+        if BoardCircle is None:
+            return {"success": False, "message": "kicad-python (kipy) is not installed"}
         try:
-            from kipy.board_types import BoardCircle
-            from kipy.geometry import Vector2
-            from kipy.util.units import from_mm
-            from kipy.proto.board.board_types_pb2 import BoardLayer
-
-            board = self.ipc_board_api._get_board()
-
             x = params.get("x", 0)
             y = params.get("y", 0)
             diameter = params.get("diameter", 3.2)  # M3 hole default
 
-            commit = board.begin_commit()
-
             # Create circle on Edge.Cuts layer for the hole
             circle = BoardCircle()
             circle.center = Vector2.from_xy(from_mm(x), from_mm(y))
@@ -1586,8 +2188,9 @@ class KiCADInterface:
             circle.layer = BoardLayer.BL_Edge_Cuts
             circle.attributes.stroke.width = from_mm(0.1)
 
-            board.create_items(circle)
-            board.push_commit(commit, f"Added mounting hole at ({x}, {y})")
+            self.ipc_board_api.create_items(
+                circle, f"Added mounting hole at ({x}, {y})"
+            )
 
             return {
                 "success": True,
@@ -1614,34 +2217,21 @@ class KiCADInterface:
             reference = params.get("reference", params.get("componentId", ""))
             angle = params.get("angle", params.get("rotation", 90))
 
-            # Get current component to find its position
-            components = self.ipc_board_api.list_components()
-            target = None
-            for comp in components:
-                if comp.get("reference") == reference:
-                    target = comp
-                    break
-
-            if not target:
-                return {"success": False, "message": f"Component {reference} not found"}
-
-            # Calculate new rotation
-            current_rotation = target.get("rotation", 0)
-            new_rotation = (current_rotation + angle) % 360
-
-            # Use move_component with new rotation (position stays the same)
-            success = self.ipc_board_api.move_component(
-                reference=reference,
-                x=target.get("position", {}).get("x", 0),
-                y=target.get("position", {}).get("y", 0),
-                rotation=new_rotation,
-            )
+            # Read-modify-write of the orientation only; the position is
+            # left untouched
+            new_rotation = self.ipc_board_api.rotate_component(reference, angle)
+            if new_rotation is None:
+                # Only a failed rotation pays for the lookup that tells a
+                # missing reference apart from an IPC error
+                if self.ipc_board_api.get_component(reference) is None:
+                    message = f"Component {reference} not found"
+                else:
+                    message = "Failed to rotate component"
+                return {"success": False, "message": message, "newRotation": None}
 
             return {
-                "success": success,
-                "message": f"Rotated component {reference} by {angle}° (visible in KiCAD UI)"
-                if success
-                else "Failed to rotate component",
+                "success": True,
+                "message": f"Rotated component {reference} by {angle}° (visible in KiCAD UI)",
                 "newRotation": new_rotation,
             }
         except Exception as e:
@@ -1653,12 +2243,7 @@ class KiCADInterface:
         try:
             reference = params.get("reference", params.get("componentId", ""))
 
-            components = self.ipc_board_api.list_components()
-            target = None
-            for comp in components:
-                if comp.get("reference") == reference:
-                    target = comp
-                    break
+            target = self.ipc_board_api.get_component(reference)
 
             if not target:
                 return {"success": False, "message": f"Component {reference} not found"}
@@ -1687,21 +2272,68 @@ class KiCADInterface:
             else "Using SWIG backend (requires manual reload)",
         }
 
+    def _ipc_add_batch(self, params, key, kind, parse, method):
+        """Add every entry of params[key] with one IPC commit"""
+        if not self.use_ipc or not self.ipc_board_api:
+            return {"success": False, "message": "IPC backend not available"}
+
+        entries = params.get(key)
+        if not isinstance(entries, list):
+            return {"success": False, "message": f"{key} must be a list"}
+
+        try:
+            add_many = getattr(self.ipc_board_api, method)
+            result = add_many(list(map(parse, entries)))
+            failed = result["failed_indices"]
+            return {
+                "success": not failed,
+                "message": f"Added {result['added']} of {len(entries)} {kind}s"
+                " (visible in KiCAD UI)",
+                "added": result["added"],
+                "failed_indices": failed,
+                "realtime": True,
+            }
+        except Exception as e:
+            logger.error(f"Error adding {kind}s via IPC: {e}")
+            return {"success": False, "message": str(e)}
+
+    def _handle_ipc_add_tracks_batch(self, params):
+        """Add several tracks using IPC backend, in one commit"""
+        return self._ipc_add_batch(
+            params,
+            "tracks",
+            "track",
+            _parse_add_track,
+            "add_tracks",
+        )
+
+    def _handle_ipc_add_vias_batch(self, params):
+        """Add several vias using IPC backend, in one commit"""
+        return self._ipc_add_batch(
+            params,
+            "vias",
+            "via",
+            _parse_add_via,
+            "add_vias",
+        )
+
+    def _handle_ipc_add_texts_batch(self, params):
+        """Add several text items using IPC backend, in one commit"""
+        return self._ipc_add_batch(
+            params,
+            "texts",
+            "text",
+            _parse_add_text,
+            "add_texts",
+        )
+
     def _handle_ipc_add_track(self, params):
         """Add a track using IPC backend (real-time)"""
         if not self.use_ipc or not self.ipc_board_api:
             return {"success": False, "message": "IPC backend not available"}
 
         try:
-            success = self.ipc_board_api.add_track(
-                start_x=params.get("startX", 0),
-                start_y=params.get("startY", 0),
-                end_x=params.get("endX", 0),
-                end_y=params.get("endY", 0),
-                width=params.get("width", 0.25),
-                layer=params.get("layer", "F.Cu"),
-                net_name=params.get("net"),
-            )
+            success = self.ipc_board_api.add_track(*_parse_add_track(params))
             return {
                 "success": success,
                 "message": "Track added (visible in KiCAD UI)"
@@ -1719,14 +2351,7 @@ class KiCADInterface:
             return {"success": False, "message": "IPC backend not available"}
 
         try:
-            success = self.ipc_board_api.add_via(
-                x=params.get("x", 0),
-                y=params.get("y", 0),
-                diameter=params.get("diameter", 0.8),
-                drill=params.get("drill", 0.4),
-                net_name=params.get("net"),
-                via_type=params.get("type", "through"),
-            )
+            success = self.ipc_board_api.add_via(*_parse_add_via(params))
             return {
                 "success": success,
                 "message": "Via added (visible in KiCAD UI)"
@@ -1744,14 +2369,7 @@ class KiCADInterface:
             return {"success": False, "message": "IPC backend not available"}
 
         try:
-            success = self.ipc_board_api.add_text(
-                text=params.get("text", ""),
-                x=params.get("x", 0),
-                y=params.get("y", 0),
-                layer=params.get("layer", "F.SilkS"),
-                size=params.get("size", 1.0),
-                rotation=params.get("rotation", 0),
-            )
+            success = self.ipc_board_api.add_text(*_parse_add_text(params))
             return {
                 "success": success,
                 "message": "Text added (visible in KiCAD UI)"
@@ -1816,134 +2434,131 @@ class KiCADInterface:
 
     # JLCPCB API handlers
 
+    def _public_jlcpcb_estimate(self):
+        """Estimate for a public (yaqwsx) snapshot download, without remote checks"""
+        public_cache_dir = self._get_yaqwsx_cache_dir()
+
+        # Reused across requests until the archive cache changes or the TTL
+        # runs out
+        try:
+            st = os.stat(os.path.join(public_cache_dir, "cache_manifest.json"))
+            key = (public_cache_dir, st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = (public_cache_dir, None, None)
+
+        now = time.monotonic()
+        cached = self._public_estimate_cache
+        if (
+            cached is not None
+            and cached[0] == key
+            and now - cached[1] < self.PUBLIC_ESTIMATE_TTL
+        ):
+            return dict(cached[2])
+
+        estimate = self.jlcpcb_client.estimate_yaqwsx_update(
+            public_cache_dir,
+            include_remote_check=False,
+        )
+        known_total_parts = self.jlcpcb_parts.cached_metadata(
+            "yaqwsx_last_total_parts"
+        )
+        if known_total_parts:
+            try:
+                estimate["expectedTotalParts"] = int(known_total_parts)
+            except Exception:
+                pass
+        estimate["source"] = "public"
+        estimate["cacheDirectory"] = public_cache_dir
+        estimate["recommendedUseCase"] = (
+            "Use when official credentials are unavailable; hosted snapshot from yaqwsx/jlcparts with incremental archive updates."
+        )
+        self._public_estimate_cache = (key, now, estimate)
+        return dict(estimate)
+
+    @staticmethod
+    def _official_jlcpcb_estimate(public_estimate):
+        """Estimate for an official API download, derived from the public one"""
+        estimated_download_mb = round(
+            float(public_estimate.get("downloadSizeMB", 0.0)), 1
+        )
+        return {
+            "source": "official",
+            "available": HAS_OFFICIAL_JLCPCB_CREDS,
+            "estimatedPartCount": {
+                "min": 6500000,
+                "max": 7500000,
+                "note": "Signed API full-catalog estimate; recent snapshots are around 7 million parts.",
+            },
+            "estimatedInStockParts": int(
+                public_estimate.get("estimatedInStockParts", 650000)
+            ),
+            "estimatedBasicParts": int(public_estimate.get("estimatedBasicParts", 350)),
+            "estimatedExtendedParts": int(
+                public_estimate.get("estimatedExtendedParts", 6999650)
+            ),
+            "estimatedDownloadSizeMB": estimated_download_mb,
+            "estimatedDatabaseSizeMB": round(
+                float(public_estimate.get("estimatedDatabaseSizeMB", 1800)), 1
+            ),
+            "estimatedDownloadTimeMinutes": public_estimate.get(
+                "estimatedDownloadTimeMinutes",
+                {
+                    "min": 0,
+                    "max": 0,
+                    "note": "No estimate available",
+                },
+            ),
+            "recommendedUseCase": "Use when you have valid API credentials and want upstream-signed full catalog data.",
+        }
+
+    def _handle_get_jlcpcb_estimates(self, params):
+        """Get download estimates for both JLCPCB sources"""
+        try:
+            public_estimate = self._public_jlcpcb_estimate()
+            return {
+                "success": True,
+                "options": {
+                    "official": self._official_jlcpcb_estimate(public_estimate),
+                    "public": public_estimate,
+                },
+            }
+        except Exception as e:
+            logger.error(f"Error estimating JLCPCB download: {e}", exc_info=True)
+            return {
+                "success": False,
+                "message": f"Failed to estimate download: {str(e)}",
+            }
+
     def _handle_download_jlcpcb_database(self, params):
         try:
             force = params.get("force", False)
             source = params.get("source", "auto")
+            # Imports take minutes; the TypeScript tools pass background=true
+            # so they run on a worker thread and the stdin loop keeps
+            # answering status polls. Direct callers block by default.
             background = params.get("background", False)
             confirm = params.get("confirm", False)
             internal_worker = params.get("_internal_worker", False)
 
-            if (
-                self.jlcpcb_download_thread is not None
-                and self.jlcpcb_download_thread.is_alive()
-                and not internal_worker
-            ):
-                now = time.time()
-                started = self.jlcpcb_download_status.get("startedAt")
-                elapsed = (
-                    round(now - float(started), 1)
-                    if started is not None
-                    else self.jlcpcb_download_status.get("elapsedSeconds", 0)
-                )
-                status = dict(self.jlcpcb_download_status)
-                status.update(
-                    {"isRunning": True, "elapsedSeconds": elapsed, "lastUpdated": now}
-                )
-                self.jlcpcb_download_status.update(
-                    {"isRunning": True, "elapsedSeconds": elapsed, "lastUpdated": now}
-                )
-                return {
-                    "success": False,
-                    "started": False,
-                    "message": "JLCPCB download is already running",
-                    "status": status,
-                }
-
-            if self.jlcpcb_download_status.get("isRunning") and not internal_worker:
-                now = time.time()
-                started = self.jlcpcb_download_status.get("startedAt")
-                elapsed = (
-                    round(now - float(started), 1)
-                    if started is not None
-                    else self.jlcpcb_download_status.get("elapsedSeconds", 0)
-                )
-                status = dict(self.jlcpcb_download_status)
-                status.update({"elapsedSeconds": elapsed, "lastUpdated": now})
-                self.jlcpcb_download_status.update(
-                    {"elapsedSeconds": elapsed, "lastUpdated": now}
+            # Polls during a download get the worker's last published status
+            # as-is; its elapsedSeconds is refreshed by the worker itself
+            if not internal_worker and (
+                self.jlcpcb_download_status.get("isRunning")
+                or (
+                    self.jlcpcb_download_thread is not None
+                    and self.jlcpcb_download_thread.is_alive()
                 )
+            ):
                 return {
                     "success": False,
                     "started": False,
                     "message": "JLCPCB download is already running",
-                    "status": status,
+                    "status": self.jlcpcb_download_status,
                 }
 
-            has_official_creds = all(
-                [
-                    os.getenv("JLCPCB_APP_ID"),
-                    os.getenv("JLCPCB_API_KEY"),
-                    os.getenv("JLCPCB_API_SECRET"),
-                ]
-            )
+            has_official_creds = HAS_OFFICIAL_JLCPCB_CREDS
 
-            cached_public_estimate = None
-            public_cache_dir = os.path.join(
-                os.path.dirname(self.jlcpcb_parts.db_path),
-                "yaqwsx_archive_cache",
-            )
-            os.makedirs(public_cache_dir, exist_ok=True)
-
-            def get_public_estimate():
-                nonlocal cached_public_estimate
-                if cached_public_estimate is None:
-                    cached_public_estimate = self.jlcpcb_client.estimate_yaqwsx_update(
-                        public_cache_dir,
-                        include_remote_check=False,
-                    )
-                    known_total_parts = self.jlcpcb_parts.get_metadata(
-                        "yaqwsx_last_total_parts"
-                    )
-                    if known_total_parts:
-                        try:
-                            cached_public_estimate["expectedTotalParts"] = int(
-                                known_total_parts
-                            )
-                        except Exception:
-                            pass
-                    cached_public_estimate["source"] = "public"
-                    cached_public_estimate["cacheDirectory"] = public_cache_dir
-                    cached_public_estimate["recommendedUseCase"] = (
-                        "Use when official credentials are unavailable; hosted snapshot from yaqwsx/jlcparts with incremental archive updates."
-                    )
-                return cached_public_estimate
-
-            def build_official_estimate(public_estimate):
-                estimated_download_mb = round(
-                    float(public_estimate.get("downloadSizeMB", 0.0)), 1
-                )
-                return {
-                    "source": "official",
-                    "available": has_official_creds,
-                    "estimatedPartCount": {
-                        "min": 6500000,
-                        "max": 7500000,
-                        "note": "Signed API full-catalog estimate; recent snapshots are around 7 million parts.",
-                    },
-                    "estimatedInStockParts": int(
-                        public_estimate.get("estimatedInStockParts", 650000)
-                    ),
-                    "estimatedBasicParts": int(
-                        public_estimate.get("estimatedBasicParts", 350)
-                    ),
-                    "estimatedExtendedParts": int(
-                        public_estimate.get("estimatedExtendedParts", 6999650)
-                    ),
-                    "estimatedDownloadSizeMB": estimated_download_mb,
-                    "estimatedDatabaseSizeMB": round(
-                        float(public_estimate.get("estimatedDatabaseSizeMB", 1800)), 1
-                    ),
-                    "estimatedDownloadTimeMinutes": public_estimate.get(
-                        "estimatedDownloadTimeMinutes",
-                        {
-                            "min": 0,
-                            "max": 0,
-                            "note": "No estimate available",
-                        },
-                    ),
-                    "recommendedUseCase": "Use when you have valid API credentials and want upstream-signed full catalog data.",
-                }
+            public_cache_dir = self._get_yaqwsx_cache_dir()
 
             db_path = self.jlcpcb_parts.db_path
             has_existing_db = os.path.exists(db_path) and os.path.getsize(db_path) > 0
@@ -1957,15 +2572,10 @@ class KiCADInterface:
                     "db_path": db_path,
                 }
 
-                public_estimate = get_public_estimate()
-                official_estimate = build_official_estimate(public_estimate)
-                options = {
-                    "official": official_estimate,
-                    "public": public_estimate,
-                }
-
+                # Most callers keep the existing database, so the source
+                # estimates are only computed on request
                 now = time.time()
-                self.jlcpcb_download_status.update(
+                self._publish_download_status(
                     {
                         "isRunning": False,
                         "stage": "awaiting_replace_and_source_selection",
@@ -1973,7 +2583,7 @@ class KiCADInterface:
                         "message": "Database already exists; waiting for replace confirmation and source selection",
                         "lastUpdated": now,
                         "existingStats": existing_stats,
-                        "options": options,
+                        "options": None,
                     }
                 )
                 return {
@@ -1982,18 +2592,18 @@ class KiCADInterface:
                     "requiresSourceSelection": True,
                     "message": "Database already exists. Re-run with force=true to replace or keep current database.",
                     "stats": existing_stats,
-                    "options": options,
+                    "estimatesAvailableVia": "get_jlcpcb_estimates",
                 }
 
             if source == "auto":
-                public_estimate = get_public_estimate()
-                official_estimate = build_official_estimate(public_estimate)
+                public_estimate = self._public_jlcpcb_estimate()
+                official_estimate = self._official_jlcpcb_estimate(public_estimate)
                 now = time.time()
                 options = {
                     "official": official_estimate,
                     "public": public_estimate,
                 }
-                self.jlcpcb_download_status.update(
+                self._publish_download_status(
                     {
                         "isRunning": False,
                         "stage": "awaiting_source_selection",
@@ -2017,8 +2627,8 @@ class KiCADInterface:
                 }
 
             if source == "official" and not has_official_creds:
-                public_estimate = get_public_estimate()
-                official_estimate = build_official_estimate(public_estimate)
+                public_estimate = self._public_jlcpcb_estimate()
+                official_estimate = self._official_jlcpcb_estimate(public_estimate)
                 return {
                     "success": False,
                     "message": "Official source selected but credentials are not configured",
@@ -2030,9 +2640,9 @@ class KiCADInterface:
                 }
 
             if source == "public" and not confirm:
-                public_estimate = get_public_estimate()
+                public_estimate = self._public_jlcpcb_estimate()
                 now = time.time()
-                self.jlcpcb_download_status.update(
+                self._publish_download_status(
                     {
                         "isRunning": False,
                         "stage": "awaiting_download_confirmation",
@@ -2059,7 +2669,7 @@ class KiCADInterface:
                     }
 
                 start_time = time.time()
-                self.jlcpcb_download_status.update(
+                self._publish_download_status(
                     {
                         "isRunning": True,
                         "stage": "queued",
@@ -2076,32 +2686,52 @@ class KiCADInterface:
                 )
 
                 def _background_download_worker():
-                    result = self._handle_download_jlcpcb_database(
-                        {
-                            "force": force,
-                            "source": source,
-                            "confirm": confirm,
-                            "background": False,
-                            "_internal_worker": True,
-                        }
-                    )
-                    self.jlcpcb_download_last_result = result
-
-                    if not result.get("success") and self.jlcpcb_download_status.get(
-                        "isRunning"
-                    ):
-                        now = time.time()
-                        started_at = self.jlcpcb_download_status.get("startedAt") or now
-                        self.jlcpcb_download_status.update(
+                    result = {"success": False, "message": "Download failed"}
+                    try:
+                        result = self._handle_download_jlcpcb_database(
                             {
+                                "force": force,
+                                "source": source,
+                                "confirm": confirm,
+                                "background": False,
+                                "_internal_worker": True,
+                            }
+                        )
+                    except BaseException as e:
+                        logger.exception("JLCPCB download worker crashed")
+                        result = {
+                            "success": False,
+                            "message": f"Download worker crashed: {e}",
+                        }
+                        if not isinstance(e, Exception):
+                            raise
+                    finally:
+                        # Always leave a terminal status behind, so polling
+                        # clients stop and a new download can be started
+                        self.jlcpcb_download_last_result = result
+                        if self.jlcpcb_download_thread is threading.current_thread():
+                            self.jlcpcb_download_thread = None
+
+                        if self.jlcpcb_download_status.get("isRunning"):
+                            now = time.time()
+                            started_at = (
+                                self.jlcpcb_download_status.get("startedAt") or now
+                            )
+                            terminal = {
                                 "isRunning": False,
-                                "stage": "failed",
-                                "message": result.get("message", "Download failed"),
-                                "error": result.get("message", "Download failed"),
                                 "elapsedSeconds": round(now - float(started_at), 1),
                                 "lastUpdated": now,
                             }
-                        )
+                            if not result.get("success"):
+                                message = result.get("message", "Download failed")
+                                terminal.update(
+                                    {
+                                        "stage": "failed",
+                                        "message": message,
+                                        "error": message,
+                                    }
+                                )
+                            self._publish_download_status(terminal)
 
                 self.jlcpcb_download_thread = threading.Thread(
                     target=_background_download_worker,
@@ -2119,13 +2749,15 @@ class KiCADInterface:
                 }
 
             start_time = time.time()
+            self._download_started_mono = time.monotonic()
+            self._last_status_update_ns = 0
             run_estimate = None
             if source == "public":
-                run_estimate = get_public_estimate()
+                run_estimate = self._public_jlcpcb_estimate()
             elif source == "official":
-                run_estimate = build_official_estimate(get_public_estimate())
+                run_estimate = self._official_jlcpcb_estimate(self._public_jlcpcb_estimate())
 
-            self.jlcpcb_download_status.update(
+            self._publish_download_status(
                 {
                     "isRunning": True,
                     "stage": "starting",
@@ -2145,41 +2777,84 @@ class KiCADInterface:
             if source == "official":
                 logger.info("Downloading JLCPCB parts database from official API...")
 
+                # Pages flow from a downloader thread straight into SQLite, so
+                # the catalog is never resident in memory all at once
+                pages = queue.Queue(maxsize=4)
+                stop_download = threading.Event()
+                end_of_pages = object()
+                progress = {"page": 0, "downloadedParts": 0, "importedParts": 0}
+
                 def official_download_callback(page, total, msg):
-                    now = time.time()
-                    self.jlcpcb_download_status.update(
-                        {
-                            "stage": "downloading",
-                            "message": msg,
-                            "downloadedParts": total,
-                            "elapsedSeconds": round(now - start_time, 1),
-                            "lastUpdated": now,
-                            "page": page,
-                        }
-                    )
+                    progress["page"] = page
+                    progress["downloadedParts"] = total
+                    # Once importing starts, the import callback reports both
+                    if not progress["importedParts"]:
+                        self._update_download_status(
+                            "downloading",
+                            message=msg,
+                            downloadedParts=total,
+                            page=page,
+                        )
 
-                parts = self.jlcpcb_client.download_full_database(
-                    callback=official_download_callback
-                )
+                def put_page(item):
+                    while not stop_download.is_set():
+                        try:
+                            pages.put(item, timeout=0.5)
+                            return
+                        except queue.Full:
+                            continue
+
+                def download_pages():
+                    try:
+                        for page_parts in self.jlcpcb_client.iter_parts_pages(
+                            callback=official_download_callback
+                        ):
+                            put_page(page_parts)
+                            if stop_download.is_set():
+                                return
+                    except BaseException as download_error:
+                        put_page(download_error)
+                    finally:
+                        put_page(end_of_pages)
+
+                def downloaded_parts():
+                    try:
+                        while True:
+                            item = pages.get()
+                            if item is end_of_pages:
+                                return
+                            if isinstance(item, BaseException):
+                                raise item
+                            yield from item
+                    finally:
+                        stop_download.set()
 
                 def official_import_callback(curr, total, msg):
-                    now = time.time()
-                    self.jlcpcb_download_status.update(
-                        {
-                            "stage": "importing",
-                            "message": msg,
-                            "downloadedParts": len(parts),
-                            "importedParts": curr,
-                            "totalParts": total,
-                            "elapsedSeconds": round(now - start_time, 1),
-                            "lastUpdated": now,
-                        }
+                    progress["importedParts"] = curr
+                    self._update_download_status(
+                        "importing",
+                        message=msg,
+                        downloadedParts=progress["downloadedParts"],
+                        importedParts=curr,
+                        totalParts=total,
+                        page=progress["page"],
                     )
 
-                self.jlcpcb_parts.import_parts(
-                    parts,
-                    progress_callback=official_import_callback,
+                downloader = threading.Thread(
+                    target=download_pages,
+                    name="jlcpcb-page-downloader",
+                    daemon=True,
                 )
+                downloader.start()
+                try:
+                    with self.jlcpcb_parts.bulk_load(drop_indexes=True):
+                        self.jlcpcb_parts.import_parts(
+                            downloaded_parts(),
+                            progress_callback=official_import_callback,
+                        )
+                finally:
+                    stop_download.set()
+                    downloader.join(timeout=5)
             else:
                 logger.info(
                     "Downloading JLCPCB parts database from public snapshot (hosted by yaqwsx)..."
@@ -2188,32 +2863,23 @@ class KiCADInterface:
                 import tempfile
 
                 extract_temp_dir = None
-                cache_dir = os.path.join(
-                    os.path.dirname(self.jlcpcb_parts.db_path),
-                    "yaqwsx_archive_cache",
-                )
-                os.makedirs(cache_dir, exist_ok=True)
+                cache_dir = public_cache_dir
 
                 def yaqwsx_download_callback(downloaded_bytes, total_bytes, msg):
-                    now = time.time()
-                    self.jlcpcb_download_status.update(
-                        {
-                            "stage": "downloading",
-                            "message": msg,
-                            "downloadedParts": round(
-                                downloaded_bytes / (1024 * 1024), 1
-                            ),
-                            "downloadedSizeMB": round(
-                                downloaded_bytes / (1024 * 1024), 1
-                            ),
-                            "totalSizeMB": round(total_bytes / (1024 * 1024), 1)
-                            if total_bytes
-                            else 0.0,
-                            "downloadedBytes": downloaded_bytes,
-                            "totalBytes": total_bytes,
-                            "elapsedSeconds": round(now - start_time, 1),
-                            "lastUpdated": now,
-                        }
+                    if not self._download_status_due("downloading"):
+                        return
+                    downloaded_mb = round(downloaded_bytes * _BYTES_TO_MB, 1)
+                    self._update_download_status(
+                        "downloading",
+                        force=True,
+                        message=msg,
+                        downloadedParts=downloaded_mb,
+                        downloadedSizeMB=downloaded_mb,
+                        totalSizeMB=round(total_bytes * _BYTES_TO_MB, 1)
+                        if total_bytes
+                        else 0.0,
+                        downloadedBytes=downloaded_bytes,
+                        totalBytes=total_bytes,
                     )
 
                 try:
@@ -2226,7 +2892,7 @@ class KiCADInterface:
                     cache_db_path = download["cacheDbPath"]
                     expected_total_parts = download.get("expectedTotalParts")
 
-                    self.jlcpcb_download_status.update(
+                    self._publish_download_status(
                         {
                             "updatedArchiveParts": int(
                                 download.get("changedParts", 0) or 0
@@ -2246,12 +2912,12 @@ class KiCADInterface:
                         if isinstance(estimate, dict):
                             estimate = dict(estimate)
                             estimate["expectedTotalParts"] = int(expected_total_parts)
-                            self.jlcpcb_download_status["estimate"] = estimate
+                            self._publish_download_status({"estimate": estimate})
 
                     if int(download.get("changedParts", 0) or 0) == 0:
-                        stats = self.jlcpcb_parts.get_database_stats()
+                        stats = self.jlcpcb_parts.get_cached_database_stats()
                         no_change_time = time.time()
-                        self.jlcpcb_download_status.update(
+                        self._publish_download_status(
                             {
                                 "isRunning": False,
                                 "stage": "completed",
@@ -2278,16 +2944,13 @@ class KiCADInterface:
                         self.jlcpcb_parts.set_metadata(
                             "yaqwsx_last_total_parts", str(int(stats["total_parts"]))
                         )
+                        self._public_estimate_cache = None
                         return {
                             "success": True,
                             "total_parts": stats["total_parts"],
                             "basic_parts": stats["basic_parts"],
                             "extended_parts": stats["extended_parts"],
-                            "db_size_mb": round(
-                                os.path.getsize(self.jlcpcb_parts.db_path)
-                                / (1024 * 1024),
-                                2,
-                            ),
+                            "db_size_mb": self.jlcpcb_parts.get_cached_db_size_mb(),
                             "db_path": stats["db_path"],
                             "source": source,
                             "updatedArchiveParts": 0,
@@ -2299,17 +2962,16 @@ class KiCADInterface:
                     last_imported = self.jlcpcb_parts.get_metadata("yaqwsx_last_update")
                     incremental_since = int(last_imported) if last_imported else None
 
+                    # Progress arrives once per batch and is throttled by
+                    # _update_download_status; the last batch is always shown
+                    # since index rebuilding follows it
                     def yaqwsx_import_callback(curr, total, msg):
-                        now = time.time()
-                        self.jlcpcb_download_status.update(
-                            {
-                                "stage": "importing",
-                                "message": msg,
-                                "importedParts": curr,
-                                "totalParts": total,
-                                "elapsedSeconds": round(now - start_time, 1),
-                                "lastUpdated": now,
-                            }
+                        self._update_download_status(
+                            "importing",
+                            force=curr >= total,
+                            message=msg,
+                            importedParts=curr,
+                            totalParts=total,
                         )
 
                     import_result = self.jlcpcb_parts.import_yaqwsx_cache(
@@ -2326,6 +2988,8 @@ class KiCADInterface:
                         )
                 finally:
                     if extract_temp_dir and os.path.isdir(extract_temp_dir):
+                        import shutil
+
                         try:
                             shutil.rmtree(extract_temp_dir)
                             logger.info(
@@ -2336,11 +3000,11 @@ class KiCADInterface:
                                 f"Failed to cleanup temporary yaqwsx extraction directory {extract_temp_dir}: {cleanup_error}"
                             )
 
-            stats = self.jlcpcb_parts.get_database_stats()
-            db_size_mb = os.path.getsize(self.jlcpcb_parts.db_path) / (1024 * 1024)
+            stats = self.jlcpcb_parts.get_cached_database_stats()
+            db_size_mb = self.jlcpcb_parts.get_cached_db_size_mb()
 
             end_time = time.time()
-            self.jlcpcb_download_status.update(
+            self._publish_download_status(
                 {
                     "isRunning": False,
                     "stage": "completed",
@@ -2370,13 +3034,14 @@ class KiCADInterface:
                 self.jlcpcb_parts.set_metadata(
                     "yaqwsx_last_total_parts", str(int(stats["total_parts"]))
                 )
+                self._public_estimate_cache = None
 
             return {
                 "success": True,
                 "total_parts": stats["total_parts"],
                 "basic_parts": stats["basic_parts"],
                 "extended_parts": stats["extended_parts"],
-                "db_size_mb": round(db_size_mb, 2),
+                "db_size_mb": db_size_mb,
                 "db_path": stats["db_path"],
                 "source": source,
                 "updatedArchiveParts": self.jlcpcb_download_status.get(
@@ -2391,7 +3056,7 @@ class KiCADInterface:
             logger.error(f"Error downloading JLCPCB database: {e}", exc_info=True)
             end_time = time.time()
             started_at = self.jlcpcb_download_status.get("startedAt") or end_time
-            self.jlcpcb_download_status.update(
+            self._publish_download_status(
                 {
                     "isRunning": False,
                     "stage": "failed",
@@ -2406,11 +3071,57 @@ class KiCADInterface:
                 "message": f"Failed to download database: {str(e)}",
             }
 
+    def _get_yaqwsx_cache_dir(self):
+        """Public snapshot archive cache next to the parts database, created once"""
+        if self._yaqwsx_cache_dir is None:
+            cache_dir = os.path.join(
+                os.path.dirname(self.jlcpcb_parts.db_path), "yaqwsx_archive_cache"
+            )
+            os.makedirs(cache_dir, exist_ok=True)
+            self._yaqwsx_cache_dir = cache_dir
+        return self._yaqwsx_cache_dir
+
+    def _download_status_due(self, stage):
+        """Whether a progress update for ``stage`` should be published now"""
+        return (
+            self.jlcpcb_download_status.get("stage") != stage
+            or time.monotonic_ns() - self._last_status_update_ns
+            >= DOWNLOAD_STATUS_INTERVAL_NS
+        )
+
+    def _update_download_status(self, stage, force=False, **fields):
+        """Publish download progress, throttled to DOWNLOAD_STATUS_INTERVAL_NS
+
+        Stage changes and ``force=True`` are always published.
+        """
+        if not force and not self._download_status_due(stage):
+            return
+        self._last_status_update_ns = time.monotonic_ns()
+        fields["stage"] = stage
+        fields["elapsedSeconds"] = round(
+            time.monotonic() - self._download_started_mono, 1
+        )
+        # Wall-clock time only for the externally visible timestamp
+        fields["lastUpdated"] = time.time()
+        self._publish_download_status(fields)
+
+    def _publish_download_status(self, fields):
+        """Swap in a new jlcpcb_download_status with ``fields`` applied
+
+        Published dicts are never mutated afterwards, so readers can hand
+        out the current one without copying it.
+        """
+        with self._status_lock:
+            status = {**self.jlcpcb_download_status, **fields}
+            self.jlcpcb_download_status = status
+        return status
+
     def _handle_get_jlcpcb_download_status(self, params):
         """Get current JLCPCB download progress status."""
         try:
-            status = dict(self.jlcpcb_download_status)
+            status = self.jlcpcb_download_status
             if status.get("isRunning") and status.get("startedAt"):
+                status = dict(status)
                 status["elapsedSeconds"] = round(
                     time.time() - float(status["startedAt"]), 1
                 )
@@ -2451,24 +3162,22 @@ class KiCADInterface:
             if library_type == "All":
                 library_type = None
 
-            parts = self.jlcpcb_parts.search_parts(
-                query=query,
-                category=category,
-                package=package,
-                library_type=library_type,
-                manufacturer=manufacturer,
-                in_stock=in_stock,
-                limit=limit,
-            )
-
-            # Add price breaks and footprints to each part
-            for part in parts:
-                if part.get("price_json"):
-                    try:
-                        part["price_breaks"] = json.loads(part["price_json"])
-                    except:
-                        part["price_breaks"] = []
+            parts = [
+                part._asdict()
+                for part in self.jlcpcb_parts.search_parts(
+                    query=query,
+                    category=category,
+                    package=package,
+                    library_type=library_type,
+                    manufacturer=manufacturer,
+                    in_stock=in_stock,
+                    limit=limit,
+                    include_price=True,
+                )
+            ]
 
+            # Full price breaks are left to get_jlcpcb_part; list results
+            # carry first_price, materialized at import
             return {"success": True, "parts": parts, "count": len(parts)}
 
         except Exception as e:
@@ -2500,7 +3209,7 @@ class KiCADInterface:
     def _handle_get_jlcpcb_database_stats(self, params):
         """Get statistics about JLCPCB database"""
         try:
-            stats = self.jlcpcb_parts.get_database_stats()
+            stats = self.jlcpcb_parts.get_cached_database_stats()
             return {"success": True, "stats": stats}
 
         except Exception as e:
@@ -2518,24 +3227,14 @@ class KiCADInterface:
 
             # Get original part for price comparison
             original_part = self.jlcpcb_parts.get_part_info(lcsc_number)
-            reference_price = None
-            if original_part and original_part.get("price_breaks"):
-                try:
-                    reference_price = float(
-                        original_part["price_breaks"][0].get("price", 0)
-                    )
-                except:
-                    pass
-
-            alternatives = self.jlcpcb_parts.suggest_alternatives(lcsc_number, limit)
+            reference_price = (
+                original_part.get("first_price") if original_part else None
+            )
 
-            # Add price breaks to alternatives
-            for part in alternatives:
-                if part.get("price_json"):
-                    try:
-                        part["price_breaks"] = json.loads(part["price_json"])
-                    except:
-                        part["price_breaks"] = []
+            alternatives = [
+                part._asdict()
+                for part in self.jlcpcb_parts.suggest_alternatives(lcsc_number, limit)
+            ]
 
             return {
                 "success": True,
@@ -2558,15 +3257,21 @@ def main():
 
     try:
         logger.info("Processing commands from stdin...")
-        # Process commands from stdin
-        for line in sys.stdin:
+        # Process commands from stdin, one JSON document per line; the bytes
+        # are handed to the parser without decoding them to str first
+        for line in sys.stdin.buffer:
             try:
                 # Parse command
-                logger.debug(f"Received input: {line.strip()}")
-                command_data = json.loads(line)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Received input: %s", _log_preview(line).strip())
+                command_data = _loads(line)
+
+                # A JSON array is a batch of legacy-format commands
+                if isinstance(command_data, list):
+                    response = interface.handle_batch(command_data)
 
                 # Check if this is JSON-RPC 2.0 format
-                if "jsonrpc" in command_data and command_data["jsonrpc"] == "2.0":
+                elif "jsonrpc" in command_data and command_data["jsonrpc"] == "2.0":
                     logger.info("Detected JSON-RPC 2.0 format message")
                     method = command_data.get("method")
                     params = command_data.get("params", {})
@@ -2575,57 +3280,12 @@ def main():
                     # Handle MCP protocol methods
                     if method == "initialize":
                         logger.info("Handling MCP initialize")
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request_id,
-                            "result": {
-                                "protocolVersion": "2025-06-18",
-                                "capabilities": {
-                                    "tools": {"listChanged": True},
-                                    "resources": {
-                                        "subscribe": False,
-                                        "listChanged": True,
-                                    },
-                                },
-                                "serverInfo": {
-                                    "name": "kicad-mcp-server",
-                                    "title": "KiCAD PCB Design Assistant",
-                                    "version": "2.1.0-alpha",
-                                },
-                                "instructions": "AI-assisted PCB design with KiCAD. Use tools to create projects, design boards, place components, route traces, and export manufacturing files.",
-                            },
-                        }
+                        response = _jsonrpc_result(request_id, _INITIALIZE_RESULT)
                     elif method == "tools/list":
                         logger.info("Handling MCP tools/list")
-                        # Return list of available tools with proper schemas
-                        tools = []
-                        for cmd_name in interface.command_routes.keys():
-                            # Get schema from TOOL_SCHEMAS if available
-                            if cmd_name in TOOL_SCHEMAS:
-                                tool_def = TOOL_SCHEMAS[cmd_name].copy()
-                                tools.append(tool_def)
-                            else:
-                                # Fallback for tools without schemas
-                                logger.warning(
-                                    f"No schema defined for tool: {cmd_name}"
-                                )
-                                tools.append(
-                                    {
-                                        "name": cmd_name,
-                                        "description": f"KiCAD command: {cmd_name}",
-                                        "inputSchema": {
-                                            "type": "object",
-                                            "properties": {},
-                                        },
-                                    }
-                                )
-
+                        tools = interface.tools_list
                         logger.info(f"Returning {len(tools)} tools")
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request_id,
-                            "result": {"tools": tools},
-                        }
+                        response = _jsonrpc_result(request_id, {"tools": tools})
                     elif method == "tools/call":
                         logger.info("Handling MCP tools/call")
                         tool_name = params.get("name")
@@ -2634,57 +3294,31 @@ def main():
                         # Execute the command
                         result = interface.handle_command(tool_name, tool_params)
 
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request_id,
-                            "result": {
-                                "content": [
-                                    {"type": "text", "text": json.dumps(result)}
-                                ]
-                            },
-                        }
+                        response = _tool_result_response(request_id, result)
                     elif method == "resources/list":
                         logger.info("Handling MCP resources/list")
                         # Return list of available resources
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request_id,
-                            "result": {"resources": RESOURCE_DEFINITIONS},
-                        }
+                        response = _jsonrpc_result(request_id, _RESOURCES_LIST_RESULT)
                     elif method == "resources/read":
                         logger.info("Handling MCP resources/read")
                         resource_uri = params.get("uri")
 
                         if not resource_uri:
-                            response = {
-                                "jsonrpc": "2.0",
-                                "id": request_id,
-                                "error": {
-                                    "code": -32602,
-                                    "message": "Missing required parameter: uri",
-                                },
-                            }
+                            response = _jsonrpc_error(
+                                request_id, -32602, "Missing required parameter: uri"
+                            )
                         else:
                             # Read the resource
                             resource_data = handle_resource_read(
                                 resource_uri, interface
                             )
 
-                            response = {
-                                "jsonrpc": "2.0",
-                                "id": request_id,
-                                "result": resource_data,
-                            }
+                            response = _jsonrpc_result(request_id, resource_data)
                     else:
                         logger.error(f"Unknown JSON-RPC method: {method}")
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request_id,
-                            "error": {
-                                "code": -32601,
-                                "message": f"Method not found: {method}",
-                            },
-                        }
+                        response = _jsonrpc_error(
+                            request_id, -32601, f"Method not found: {method}"
+                        )
                 else:
                     # Handle legacy custom format
                     logger.info("Detected custom format message")
@@ -2703,9 +3337,9 @@ def main():
                         response = interface.handle_command(command, params)
 
                 # Send response
-                logger.debug(f"Sending response: {response}")
-                print(json.dumps(response))
-                sys.stdout.flush()
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Sending response: %s", _log_preview(response))
+                _write_response(response)
 
             except json.JSONDecodeError as e:
                 logger.error(f"Invalid JSON input: {str(e)}")
@@ -2714,15 +3348,14 @@ def main():
                     "message": "Invalid JSON input",
                     "errorDetails": str(e),
                 }
-                print(json.dumps(response))
-                sys.stdout.flush()
+                _write_response(response)
 
     except KeyboardInterrupt:
         logger.info("KiCAD interface stopped")
         sys.exit(0)
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}\n{traceback.format_exc()}")
+        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
         sys.exit(1)
 
 
@@ -3,5 +3,6 @@ Tool schema definitions for KiCAD MCP Server
 """
 
 from .tool_schemas import TOOL_SCHEMAS
+from .command_specs import COMMAND_SPECS
 
-__all__ = ['TOOL_SCHEMAS']
+__all__ = ['TOOL_SCHEMAS', 'COMMAND_SPECS']
@@ -0,0 +1,170 @@
+"""
+Command routing table for the KiCAD interface
+
+Each entry is (command, handler attribute, method, IPC method):
+
+- handler attribute names the lazily constructed *Commands object on
+  KiCADInterface that implements the command; None means method is a
+  KiCADInterface method.
+- IPC method is the KiCADInterface method serving the command through the
+  IPC backend, or None when the command is SWIG/file based only.
+
+Both the SWIG routes and the IPC overrides are generated from this one list,
+so a command cannot be added to one table and forgotten in the other.
+"""
+
+from typing import Optional, Tuple
+
+CommandSpec = Tuple[str, Optional[str], str, Optional[str]]
+
+COMMAND_SPECS: Tuple[CommandSpec, ...] = (
+    # Project commands
+    ("create_project", "project_commands", "create_project", None),
+    ("open_project", "project_commands", "open_project", None),
+    ("save_project", "project_commands", "save_project", "_ipc_save_project"),
+    ("get_project_info", "project_commands", "get_project_info", None),
+    # Board commands
+    ("set_board_size", "board_commands", "set_board_size", "_ipc_set_board_size"),
+    ("add_layer", "board_commands", "add_layer", None),
+    ("set_active_layer", "board_commands", "set_active_layer", None),
+    ("get_board_info", "board_commands", "get_board_info", "_ipc_get_board_info"),
+    ("get_layer_list", "board_commands", "get_layer_list", "_ipc_get_layer_list"),
+    ("get_board_2d_view", "board_commands", "get_board_2d_view", None),
+    ("get_board_extents", "board_commands", "get_board_extents", None),
+    (
+        "add_board_outline",
+        "board_commands",
+        "add_board_outline",
+        "_ipc_add_board_outline",
+    ),
+    (
+        "add_mounting_hole",
+        "board_commands",
+        "add_mounting_hole",
+        "_ipc_add_mounting_hole",
+    ),
+    ("add_text", "board_commands", "add_text", "_ipc_add_text"),
+    # Alias for TypeScript tool
+    ("add_board_text", "board_commands", "add_text", "_ipc_add_text"),
+    # Component commands
+    (
+        "place_component",
+        "component_commands",
+        "place_component",
+        "_ipc_place_component",
+    ),
+    ("move_component", "component_commands", "move_component", "_ipc_move_component"),
+    (
+        "rotate_component",
+        "component_commands",
+        "rotate_component",
+        "_ipc_rotate_component",
+    ),
+    (
+        "delete_component",
+        "component_commands",
+        "delete_component",
+        "_ipc_delete_component",
+    ),
+    ("edit_component", "component_commands", "edit_component", None),
+    (
+        "get_component_properties",
+        "component_commands",
+        "get_component_properties",
+        "_ipc_get_component_properties",
+    ),
+    (
+        "get_component_list",
+        "component_commands",
+        "get_component_list",
+        "_ipc_get_component_list",
+    ),
+    ("find_component", "component_commands", "find_component", None),
+    ("get_component_pads", "component_commands", "get_component_pads", None),
+    ("get_pad_position", "component_commands", "get_pad_position", None),
+    ("set_pad_net", "component_commands", "set_pad_net", None),
+    (
+        "get_component_connections",
+        "component_commands",
+        "get_component_connections",
+        None,
+    ),
+    ("place_component_array", "component_commands", "place_component_array", None),
+    ("align_components", "component_commands", "align_components", None),
+    ("duplicate_component", "component_commands", "duplicate_component", None),
+    # Routing commands
+    ("add_net", "routing_commands", "add_net", "_ipc_add_net"),
+    ("route_trace", "routing_commands", "route_trace", "_ipc_route_trace"),
+    ("add_via", "routing_commands", "add_via", "_ipc_add_via"),
+    ("delete_trace", "routing_commands", "delete_trace", "_ipc_delete_trace"),
+    ("query_traces", "routing_commands", "query_traces", None),
+    ("modify_trace", "routing_commands", "modify_trace", None),
+    ("analyze_nets", "routing_commands", "analyze_nets", None),
+    ("copy_routing_pattern", "routing_commands", "copy_routing_pattern", None),
+    ("get_nets_list", "routing_commands", "get_nets_list", "_ipc_get_nets_list"),
+    ("create_netclass", "routing_commands", "create_netclass", None),
+    ("add_copper_pour", "routing_commands", "add_copper_pour", "_ipc_add_copper_pour"),
+    ("route_differential_pair", "routing_commands", "route_differential_pair", None),
+    ("refill_zones", None, "_handle_refill_zones", "_ipc_refill_zones"),
+    # Design rule commands
+    ("set_design_rules", "design_rule_commands", "set_design_rules", None),
+    ("get_design_rules", "design_rule_commands", "get_design_rules", None),
+    ("run_drc", "design_rule_commands", "run_drc", None),
+    ("get_drc_violations", "design_rule_commands", "get_drc_violations", None),
+    ("get_drc_history", "design_rule_commands", "get_drc_history", None),
+    # Export commands
+    ("export_gerber", "export_commands", "export_gerber", None),
+    ("export_pdf", "export_commands", "export_pdf", None),
+    ("export_svg", "export_commands", "export_svg", None),
+    ("export_3d", "export_commands", "export_3d", None),
+    ("export_bom", "export_commands", "export_bom", None),
+    ("analyze_bom_jlcpcb", "export_commands", "analyze_bom_jlcpcb", None),
+    # Library commands (footprint management)
+    ("list_libraries", "library_commands", "list_libraries", None),
+    ("search_footprints", "library_commands", "search_footprints", None),
+    ("list_library_footprints", "library_commands", "list_library_footprints", None),
+    ("get_footprint_info", "library_commands", "get_footprint_info", None),
+    # Symbol library commands (local KiCad symbol library search)
+    ("list_symbol_libraries", "symbol_library_commands", "list_symbol_libraries", None),
+    ("search_symbols", "symbol_library_commands", "search_symbols", None),
+    ("list_library_symbols", "symbol_library_commands", "list_library_symbols", None),
+    ("get_symbol_info", "symbol_library_commands", "get_symbol_info", None),
+    # JLCPCB API commands (complete parts catalog via API)
+    ("download_jlcpcb_database", None, "_handle_download_jlcpcb_database", None),
+    ("get_jlcpcb_download_status", None, "_handle_get_jlcpcb_download_status", None),
+    ("get_jlcpcb_estimates", None, "_handle_get_jlcpcb_estimates", None),
+    ("search_jlcpcb_parts", None, "_handle_search_jlcpcb_parts", None),
+    ("get_jlcpcb_part", None, "_handle_get_jlcpcb_part", None),
+    ("get_jlcpcb_database_stats", None, "_handle_get_jlcpcb_database_stats", None),
+    ("suggest_jlcpcb_alternatives", None, "_handle_suggest_jlcpcb_alternatives", None),
+    # Schematic commands
+    ("create_schematic", None, "_handle_create_schematic", None),
+    ("load_schematic", None, "_handle_load_schematic", None),
+    ("add_schematic_component", None, "_handle_add_schematic_component", None),
+    ("add_schematic_wire", None, "_handle_add_schematic_wire", None),
+    ("add_schematic_connection", None, "_handle_add_schematic_connection", None),
+    ("add_schematic_net_label", None, "_handle_add_schematic_net_label", None),
+    ("connect_to_net", None, "_handle_connect_to_net", None),
+    ("get_net_connections", None, "_handle_get_net_connections", None),
+    ("generate_netlist", None, "_handle_generate_netlist", None),
+    ("list_schematic_libraries", None, "_handle_list_schematic_libraries", None),
+    ("export_schematic_pdf", None, "_handle_export_schematic_pdf", None),
+    ("auto_layout_schematic", None, "_handle_auto_layout_schematic", None),
+    ("validate_schematic", None, "_handle_validate_schematic", None),
+    # UI/Process management commands
+    ("check_kicad_ui", None, "_handle_check_kicad_ui", None),
+    ("launch_kicad_ui", None, "_handle_launch_kicad_ui", None),
+    ("open_schematic_editor", None, "_handle_open_schematic_editor", None),
+    # IPC-specific commands (real-time operations)
+    ("get_backend_info", None, "_handle_get_backend_info", None),
+    ("ipc_add_track", None, "_handle_ipc_add_track", None),
+    ("ipc_add_via", None, "_handle_ipc_add_via", None),
+    ("ipc_add_text", None, "_handle_ipc_add_text", None),
+    ("ipc_add_tracks_batch", None, "_handle_ipc_add_tracks_batch", None),
+    ("ipc_add_vias_batch", None, "_handle_ipc_add_vias_batch", None),
+    ("ipc_add_texts_batch", None, "_handle_ipc_add_texts_batch", None),
+    ("ipc_list_components", None, "_handle_ipc_list_components", None),
+    ("ipc_get_tracks", None, "_handle_ipc_get_tracks", None),
+    ("ipc_get_vias", None, "_handle_ipc_get_vias", None),
+    ("ipc_save_board", None, "_handle_ipc_save_board", None),
+)
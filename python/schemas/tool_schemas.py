@@ -1631,6 +1631,11 @@ TOOL_SCHEMAS.update(
                         "description": "Confirmation flag required for public snapshot source after estimate prompt",
                         "default": False,
                     },
+                    "background": {
+                        "type": "boolean",
+                        "description": "Return immediately and run the download in the background; poll get_jlcpcb_download_status for progress",
+                        "default": False,
+                    },
                 },
             },
         },
@@ -1643,6 +1648,15 @@ TOOL_SCHEMAS.update(
                 "properties": {},
             },
         },
+        "get_jlcpcb_estimates": {
+            "name": "get_jlcpcb_estimates",
+            "title": "Get JLCPCB Download Estimates",
+            "description": "Returns part count, size and time estimates for the official and public JLCPCB download sources.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {},
+            },
+        },
     }
 )
 
@@ -1,9 +1,14 @@
+import functools
 import glob
+import itertools
 import os
 import platform
 import shutil
 import subprocess
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# (environment key, result) of the last successful resolve_kicad_cli()
+_RESOLVE_CACHE: Optional[Tuple[Tuple[Optional[str], ...], Dict[str, Any]]] = None
 
 
 def _expand_candidate(path_pattern: str) -> List[str]:
@@ -19,6 +24,18 @@ def _is_executable_file(path: str) -> bool:
 
 
 def _validate_kicad_cli(path: str, timeout_seconds: int = 5) -> Tuple[bool, str]:
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError as exc:
+        return False, str(exc)
+    return _validate_kicad_cli_version(path, mtime_ns, timeout_seconds)
+
+
+# Keyed on the binary's mtime so an upgraded kicad-cli is checked again
+@functools.lru_cache(maxsize=16)
+def _validate_kicad_cli_version(
+    path: str, mtime_ns: int, timeout_seconds: int
+) -> Tuple[bool, str]:
     try:
         result = subprocess.run(
             [path, "--version"],
@@ -59,27 +76,51 @@ def _platform_fallbacks() -> List[str]:
     return ["/usr/bin/kicad-cli", "/usr/local/bin/kicad-cli"]
 
 
-def resolve_kicad_cli() -> Dict[str, Any]:
-    searched: List[str] = []
-
-    env_candidates: List[Tuple[str, str]] = []
+def _env_candidates() -> Iterator[Tuple[str, str]]:
     for var_name in ("KICAD_CLI", "KICAD_CLI_PATH"):
         value = os.environ.get(var_name)
-        if not value:
-            continue
-        candidate = os.path.abspath(os.path.expanduser(value))
-        env_candidates.append((candidate, f"env:{var_name}"))
+        if value:
+            yield os.path.abspath(os.path.expanduser(value)), f"env:{var_name}"
+
 
+def _path_candidates() -> Iterator[Tuple[str, str]]:
     path_candidate = shutil.which("kicad-cli")
     if path_candidate:
-        env_candidates.append((path_candidate, "PATH"))
+        yield path_candidate, "PATH"
 
+
+def _fallback_candidates() -> Iterator[Tuple[str, str]]:
     for fallback in _platform_fallbacks():
         for expanded in _expand_candidate(fallback):
-            env_candidates.append((expanded, "fallback"))
+            yield expanded, "fallback"
+
+
+def _resolve_cache_key() -> Tuple[Optional[str], ...]:
+    return (
+        os.environ.get("KICAD_CLI"),
+        os.environ.get("KICAD_CLI_PATH"),
+        os.environ.get("PATH"),
+    )
+
+
+def resolve_kicad_cli() -> Dict[str, Any]:
+    global _RESOLVE_CACHE
+
+    key = _resolve_cache_key()
+    if _RESOLVE_CACHE is not None and _RESOLVE_CACHE[0] == key:
+        cached = _RESOLVE_CACHE[1]
+        if _is_executable_file(cached["path"]):
+            return dict(cached, searched=list(cached["searched"]))
+
+    searched: List[str] = []
+
+    # Fallback globs are only expanded once every earlier candidate failed
+    candidates = itertools.chain(
+        _env_candidates(), _path_candidates(), _fallback_candidates()
+    )
 
     seen = set()
-    for candidate, source in env_candidates:
+    for candidate, source in candidates:
         normalized = os.path.abspath(candidate)
         if normalized in seen:
             continue
@@ -91,13 +132,15 @@ def resolve_kicad_cli() -> Dict[str, Any]:
 
         ok, error = _validate_kicad_cli(normalized)
         if ok:
-            return {
+            result = {
                 "found": True,
                 "path": normalized,
                 "source": source,
                 "searched": searched,
                 "validationError": "",
             }
+            _RESOLVE_CACHE = (key, result)
+            return dict(result, searched=list(searched))
 
         continue
 
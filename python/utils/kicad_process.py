@@ -17,6 +17,10 @@ from typing import Optional, List
 
 logger = logging.getLogger(__name__)
 
+# Children started with os.posix_spawn. They are reaped in is_running() so
+# an exited KiCAD does not linger as a zombie that pgrep would still match.
+_spawned_pids = set()
+
 
 class KiCADProcessManager:
     """Manages KiCAD process detection and launching"""
@@ -89,6 +93,7 @@ class KiCADProcessManager:
             True if KiCAD process found, False otherwise
         """
         system = platform.system()
+        KiCADProcessManager._reap_spawned()
 
         try:
             if system == "Linux":
@@ -195,6 +200,46 @@ class KiCADProcessManager:
         logger.warning("Could not find KiCAD executable")
         return None
 
+    @staticmethod
+    def _spawn_detached(cmd: List[str]) -> None:
+        """
+        Start a program in its own session with its output discarded.
+
+        Uses os.posix_spawn where available, so the server is not forked
+        just to exec KiCAD, and falls back to subprocess.Popen otherwise.
+        """
+        if hasattr(os, "posix_spawn"):
+            file_actions = [
+                (os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_WRONLY, 0) for fd in (1, 2)
+            ]
+            try:
+                pid = os.posix_spawn(
+                    cmd[0], cmd, os.environ, file_actions=file_actions, setsid=True
+                )
+            except NotImplementedError:
+                pass
+            else:
+                _spawned_pids.add(pid)
+                return
+
+        subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+    @staticmethod
+    def _reap_spawned() -> None:
+        """Collect the exit status of spawned children that have finished."""
+        for pid in list(_spawned_pids):
+            try:
+                finished, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                finished = pid
+            if finished:
+                _spawned_pids.discard(pid)
+
     @staticmethod
     def launch(
         project_path: Optional[Path] = None, wait_for_start: bool = True
@@ -241,13 +286,8 @@ class KiCADProcessManager:
                     stderr=subprocess.DEVNULL,
                 )
             else:
-                # Unix: Use nohup or start in background
-                subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    start_new_session=True,
-                )
+                # Unix: start in a new session so it outlives the server
+                KiCADProcessManager._spawn_detached(cmd)
 
             # Wait for process to start
             if wait_for_start:
@@ -295,12 +335,7 @@ class KiCADProcessManager:
             if not exe_path:
                 return False
 
-            subprocess.Popen(
-                [str(exe_path), str(project_path)],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True,
-            )
+            KiCADProcessManager._spawn_detached([str(exe_path), str(project_path)])
             return True
         except Exception as e:
             logger.error(f"Error opening file in running KiCAD: {e}")
@@ -346,12 +381,7 @@ class KiCADProcessManager:
                     cmd = [str(exe)]
                     if schematic_path and schematic_path.exists():
                         cmd.append(str(schematic_path))
-                    subprocess.Popen(
-                        cmd,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                        start_new_session=True,
-                    )
+                    KiCADProcessManager._spawn_detached(cmd)
                     return True
 
             if system == "Windows":
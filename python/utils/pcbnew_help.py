@@ -0,0 +1,33 @@
+"""
+Troubleshooting messages shown when the pcbnew module cannot be imported
+
+Kept out of kicad_interface so the text is only loaded on the failure path.
+"""
+
+import sys
+
+_WIN_HELP = """
+Windows Troubleshooting:
+1. Verify KiCAD is installed: C:\\Program Files\\KiCad\\9.0
+2. Check PYTHONPATH environment variable points to:
+   C:\\Program Files\\KiCad\\9.0\\lib\\python3\\dist-packages
+3. Test with: "C:\\Program Files\\KiCad\\9.0\\bin\\python.exe" -c "import pcbnew"
+4. Log file location: %USERPROFILE%\\.kicad-mcp\\logs\\kicad_interface.log
+5. Run setup-windows.ps1 for automatic configuration
+"""
+
+_MAC_HELP = """
+macOS Troubleshooting:
+1. Verify KiCAD is installed: /Applications/KiCad/KiCad.app
+2. Check PYTHONPATH points to KiCAD's Python packages
+3. Run: python3 -c "import pcbnew" to test
+"""
+
+_LINUX_HELP = """
+Linux Troubleshooting:
+1. Verify KiCAD is installed: apt list --installed | grep kicad
+2. Check: /usr/lib/kicad/lib/python3/dist-packages exists
+3. Test: python3 -c "import pcbnew"
+"""
+
+PLATFORM_HELP = {"win32": _WIN_HELP, "darwin": _MAC_HELP}.get(sys.platform, _LINUX_HELP)
@@ -4,15 +4,20 @@ Platform detection and path utilities for cross-platform compatibility
 This module provides helpers for detecting the current platform and
 getting appropriate paths for KiCAD, configuration, logs, etc.
 """
+import functools
+import json
 import os
 import platform
 import sys
+import tempfile
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+KICAD_PATHS_CACHE_FILE = "kicad_paths.json"
+
 
 class PlatformHelper:
     """Platform detection and path resolution utilities"""
@@ -33,6 +38,7 @@ class PlatformHelper:
         return platform.system() == "Darwin"
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_platform_name() -> str:
         """Get human-readable platform name"""
         system = platform.system()
@@ -45,9 +51,17 @@ class PlatformHelper:
         """
         Get potential KiCAD Python dist-packages paths for current platform
 
+        The filesystem is probed once per process.
+
         Returns:
             List of potential paths to check (in priority order)
         """
+        return list(PlatformHelper._scan_kicad_python_paths())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _scan_kicad_python_paths() -> Tuple[Path, ...]:
+        """Probe the filesystem for KiCAD Python paths (see get_kicad_python_paths)"""
         paths = []
 
         if PlatformHelper.is_windows():
@@ -57,6 +71,8 @@ class PlatformHelper:
                 Path("C:/Program Files (x86)/KiCad"),
             ]
             for pf in program_files:
+                if not pf.is_dir():
+                    continue
                 # Check multiple KiCAD versions
                 for version in ["9.0", "9.1", "10.0", "8.0"]:
                     path = pf / version / "lib" / "python3" / "dist-packages"
@@ -123,7 +139,7 @@ class PlatformHelper:
         else:
             logger.info(f"Found {len(paths)} potential KiCAD Python paths")
 
-        return paths
+        return tuple(paths)
 
     @staticmethod
     def get_kicad_python_path() -> Optional[Path]:
@@ -251,16 +267,140 @@ class PlatformHelper:
         return Path(sys.executable)
 
     @staticmethod
-    def add_kicad_to_python_path() -> bool:
+    def get_kicad_install_roots() -> List[Path]:
+        """
+        Get the directories whose contents decide the KiCAD Python path scan
+
+        Installing or removing a KiCAD version adds or removes an entry in one
+        of these directories, which changes its modification time.
+
+        Returns:
+            List of directories (which may not exist) for the current platform
+        """
+        if PlatformHelper.is_windows():
+            return [
+                Path("C:/Program Files/KiCad"),
+                Path("C:/Program Files (x86)/KiCad"),
+            ]
+
+        if PlatformHelper.is_macos():
+            roots = [
+                Path("/Applications/KiCad"),
+                Path("/Applications/KiCAD"),
+                Path.home() / "Applications" / "KiCad",
+                Path("/opt/homebrew/lib/python3.12/site-packages"),
+                Path("/opt/homebrew/lib/python3.11/site-packages"),
+                Path("/usr/local/lib/python3.12/site-packages"),
+                Path("/usr/local/lib/python3.11/site-packages"),
+            ]
+        else:
+            # Linux candidates are checked individually, so key on their parents
+            roots = []
+            py_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+            for candidate in [
+                Path("/usr/lib/kicad/lib/python3/dist-packages"),
+                Path("/usr/share/kicad/scripting/plugins"),
+                Path("/usr/local/lib/kicad/lib/python3/dist-packages"),
+                Path.home() / ".local/lib/kicad/lib/python3/dist-packages",
+                Path(f"/usr/lib/python{py_version}/dist-packages/kicad"),
+                Path(f"/usr/local/lib/python{py_version}/dist-packages/kicad"),
+                Path("/usr/lib/python3/dist-packages"),
+                Path(f"/usr/lib/python{py_version}/dist-packages"),
+                Path("/usr/local/lib/python3/dist-packages"),
+                Path(f"/usr/local/lib/python{py_version}/dist-packages"),
+            ]:
+                if candidate.parent not in roots:
+                    roots.append(candidate.parent)
+
+        return roots
+
+    @staticmethod
+    def _stat_mtimes(paths) -> Dict[str, Optional[int]]:
+        """Map each path to its modification time, or None if it is missing"""
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[str(path)] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[str(path)] = None
+        return mtimes
+
+    @staticmethod
+    def _kicad_paths_cache_key() -> Dict[str, object]:
+        """Build the cache key for KiCAD Python path discovery (one stat per root)"""
+        return {
+            "platform": platform.system(),
+            "python": f"{sys.version_info.major}.{sys.version_info.minor}",
+            "roots": PlatformHelper._stat_mtimes(PlatformHelper.get_kicad_install_roots()),
+        }
+
+    @staticmethod
+    def get_cached_kicad_python_paths() -> List[Path]:
+        """
+        Get KiCAD Python paths, reusing the last scan while installs are unchanged
+
+        The scan result is stored in the cache directory together with the
+        modification times of the install roots and of the found paths. A
+        matching key skips the per-version directory probing entirely, as
+        long as every cached path still exists unchanged.
+
+        Returns:
+            List of KiCAD Python paths (same as get_kicad_python_paths)
+        """
+        cache_file = PlatformHelper.get_cache_dir() / KICAD_PATHS_CACHE_FILE
+        key = PlatformHelper._kicad_paths_cache_key()
+
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("key") == key:
+                # An in-place upgrade or removal shows up on the paths
+                # themselves, not on the install roots
+                cached_paths = cached.get("paths", {})
+                current = PlatformHelper._stat_mtimes(cached_paths)
+                if None not in current.values() and current == cached_paths:
+                    logger.debug(f"Using cached KiCAD Python paths from {cache_file}")
+                    return [Path(p) for p in cached_paths]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        paths = PlatformHelper.get_kicad_python_paths()
+
+        # Write atomically so a concurrent startup never reads a partial file
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=cache_file.parent, prefix=".kicad_paths-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"key": key, "paths": PlatformHelper._stat_mtimes(paths)}, f)
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not write KiCAD path cache {cache_file}: {e}")
+
+        return paths
+
+    @staticmethod
+    def add_kicad_to_python_path(paths: Optional[List[Path]] = None) -> bool:
         """
         Add KiCAD Python paths to sys.path
 
+        Args:
+            paths: Paths to add. Defaults to a fresh get_kicad_python_paths() scan.
+
         Returns:
             True if at least one path was added, False otherwise
         """
         paths_added = False
 
-        for path in PlatformHelper.get_kicad_python_paths():
+        if paths is None:
+            paths = PlatformHelper.get_kicad_python_paths()
+
+        for path in paths:
             if str(path) not in sys.path:
                 sys.path.insert(0, str(path))
                 logger.info(f"Added to Python path: {path}")
@@ -294,7 +434,6 @@ def detect_platform() -> dict:
 
 if __name__ == "__main__":
     # Quick test/diagnostic
-    import json
     info = detect_platform()
     print("Platform Information:")
     print(json.dumps(info, indent=2))
@@ -17,6 +17,13 @@ export function registerJLCPCBApiTools(server: McpServer, callKicadScript: Funct
     return 'unknown';
   };
 
+  const fmtSourceOptions = (official: any, publicSnapshot: any) =>
+    `1) official - available=${official.available ? 'yes' : 'no'}, est parts=${fmtRange(official.estimatedPartCount)}, est in-stock~${(official.estimatedInStockParts ?? '?').toLocaleString?.() ?? official.estimatedInStockParts ?? '?'}, est basic~${(official.estimatedBasicParts ?? '?').toLocaleString?.() ?? official.estimatedBasicParts ?? '?'}, est download=${official.estimatedDownloadSizeMB ?? '?'} MB, est DB=${official.estimatedDatabaseSizeMB} MB, est time=${fmtTimeRange(official.estimatedDownloadTimeMinutes)}\n` +
+    `   Note: ${official.recommendedUseCase || 'Signed official API dataset.'}\n` +
+    `2) public (hosted by yaqwsx) - est parts=${fmtRange(publicSnapshot.estimatedPartCount)}, est in-stock~${(publicSnapshot.estimatedInStockParts ?? '?').toLocaleString?.() ?? publicSnapshot.estimatedInStockParts ?? '?'}, est basic~${(publicSnapshot.estimatedBasicParts ?? '?').toLocaleString?.() ?? publicSnapshot.estimatedBasicParts ?? '?'}, est changed download=${publicSnapshot.estimatedUpdateDownloadMB ?? publicSnapshot.downloadSizeMB} MB, est DB=${publicSnapshot.estimatedDatabaseSizeMB} MB, est time=${fmtTimeRange(publicSnapshot.estimatedUpdateTimeMinutes || publicSnapshot.estimatedDownloadTimeMinutes)}\n` +
+    `   Archive reuse: changed=${publicSnapshot.changedArchiveParts ?? '?'} reused=${publicSnapshot.reusedArchiveParts ?? '?'}\n` +
+    `   Note: ${publicSnapshot.recommendedUseCase || 'Large public snapshot.'}`;
+
   const elicitChoice = async (message: string, enumValues: string[], enumNames: string[]) => {
     return await server.server.elicitInput({
       message,
@@ -68,13 +75,10 @@ for fast offline searching.`,
           const publicSnapshot = startResult.options?.public;
 
           const sourceInfo = official && publicSnapshot
-            ? `\n\nAvailable sources after replacement:\n` +
-              `1) official - available=${official.available ? 'yes' : 'no'}, est parts=${fmtRange(official.estimatedPartCount)}, est in-stock~${(official.estimatedInStockParts ?? '?').toLocaleString?.() ?? official.estimatedInStockParts ?? '?'}, est basic~${(official.estimatedBasicParts ?? '?').toLocaleString?.() ?? official.estimatedBasicParts ?? '?'}, est download=${official.estimatedDownloadSizeMB ?? '?'} MB, est DB=${official.estimatedDatabaseSizeMB} MB, est time=${fmtTimeRange(official.estimatedDownloadTimeMinutes)}\n` +
-              `   Note: ${official.recommendedUseCase || 'Signed official API dataset.'}\n` +
-              `2) public (hosted by yaqwsx) - est parts=${fmtRange(publicSnapshot.estimatedPartCount)}, est in-stock~${(publicSnapshot.estimatedInStockParts ?? '?').toLocaleString?.() ?? publicSnapshot.estimatedInStockParts ?? '?'}, est basic~${(publicSnapshot.estimatedBasicParts ?? '?').toLocaleString?.() ?? publicSnapshot.estimatedBasicParts ?? '?'}, est changed download=${publicSnapshot.estimatedUpdateDownloadMB ?? publicSnapshot.downloadSizeMB} MB, est DB=${publicSnapshot.estimatedDatabaseSizeMB} MB, est time=${fmtTimeRange(publicSnapshot.estimatedUpdateTimeMinutes || publicSnapshot.estimatedDownloadTimeMinutes)}\n` +
-              `   Archive reuse: changed=${publicSnapshot.changedArchiveParts ?? '?'} reused=${publicSnapshot.reusedArchiveParts ?? '?'}\n` +
-              `   Note: ${publicSnapshot.recommendedUseCase || 'Large public snapshot.'}`
-            : '';
+            ? `\n\nAvailable sources after replacement:\n` + fmtSourceOptions(official, publicSnapshot)
+            : startResult.estimatesAvailableVia
+              ? `\n\nRun ${startResult.estimatesAvailableVia} for source estimates.`
+              : '';
 
           try {
             const response = await elicitChoice(
@@ -196,11 +200,7 @@ for fast offline searching.`,
           try {
             const response = await elicitChoice(
               `Select JLC download source:\n` +
-                `1) official - available=${official.available ? 'yes' : 'no'}, est parts=${fmtRange(official.estimatedPartCount)}, est in-stock~${(official.estimatedInStockParts ?? '?').toLocaleString?.() ?? official.estimatedInStockParts ?? '?'}, est basic~${(official.estimatedBasicParts ?? '?').toLocaleString?.() ?? official.estimatedBasicParts ?? '?'}, est download=${official.estimatedDownloadSizeMB ?? '?'} MB, est DB=${official.estimatedDatabaseSizeMB} MB, est time=${fmtTimeRange(official.estimatedDownloadTimeMinutes)}\n` +
-                `   Note: ${official.recommendedUseCase || 'Signed official API dataset.'}\n` +
-                `2) public (hosted by yaqwsx) - est parts=${fmtRange(publicSnapshot.estimatedPartCount)}, est in-stock~${(publicSnapshot.estimatedInStockParts ?? '?').toLocaleString?.() ?? publicSnapshot.estimatedInStockParts ?? '?'}, est basic~${(publicSnapshot.estimatedBasicParts ?? '?').toLocaleString?.() ?? publicSnapshot.estimatedBasicParts ?? '?'}, est changed download=${publicSnapshot.estimatedUpdateDownloadMB ?? publicSnapshot.downloadSizeMB} MB, est DB=${publicSnapshot.estimatedDatabaseSizeMB} MB, est time=${fmtTimeRange(publicSnapshot.estimatedUpdateTimeMinutes || publicSnapshot.estimatedDownloadTimeMinutes)}\n` +
-                `   Archive reuse: changed=${publicSnapshot.changedArchiveParts ?? '?'} reused=${publicSnapshot.reusedArchiveParts ?? '?'}\n` +
-                `   Note: ${publicSnapshot.recommendedUseCase || 'Large public snapshot.'}`,
+                fmtSourceOptions(official, publicSnapshot),
               ['official', 'public'],
               ['Official API', 'Public snapshot (hosted by yaqwsx)'],
             );
@@ -261,6 +261,30 @@ for fast offline searching.`,
       }
   );
 
+  server.tool(
+    "get_jlcpcb_estimates",
+    "Get part count, size and time estimates for the official and public JLCPCB download sources",
+    {},
+    async () => {
+      const result = await callKicadScript("get_jlcpcb_estimates", {});
+      if (!result.success) {
+        return {
+          content: [{
+            type: "text",
+            text: `Failed to get download estimates: ${result.message || 'Unknown error'}`
+          }]
+        };
+      }
+
+      return {
+        content: [{
+          type: "text",
+          text: fmtSourceOptions(result.options.official, result.options.public)
+        }]
+      };
+    }
+  );
+
   server.tool(
     "get_jlcpcb_download_status",
     "Get current progress for an in-flight JLCPCB database download/import operation",
@@ -379,7 +403,7 @@ Provides real pricing, stock info, and library type (Basic parts = free assembly
 Use this to find components with exact specifications and cost optimization.`,
     {
       query: z.string().optional()
-        .describe("Free-text search (e.g., '10k resistor 0603', 'ESP32', 'STM32F103')"),
+        .describe("Free-text search (e.g., '10k resistor 0603', 'ESP32', 'STM32F103*', 'mfr_part:74LV*'); a bare LCSC number like 'C25804' is looked up directly"),
       category: z.string().optional()
         .describe("Filter by category (e.g., 'Resistors', 'Capacitors', 'Microcontrollers')"),
       package: z.string().optional()
@@ -407,8 +431,8 @@ Use this to find components with exact specifications and cost optimization.`,
         }
 
         const partsList = result.parts.map((p: any) => {
-          const priceInfo = p.price_breaks && p.price_breaks.length > 0
-            ? ` - $${p.price_breaks[0].price}/ea`
+          const priceInfo = p.first_price != null
+            ? ` - $${p.first_price}/ea`
             : '';
           const stockInfo = p.stock > 0 ? ` (${p.stock} in stock)` : ' (out of stock)';
           return `${p.lcsc}: ${p.mfr_part} - ${p.description} [${p.library_type}]${priceInfo}${stockInfo}`;
@@ -540,11 +564,11 @@ Useful for cost optimization and finding alternatives when parts are out of stoc
         }
 
         const altsList = result.alternatives.map((p: any, i: number) => {
-          const priceInfo = p.price_breaks && p.price_breaks.length > 0
-            ? ` - $${p.price_breaks[0].price}/ea`
+          const priceInfo = p.first_price != null
+            ? ` - $${p.first_price}/ea`
             : '';
-          const savings = result.reference_price && p.price_breaks && p.price_breaks.length > 0
-            ? ` (${((1 - p.price_breaks[0].price / result.reference_price) * 100).toFixed(0)}% cheaper)`
+          const savings = result.reference_price && p.first_price != null
+            ? ` (${((1 - p.first_price / result.reference_price) * 100).toFixed(0)}% cheaper)`
             : '';
           return `${i + 1}. ${p.lcsc}: ${p.mfr_part} [${p.library_type}]${priceInfo}${savings}\n   ${p.description}\n   Stock: ${p.stock}`;
         }).join('\n\n');
@@ -0,0 +1,33 @@
+"""
+Minimal stand-ins for kicad-skip objects used by the command module tests
+"""
+
+
+class Obj:
+    """Attribute bag standing in for any skip node"""
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+def symbol(reference, x, y, lib_id="Device:R"):
+    """A placed symbol with a Reference property, position and library id"""
+    return Obj(
+        property=Obj(Reference=Obj(value=reference)),
+        at=Obj(value=[x, y, 0.0]),
+        lib_id=Obj(value=lib_id),
+    )
+
+
+class FakeSchematic:
+    """skip.Schematic holding a single resistor R1 at ``origin`` and no wires"""
+
+    origin = (10.0, 10.0)
+
+    def __init__(self, _path):
+        self.symbol = [symbol("R1", *self.origin)]
+        self.wire = []
+
+    def write(self, _path):
+        return None
@@ -0,0 +1,47 @@
+"""
+Shared test setup
+
+Tests import command modules as ``commands.<name>`` without running the real
+package __init__ or needing KiCAD's ``skip`` library; the schematic
+connection manager is replaced by a stub. These are installed once per
+session.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+COMMANDS_DIR = Path(__file__).parent.parent / "python" / "commands"
+
+
+class _FakeConnectionManager:
+    @staticmethod
+    def generate_netlist(*_args, **_kwargs):
+        return {"nets": []}
+
+    @staticmethod
+    def connect_to_net(*_args, **_kwargs):
+        return True
+
+
+def _make_module(name: str, **attrs) -> types.ModuleType:
+    module = types.ModuleType(name)
+    for attr, value in attrs.items():
+        setattr(module, attr, value)
+    return module
+
+
+# A bare package over python/commands: submodules import normally and are
+# cached in sys.modules, without running the real package __init__
+_STUB_MODULES = (
+    _make_module("commands", __path__=[str(COMMANDS_DIR)]),
+    _make_module("skip", Schematic=object),
+    _make_module(
+        "commands.connection_schematic", ConnectionManager=_FakeConnectionManager
+    ),
+)
+
+# setdefault keeps whichever module got there first, so no test can swap in
+# a second, different stub
+for _stub in _STUB_MODULES:
+    sys.modules.setdefault(_stub.__name__, _stub)
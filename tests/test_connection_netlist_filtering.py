@@ -1,79 +1,71 @@
 import sys
 import types
+import functools
 import importlib.util
 from pathlib import Path
+from unittest import mock
 
-ROOT = Path(__file__).parent.parent
-CONNECTION_PATH = ROOT / "python" / "commands" / "connection_schematic.py"
+import pytest
 
+from tests._fakes import Obj as _Obj
 
-def _ensure_import_stubs():
-    if "commands" not in sys.modules:
-        sys.modules["commands"] = types.ModuleType("commands")
-
-    if "skip" not in sys.modules:
-        skip_module = types.ModuleType("skip")
-        setattr(skip_module, "Schematic", object)
-        sys.modules["skip"] = skip_module
+ROOT = Path(__file__).parent.parent
+CONNECTION_PATH = ROOT / "python" / "commands" / "connection_schematic.py"
 
-    if "commands.wire_manager" not in sys.modules:
-        wm = types.ModuleType("commands.wire_manager")
 
-        class WireManager:
-            @staticmethod
-            def add_wire(*_args, **_kwargs):
-                return True
+class _WireManager:
+    @staticmethod
+    def add_wire(*_args, **_kwargs):
+        return True
 
-            @staticmethod
-            def add_polyline_wire(*_args, **_kwargs):
-                return True
+    @staticmethod
+    def add_polyline_wire(*_args, **_kwargs):
+        return True
 
-            @staticmethod
-            def add_label(*_args, **_kwargs):
-                return True
+    @staticmethod
+    def add_label(*_args, **_kwargs):
+        return True
 
-            @staticmethod
-            def create_orthogonal_path(start, end, prefer_horizontal_first=True):
-                return [start, end]
+    @staticmethod
+    def create_orthogonal_path(start, end, prefer_horizontal_first=True):
+        return [start, end]
 
-        setattr(wm, "WireManager", WireManager)
-        sys.modules["commands.wire_manager"] = wm
 
-    if "commands.pin_locator" not in sys.modules:
-        pl = types.ModuleType("commands.pin_locator")
+class _PinLocator:
+    def get_pin_location(self, *_args, **_kwargs):
+        return [0.0, 0.0]
 
-        class PinLocator:
-            def get_pin_location(self, *_args, **_kwargs):
-                return [0.0, 0.0]
+    def get_pin_info(self, *_args, **_kwargs):
+        return {"x": 0.0, "y": 0.0, "effective_angle": 0.0}
 
-            def get_pin_info(self, *_args, **_kwargs):
-                return {"x": 0.0, "y": 0.0, "effective_angle": 0.0}
+    def get_symbol_pins(self, *_args, **_kwargs):
+        return {}
 
-            def get_symbol_pins(self, *_args, **_kwargs):
-                return {}
 
-        setattr(pl, "PinLocator", PinLocator)
-        sys.modules["commands.pin_locator"] = pl
+def _import_stubs():
+    wm = types.ModuleType("commands.wire_manager")
+    setattr(wm, "WireManager", _WireManager)
+    pl = types.ModuleType("commands.pin_locator")
+    setattr(pl, "PinLocator", _PinLocator)
+    return {"commands.wire_manager": wm, "commands.pin_locator": pl}
 
 
+# Executed once per session. The real connection_schematic is loaded against
+# stubbed helpers, which are only visible while it imports, so other tests
+# still get the real commands.pin_locator.
+@functools.lru_cache(maxsize=None)
 def _load_connection_manager():
-    _ensure_import_stubs()
     spec = importlib.util.spec_from_file_location(
         "commands.connection_schematic", CONNECTION_PATH
     )
     assert spec is not None
     assert spec.loader is not None
     module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    with mock.patch.dict(sys.modules, _import_stubs()):
+        spec.loader.exec_module(module)
     return module.ConnectionManager
 
 
-class _Obj:
-    def __init__(self, **kwargs):
-        for key, value in kwargs.items():
-            setattr(self, key, value)
-
-
 def test_generate_netlist_filters_templates_by_default():
     manager = _load_connection_manager()
     regular = _Obj(
@@ -100,3 +92,74 @@ def test_generate_netlist_filters_templates_by_default():
         "R1",
         "_TEMPLATE_Device_R",
     ]
+
+
+def test_get_net_connections_lists_each_component_once():
+    manager = _load_connection_manager()
+
+    def point(x, y):
+        return _Obj(value=[x, y])
+
+    def unit(x, y):
+        return _Obj(
+            property=_Obj(Reference=_Obj(value="U1")),
+            lib_id=_Obj(value="Amplifier_Operational:LM358"),
+            at=_Obj(value=[x, y, 0]),
+        )
+
+    fake = _Obj(
+        label=[_Obj(value="VCC", at=_Obj(value=[10.0, 10.0, 0]))],
+        wire=[
+            _Obj(pts=_Obj(xy=[point(10.2, 10.1), point(20.0, 10.0)])),
+            _Obj(pts=_Obj(xy=[point(50.0, 50.0), point(60.0, 50.0)])),
+        ],
+        # Two units of the same multi-unit part sit next to the net
+        symbol=[unit(20.0, 12.0), unit(22.0, 12.0)],
+    )
+
+    connections = manager.get_net_connections(fake, "VCC")
+    assert connections == [{"component": "U1", "pin": "unknown"}]
+
+
+def test_get_net_index_resolves_every_net_in_one_pass():
+    manager = _load_connection_manager()
+
+    def point(x, y):
+        return _Obj(value=[x, y])
+
+    def symbol(ref, x, y):
+        return _Obj(
+            property=_Obj(Reference=_Obj(value=ref)),
+            lib_id=_Obj(value="Device:R"),
+            at=_Obj(value=[x, y, 0]),
+        )
+
+    fake = _Obj(
+        label=[
+            _Obj(value="VCC", at=_Obj(value=[0.0, 0.0, 0])),
+            _Obj(value="GND", at=_Obj(value=[100.0, 0.0, 0])),
+            _Obj(value="NC", at=_Obj(value=[200.0, 200.0, 0])),
+        ],
+        wire=[
+            _Obj(pts=_Obj(xy=[point(0.0, 0.0), point(0.0, 20.0)])),
+            _Obj(pts=_Obj(xy=[point(100.0, 0.0), point(100.0, 20.0)])),
+        ],
+        symbol=[symbol("R1", 2.0, 20.0), symbol("R2", 98.0, 20.0)],
+    )
+
+    index = manager.get_net_index(fake)
+    assert index == {
+        "VCC": [{"component": "R1", "pin": "unknown"}],
+        "GND": [{"component": "R2", "pin": "unknown"}],
+        "NC": [],
+    }
+    assert manager.get_net_connections(fake, "GND") == index["GND"]
+
+
+def test_get_net_index_raises_instead_of_returning_an_empty_index():
+    manager = _load_connection_manager()
+    fake = _Obj(label=[_Obj(value="VCC", at=_Obj(value=["x", "y", 0]))])
+
+    with pytest.raises(ValueError):
+        manager.get_net_index(fake)
+    assert manager.get_net_connections(fake, "VCC") == []
@@ -1,25 +1,6 @@
-import re
-import sys
-import importlib.util
 from pathlib import Path
 
-
-def _load_dynamic_symbol_loader():
-    module_path = (
-        Path(__file__).parent.parent
-        / "python"
-        / "commands"
-        / "dynamic_symbol_loader.py"
-    )
-    spec = importlib.util.spec_from_file_location("dynamic_symbol_loader", module_path)
-    assert spec is not None
-    assert spec.loader is not None
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module.DynamicSymbolLoader
-
-
-DynamicSymbolLoader = _load_dynamic_symbol_loader()
+from commands.dynamic_symbol_loader import DynamicSymbolLoader
 
 
 def _write_minimal_schematic(path: Path, reference: str = "R1") -> str:
@@ -88,8 +69,55 @@ def test_create_component_instance_is_idempotent_for_new_reference(tmp_path):
     )
 
     text = sch_path.read_text(encoding="utf-8")
-    ref_count = len(re.findall(r'\(property "Reference" "C1"', text))
+    ref_count = text.count('(property "Reference" "C1"')
 
     assert ok_first is True
     assert ok_second is True
     assert ref_count == 1
+
+
+def test_add_components_writes_schematic_once(tmp_path, monkeypatch):
+    sch_path = tmp_path / "batched.kicad_sch"
+    sch_path.write_text(
+        "(kicad_sch\n"
+        "  (version 20231120)\n"
+        "  (lib_symbols\n"
+        "  )\n"
+        "  (sheet_instances)\n"
+        ")\n",
+        encoding="utf-8",
+    )
+
+    loader = DynamicSymbolLoader()
+    monkeypatch.setattr(
+        loader,
+        "extract_symbol_from_library",
+        lambda library_name, symbol_name: f'(symbol "{library_name}:{symbol_name}")',
+    )
+    writes = []
+    original_write = loader._write_schematic
+    monkeypatch.setattr(
+        loader,
+        "_write_schematic",
+        lambda path, content: (writes.append(path), original_write(path, content)),
+    )
+
+    count = loader.add_components(
+        sch_path,
+        [
+            {"library_name": "Device", "symbol_name": "R", "reference": "R1"},
+            {"library_name": "Device", "symbol_name": "R", "reference": "R2", "x": 10},
+            {"library_name": "Device", "symbol_name": "C", "reference": "C1"},
+        ],
+    )
+
+    text = sch_path.read_text(encoding="utf-8")
+    assert count == 3
+    assert len(writes) == 1
+    assert text.count('(symbol "Device:R")') == 1
+    assert text.count('(symbol "Device:C")') == 1
+    for reference in ("R1", "R2", "C1"):
+        assert f'(property "Reference" "{reference}"' in text
+
+    # The cached text is reused until the file changes on disk
+    assert loader._read_schematic(sch_path) is loader.schematic_cache[str(sch_path)][1]
@@ -0,0 +1,228 @@
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "python"))
+
+from kicad_api.ipc_backend import IPCBoardAPI
+
+
+class _Vector:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    @staticmethod
+    def from_xy(x, y):
+        return _Vector(x, y)
+
+
+class _Angle:
+    def __init__(self, degrees):
+        self.degrees = degrees
+
+    @staticmethod
+    def from_degrees(degrees):
+        return _Angle(degrees)
+
+
+class _Footprint:
+    def __init__(self, reference):
+        self.reference_field = types.SimpleNamespace(
+            text=types.SimpleNamespace(value=reference)
+        )
+        self.value_field = None
+        self.definition = None
+        self.position = _Vector(1_000_000, 2_000_000)
+        self.orientation = _Angle(0)
+        self.layer = "F.Cu"
+        self.id = reference
+
+
+class _Item:
+    pass
+
+
+class _Enum:
+    def __getattr__(self, name):
+        return name
+
+
+class _Board:
+    def __init__(self, count):
+        self.count = count
+        self.fetches = 0
+        self.updates = []
+        self.created = []
+        self.commits = 0
+        self.net_fetches = 0
+
+    def get_footprints(self):
+        self.fetches += 1
+        return [_Footprint(f"R{i}") for i in range(self.count)]
+
+    def begin_commit(self):
+        return object()
+
+    def push_commit(self, commit, description):
+        self.commits += 1
+
+    def create_items(self, items):
+        self.created.append(items)
+
+    def get_nets(self):
+        self.net_fetches += 1
+        return [types.SimpleNamespace(name="GND"), types.SimpleNamespace(name="VCC")]
+
+    def update_items(self, items):
+        self.updates.extend(items)
+
+
+@pytest.fixture
+def kipy_stubs(monkeypatch):
+    units = types.ModuleType("kipy.util.units")
+    units.to_mm = lambda value: value / 1_000_000
+    units.from_mm = lambda value: int(round(value * 1_000_000))
+    geometry = types.ModuleType("kipy.geometry")
+    geometry.Vector2 = _Vector
+    geometry.Angle = _Angle
+    board_types = types.ModuleType("kipy.board_types")
+    board_types.Track = board_types.Via = board_types.BoardText = _Item
+    board_types_pb2 = types.ModuleType("kipy.proto.board.board_types_pb2")
+    board_types_pb2.BoardLayer = board_types_pb2.ViaType = _Enum()
+    for name, module in {
+        "kipy": types.ModuleType("kipy"),
+        "kipy.board_types": board_types,
+        "kipy.proto": types.ModuleType("kipy.proto"),
+        "kipy.proto.board": types.ModuleType("kipy.proto.board"),
+        "kipy.proto.board.board_types_pb2": board_types_pb2,
+        "kipy.util": types.ModuleType("kipy.util"),
+        "kipy.util.units": units,
+        "kipy.geometry": geometry,
+    }.items():
+        monkeypatch.setitem(sys.modules, name, module)
+
+
+def _api(board):
+    return IPCBoardAPI(types.SimpleNamespace(get_board=lambda: board), lambda *_: None)
+
+
+def test_component_lookups_in_a_transaction_share_one_fetch(kipy_stubs):
+    board = _Board(300)
+    api = _api(board)
+
+    api.begin_transaction()
+    for i in range(20):
+        component = api.get_component(f"R{i}")
+        assert component["reference"] == f"R{i}"
+        assert api.move_component(f"R{i}", 5.0, 6.0, rotation=90)
+    moved = api.get_component("R3")
+    missing = api.get_component("missing")
+    api.commit_transaction()
+
+    assert board.fetches == 1
+    assert moved["position"] == {"x": 5.0, "y": 6.0, "unit": "mm"}
+    assert moved["rotation"] == 90
+    assert missing is None
+
+
+def test_placement_drops_the_footprint_cache(kipy_stubs, monkeypatch):
+    board = _Board(3)
+    api = _api(board)
+    monkeypatch.setattr(api, "_load_footprint_from_library", lambda footprint: None)
+    monkeypatch.setattr(api, "_place_placeholder_footprint", lambda *args: True)
+
+    api.list_components()
+    api.place_component("R9", "Resistor_SMD:R_0603_1608Metric", 0, 0)
+    api.list_components()
+
+    assert board.fetches == 2
+
+
+def test_rotate_updates_orientation_only(kipy_stubs):
+    board = _Board(3)
+    api = _api(board)
+
+    api.begin_transaction()
+    assert api.rotate_component("R1", 90) == 90
+    assert api.rotate_component("R1", 300) == 30
+    assert api.rotate_component("missing", 90) is None
+    api.commit_transaction()
+
+    assert board.fetches == 1
+    assert [fp.reference_field.text.value for fp in board.updates] == ["R1", "R1"]
+    assert board.updates[-1].position.x == 1_000_000
+
+
+def test_add_tracks_creates_the_batch_in_one_commit(kipy_stubs):
+    board = _Board(0)
+    api = _api(board)
+
+    result = api.add_tracks(
+        [
+            (0, 0, 1, 0, 0.25, "F.Cu", "GND"),
+            (1, 0, None, 0, 0.25, "F.Cu", None),
+            (1, 0, 1, 2, 0.25, "F.Cu", "VCC"),
+        ]
+    )
+
+    assert result == {"added": 2, "failed_indices": [1]}
+    assert board.commits == 1
+    assert board.net_fetches == 1
+    [created] = board.created
+    assert [track.net.name for track in created] == ["GND", "VCC"]
+    assert created[1].end.y == 2_000_000
+
+
+def test_add_vias_reads_net_and_type_by_name(kipy_stubs):
+    board = _Board(0)
+    api = _api(board)
+
+    result = api.add_vias([(1, 2, 0.8, 0.4, "GND", "micro"), (3, 4)])
+
+    assert result == {"added": 2, "failed_indices": []}
+    [created] = board.created
+    assert created[0].net.name == "GND"
+    assert created[0].type == "VT_MICRO"
+    assert created[1].type == "VT_THROUGH"
+    assert not hasattr(created[1], "net")
+
+
+def test_list_components_reuses_memo_until_a_footprint_changes(kipy_stubs):
+    board = _Board(3)
+    api = _api(board)
+
+    api.begin_transaction()
+    first = api.list_components()
+    first[0]["value"] = "edited"
+    first[0]["position"]["x"] = -1.0
+    second = api.list_components()
+    assert api.move_component("R2", 7.0, 8.0)
+    moved = api.list_components()
+    api.commit_transaction()
+
+    assert board.fetches == 1
+    assert second[1:] == first[1:]
+    # Callers get copies, so editing one does not reach the memo
+    assert second[0]["value"] != "edited"
+    assert second[0]["position"]["x"] != -1.0
+    assert moved[2]["position"] == {"x": 7.0, "y": 8.0, "unit": "mm"}
+
+
+def test_create_items_joins_an_open_transaction(kipy_stubs):
+    board = _Board(0)
+    api = _api(board)
+
+    api.create_items([_Item()], "Added outline")
+    assert board.commits == 1
+
+    api.begin_transaction()
+    api.create_items([_Item()], "Added outline")
+    api.create_items(_Item(), "Added hole")
+    assert board.commits == 1
+    api.commit_transaction()
+
+    assert board.commits == 2
+    assert len(board.created) == 3
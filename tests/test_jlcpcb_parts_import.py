@@ -0,0 +1,521 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from commands.jlcpcb_parts import JLCPCBPartsManager
+
+# Seed rows for the fake yaqwsx snapshot
+_INSERT_CACHE_ROW_SQL = (
+    "INSERT INTO components VALUES (?, 1, ?, '0603', 2, 1, 1, 0, ?, '', 100, '[]', ?)"
+)
+
+
+@pytest.fixture(scope="session")
+def _parts_db_template(tmp_path_factory):
+    # Run the manager's schema setup once and keep the result in memory
+    path = tmp_path_factory.mktemp("jlcpcb") / "template.db"
+    JLCPCBPartsManager(str(path)).close()
+    template = sqlite3.connect(":memory:")
+    built = sqlite3.connect(path)
+    built.backup(template)
+    built.close()
+    yield template
+    template.close()
+
+
+@pytest.fixture
+def parts_db(tmp_path, _parts_db_template):
+    # Each test gets its own file cloned from the pre-built schema
+    path = tmp_path / "parts.db"
+    target = sqlite3.connect(path)
+    _parts_db_template.backup(target)
+    target.close()
+    return str(path)
+
+
+def _write_yaqwsx_cache(path: Path, rows) -> str:
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        PRAGMA journal_mode = MEMORY;
+        PRAGMA synchronous = OFF;
+        DROP TABLE IF EXISTS components;
+        DROP TABLE IF EXISTS categories;
+        DROP TABLE IF EXISTS manufacturers;
+        CREATE TABLE categories (id INTEGER PRIMARY KEY, category TEXT, subcategory TEXT);
+        CREATE TABLE manufacturers (id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE components (
+            lcsc INTEGER PRIMARY KEY,
+            category_id INTEGER,
+            mfr TEXT,
+            package TEXT,
+            joints INTEGER,
+            manufacturer_id INTEGER,
+            basic INTEGER,
+            preferred INTEGER,
+            description TEXT,
+            datasheet TEXT,
+            stock INTEGER,
+            price TEXT,
+            last_update INTEGER
+        );
+        INSERT INTO categories
+            VALUES (1, 'Chip Resistor - Surface Mount', 'Chip Resistor - Surface Mount');
+        INSERT INTO manufacturers VALUES (1, 'UNI-ROYAL');
+        """)
+    conn.executemany(_INSERT_CACHE_ROW_SQL, rows)
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+def _fts_lcsc(manager, term):
+    rows = manager.conn.execute(
+        "SELECT lcsc FROM components_fts WHERE components_fts MATCH ? ORDER BY lcsc",
+        (term,),
+    ).fetchall()
+    return [row["lcsc"] for row in rows]
+
+
+def test_incremental_import_replaces_stale_fts_entries(tmp_path, parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+    cache = tmp_path / "cache.sqlite3"
+
+    _write_yaqwsx_cache(
+        cache,
+        [
+            (25804, "0603WAF1002T5E", "10k resistor", 100),
+            (21190, "0603WAF1001T5E", "1k resistor", 100),
+        ],
+    )
+    manager.import_yaqwsx_cache(str(cache))
+    assert _fts_lcsc(manager, "resistor") == ["C21190", "C25804"]
+
+    _write_yaqwsx_cache(
+        cache,
+        [
+            (25804, "0603WAF1002T5E", "10k thickfilm", 200),
+            (21190, "0603WAF1001T5E", "1k resistor", 100),
+        ],
+    )
+    result = manager.import_yaqwsx_cache(str(cache), incremental_since=150)
+
+    assert result["imported"] == 1
+    assert _fts_lcsc(manager, "resistor") == ["C21190"]
+    assert _fts_lcsc(manager, "thickfilm") == ["C25804"]
+    manager.conn.execute(
+        "INSERT INTO components_fts(components_fts) VALUES('integrity-check')"
+    )
+    manager.close()
+
+
+def test_search_parts_reuses_sql_per_filter_combination(tmp_path, parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+    cache = _write_yaqwsx_cache(
+        tmp_path / "cache.sqlite3",
+        [
+            (25804, "0603WAF1002T5E", "10k resistor", 100),
+            (21190, "0603WAF1001T5E", "1k resistor", 100),
+        ],
+    )
+    manager.import_yaqwsx_cache(cache)
+
+    first = manager._build_search_sql(True, False, True, False, False, True, False)
+    second = manager._build_search_sql(True, False, True, False, False, True, False)
+    results = manager.search_parts(query="10k", package="0603")
+
+    assert first is second
+    assert [part.lcsc for part in results] == ["C25804"]
+    assert manager.search_parts(query="10k", package="0402") == []
+    manager.close()
+
+
+def test_search_parts_projects_columns_and_price_is_opt_in(tmp_path, parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+    cache = _write_yaqwsx_cache(
+        tmp_path / "cache.sqlite3",
+        [(25804, "0603WAF1002T5E", "10k resistor", 100)],
+    )
+    with sqlite3.connect(cache) as source:
+        source.execute(
+            'UPDATE components SET price = \'[{"qFrom": 1, "price": 0.0012}]\''
+        )
+    source.close()
+    manager.import_yaqwsx_cache(cache)
+
+    [listed] = manager.search_parts(query="10k")
+    [priced] = manager.search_parts(query="10k", include_price=True)
+
+    assert listed.first_price is None
+    assert "datasheet" not in listed._fields
+    assert listed.mfr_part == "0603WAF1002T5E"
+    assert priced.first_price == 0.0012
+    assert priced._asdict()["lcsc"] == "C25804"
+    manager.close()
+
+
+def test_database_stats_on_empty_and_populated_database(tmp_path, parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+    empty = manager.get_database_stats()
+    assert (empty["total_parts"], empty["basic_parts"], empty["in_stock"]) == (0, 0, 0)
+
+    cache = _write_yaqwsx_cache(
+        tmp_path / "cache.sqlite3",
+        [
+            (25804, "0603WAF1002T5E", "10k resistor", 100),
+            (21190, "0603WAF1001T5E", "1k resistor", 100),
+        ],
+    )
+    manager.import_yaqwsx_cache(cache)
+    stats = manager.get_database_stats()
+
+    assert stats["total_parts"] == 2
+    assert stats["basic_parts"] == 2
+    assert stats["extended_parts"] == 0
+    assert stats["in_stock"] == 2
+    manager.close()
+
+
+def test_suggest_alternatives_returns_parts_without_the_original(tmp_path, parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+    cache = _write_yaqwsx_cache(
+        tmp_path / "cache.sqlite3",
+        [
+            (25804, "0603WAF1002T5E", "10k resistor", 100),
+            (21190, "0603WAF1001T5E", "1k resistor", 100),
+        ],
+    )
+    manager.import_yaqwsx_cache(cache)
+
+    alternatives = manager.suggest_alternatives("C25804")
+
+    assert [part.lcsc for part in alternatives] == ["C21190"]
+    manager.close()
+
+
+def test_connection_uses_wal_and_restores_sync_after_import(tmp_path, parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+    cache = _write_yaqwsx_cache(
+        tmp_path / "cache.sqlite3",
+        [(25804, "0603WAF1002T5E", "10k resistor", 100)],
+    )
+
+    assert manager.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    manager.import_yaqwsx_cache(cache)
+
+    # 1 == NORMAL
+    assert manager.conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert manager.conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+    assert manager.conn.execute("PRAGMA cache_size").fetchone()[0] == -20000
+    assert manager.conn.execute("PRAGMA threads").fetchone()[0] == 0
+    manager.close()
+
+
+def test_lookups_use_query_only_connection_with_committed_data(parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+    manager.import_parts([{"componentCode": "C1", "describe": "10k resistor"}])
+
+    assert manager.read_conn.execute("PRAGMA query_only").fetchone()[0] == 1
+    assert manager.read_conn.execute("PRAGMA mmap_size").fetchone()[0] == 1 << 30
+
+    # An open write transaction is not visible until it commits
+    manager.conn.execute("DELETE FROM components")
+    assert manager.get_part_info("C1") is not None
+    manager.conn.commit()
+    assert manager.get_part_info("C1") is None
+    assert manager.has_parts() is False
+    manager.close()
+
+
+def test_search_parts_ranks_query_matches_by_relevance(tmp_path, parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+    cache = _write_yaqwsx_cache(
+        tmp_path / "cache.sqlite3",
+        [
+            (1001, "GENERIC", "thick film chip resistor general purpose", 100),
+            (2002, "PRECISE", "precision resistor resistor network", 100),
+        ],
+    )
+    manager.import_yaqwsx_cache(cache)
+
+    results = manager.search_parts(query="resistor")
+
+    assert [part.lcsc for part in results] == ["C2002", "C1001"]
+    assert [part.lcsc for part in manager.search_parts(query="resistor", limit=1)] == [
+        "C2002"
+    ]
+    manager.close()
+
+
+def test_import_parts_streams_a_generator_in_batches(parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+    consumed = []
+
+    def api_parts():
+        for n in range(2500):
+            consumed.append(n)
+            yield {
+                "componentCode": f"C{n}",
+                "componentModelEn": f"PART{n}",
+                "describe": "streamed resistor",
+                "stockCount": 1,
+            }
+
+    progress = []
+    manager.import_parts(
+        api_parts(),
+        progress_callback=lambda curr, total, msg: progress.append((curr, total)),
+        batch_size=1000,
+    )
+
+    assert len(consumed) == 2500
+    assert progress == [(1000, None), (2000, None)]
+    assert manager.get_database_stats()["total_parts"] == 2500
+    assert len(_fts_lcsc(manager, "streamed")) == 2500
+    manager.close()
+
+
+def test_cached_database_stats_are_dropped_by_the_next_import(tmp_path, parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+    cache = tmp_path / "cache.sqlite3"
+    _write_yaqwsx_cache(cache, [(25804, "0603WAF1002T5E", "10k resistor", 100)])
+    manager.import_yaqwsx_cache(str(cache))
+
+    assert manager.get_cached_database_stats()["total_parts"] == 1
+    manager.conn.execute("DELETE FROM components")
+    manager.conn.commit()
+    # Served from metadata, so the out-of-band delete is not seen
+    assert manager.get_cached_database_stats()["total_parts"] == 1
+
+    _write_yaqwsx_cache(
+        cache,
+        [
+            (25804, "0603WAF1002T5E", "10k resistor", 100),
+            (21190, "0603WAF1001T5E", "1k resistor", 100),
+        ],
+    )
+    manager.import_yaqwsx_cache(str(cache))
+
+    assert manager.get_cached_database_stats()["total_parts"] == 2
+    manager.close()
+
+
+def test_bulk_load_rebuilds_indexes_and_restores_pragmas(parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+
+    def index_names():
+        rows = manager.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+            " AND tbl_name = 'components' AND name LIKE 'idx_%'"
+        ).fetchall()
+        return sorted(row["name"] for row in rows)
+
+    indexes = index_names()
+    with manager.bulk_load(drop_indexes=True):
+        assert index_names() == []
+        manager.import_parts([{"componentCode": "C1", "describe": "bulk resistor"}])
+
+    assert index_names() == indexes
+    assert manager.conn.execute("PRAGMA cache_size").fetchone()[0] == -20000
+    assert _fts_lcsc(manager, "bulk") == ["C1"]
+    manager.close()
+
+
+def test_large_incremental_import_rebuilds_indexes(tmp_path, parts_db, monkeypatch):
+    manager = JLCPCBPartsManager(parts_db)
+    cache = tmp_path / "cache.sqlite3"
+    _write_yaqwsx_cache(cache, [(25804, "0603WAF1002T5E", "10k resistor", 100)])
+    manager.import_yaqwsx_cache(str(cache))
+
+    drops = []
+    original_drop = manager._drop_component_indexes
+    monkeypatch.setattr(
+        manager,
+        "_drop_component_indexes",
+        lambda cursor: (drops.append(1), original_drop(cursor)),
+    )
+    _write_yaqwsx_cache(
+        cache,
+        [
+            (25804, "0603WAF1002T5E", "10k resistor", 100),
+            (21190, "0603WAF1001T5E", "1k resistor", 200),
+        ],
+    )
+    manager.import_yaqwsx_cache(str(cache), incremental_since=150)
+
+    assert drops == [1]
+    indexes = manager.conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'idx_package'"
+    ).fetchall()
+    assert len(indexes) == 1
+    assert len(manager.search_parts(package="0603")) == 2
+    manager.close()
+
+
+def test_cached_metadata_reads_once_and_follows_set_metadata(parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+    manager.set_metadata("yaqwsx_last_total_parts", "10")
+    manager._meta_cache.clear()
+
+    assert manager.cached_metadata("yaqwsx_last_total_parts") == "10"
+    manager.conn.execute(
+        "UPDATE metadata SET value = '99' WHERE key = 'yaqwsx_last_total_parts'"
+    )
+    assert manager.cached_metadata("yaqwsx_last_total_parts") == "10"
+
+    manager.set_metadata("yaqwsx_last_total_parts", "20")
+    assert manager.cached_metadata("yaqwsx_last_total_parts") == "20"
+    assert manager.cached_metadata("missing") is None
+
+
+def test_cached_db_size_is_reused_until_the_next_import(
+    tmp_path, parts_db, monkeypatch
+):
+    manager = JLCPCBPartsManager(parts_db)
+    cache = tmp_path / "cache.sqlite3"
+    _write_yaqwsx_cache(cache, [(25804, "0603WAF1002T5E", "10k resistor", 100)])
+    manager.import_yaqwsx_cache(str(cache))
+
+    size_mb = manager.get_cached_db_size_mb()
+    sizes = []
+    monkeypatch.setattr(
+        "os.path.getsize", lambda path: sizes.append(path) or 3 * 1024 * 1024
+    )
+    assert manager.get_cached_db_size_mb() == size_mb
+    assert sizes == []
+
+    manager.import_yaqwsx_cache(str(cache))
+    assert manager.get_cached_db_size_mb() == 3.0
+    assert len(sizes) == 1
+    manager.close()
+
+
+def test_imports_and_legacy_databases_get_planner_statistics(tmp_path, parts_db):
+    db_path = parts_db
+    manager = JLCPCBPartsManager(db_path)
+    cache = tmp_path / "cache.sqlite3"
+    _write_yaqwsx_cache(cache, [(25804, "0603WAF1002T5E", "10k resistor", 100)])
+    manager.import_yaqwsx_cache(str(cache))
+
+    def _stat_indexes(conn):
+        return {row[0] for row in conn.execute("SELECT idx FROM sqlite_stat1")}
+
+    assert "idx_library_stock" in _stat_indexes(manager.conn)
+
+    manager.conn.execute("DROP TABLE sqlite_stat1")
+    manager.conn.commit()
+    manager.conn.close()
+
+    reopened = JLCPCBPartsManager(db_path)
+    assert "idx_library_stock" in _stat_indexes(reopened.conn)
+    reopened.close()
+
+
+def test_search_parts_quotes_punctuation_and_keeps_prefix_and_column(
+    tmp_path, parts_db
+):
+    manager = JLCPCBPartsManager(parts_db)
+    cache = _write_yaqwsx_cache(
+        tmp_path / "cache.sqlite3",
+        [
+            (1001, "74LVC1G08", "AND gate 100nF/50V decoupled", 100),
+            (2002, "RC0603", "74LV compatible resistor", 100),
+        ],
+    )
+    manager.import_yaqwsx_cache(cache)
+
+    def lcscs(query):
+        return sorted(part.lcsc for part in manager.search_parts(query=query))
+
+    assert lcscs("100nF/50V, AND") == ["C1001"]
+    assert lcscs("74LV*") == ["C1001", "C2002"]
+    assert lcscs("mfr_part:74LV*") == ["C1001"]
+    assert lcscs('"') == []
+    assert lcscs("*") == ["C1001", "C2002"]
+    manager.close()
+
+
+def test_first_price_is_materialized_and_backfilled(parts_db):
+    db_path = parts_db
+    manager = JLCPCBPartsManager(db_path)
+    manager.import_parts(
+        [
+            {"componentCode": "C1", "prices": [{"qty": 1, "price": 0.5}]},
+            {"componentCode": "C2", "prices": []},
+        ]
+    )
+    rows = dict(manager.conn.execute("SELECT lcsc, first_price FROM components"))
+    assert rows == {"C1": 0.5, "C2": None}
+
+    # Databases created before the column existed are migrated on open
+    manager.conn.execute("ALTER TABLE components DROP COLUMN first_price")
+    manager.conn.commit()
+    manager.close()
+    reopened = JLCPCBPartsManager(db_path)
+    assert reopened.get_part_info("C1")["first_price"] == 0.5
+    reopened.close()
+
+
+def test_search_parts_looks_up_bare_lcsc_numbers_by_key(tmp_path, parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+    cache = _write_yaqwsx_cache(
+        tmp_path / "cache.sqlite3",
+        [
+            (25804, "0603WAF1002T5E", "10k resistor", 100),
+            (21190, "0603WAF1001T5E", "1k resistor C25804 alt", 100),
+        ],
+    )
+    manager.import_yaqwsx_cache(cache)
+
+    assert [p.lcsc for p in manager.search_parts(query=" c25804 ")] == ["C25804"]
+    assert manager.search_parts(query="C25804", package="0402") == []
+    assert manager.search_parts(query="C1") == []
+    sql = manager._build_search_sql(True, False, False, False, False, True, False, True)
+    assert "MATCH" not in sql
+    manager.close()
+
+
+def test_stats_polled_during_an_import_are_not_cached(parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+    polled = []
+
+    def api_parts():
+        for n in range(25):
+            if n == 15:
+                # A status poll from the request thread mid-import
+                poller = threading.Thread(
+                    target=lambda: polled.append(manager.get_cached_database_stats())
+                )
+                poller.start()
+                poller.join()
+            yield {"componentCode": f"C{n}", "describe": "polled resistor"}
+
+    manager.import_parts(api_parts(), batch_size=10)
+
+    assert polled[0]["total_parts"] < 25
+    assert manager.get_cached_database_stats()["total_parts"] == 25
+    assert manager.get_database_stats()["total_parts"] == 25
+    manager.close()
+
+
+def test_failed_streamed_import_leaves_the_database_unchanged(parts_db):
+    manager = JLCPCBPartsManager(parts_db)
+    manager.import_parts([{"componentCode": "C1", "describe": "kept resistor"}])
+
+    def failing_download():
+        for n in range(2, 17):
+            yield {"componentCode": f"C{n}", "describe": "partial resistor"}
+        raise ConnectionError("page 2 failed")
+
+    with pytest.raises(ConnectionError):
+        with manager.bulk_load(drop_indexes=True):
+            manager.import_parts(failing_download(), batch_size=10)
+
+    assert manager.get_database_stats()["total_parts"] == 1
+    assert _fts_lcsc(manager, "kept") == ["C1"]
+    assert _fts_lcsc(manager, "partial") == []
+    manager.conn.execute(
+        "INSERT INTO components_fts(components_fts) VALUES('integrity-check')"
+    )
+    manager.close()
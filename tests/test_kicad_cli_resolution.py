@@ -1,57 +1,101 @@
-import stat
+import os
 import sys
 from pathlib import Path
+from typing import List
+
+import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "python"))
 
 import utils.kicad_cli as kicad_cli
 
 
-def _make_fake_cli(tmp_path: Path, name: str = "kicad-cli") -> str:
-    cli_path = tmp_path / name
-    cli_path.write_text(
-        '#!/bin/sh\nif [ "$1" = "--version" ]; then\n  echo "KiCad CLI 9.0"\n  exit 0\nfi\nexit 0\n',
-        encoding="utf-8",
-    )
-    cli_path.chmod(cli_path.stat().st_mode | stat.S_IXUSR)
-    return str(cli_path)
+@pytest.fixture(autouse=True)
+def _fresh_resolution(monkeypatch):
+    monkeypatch.setattr(kicad_cli, "_RESOLVE_CACHE", None)
+    kicad_cli._validate_kicad_cli_version.cache_clear()
 
 
-def test_resolve_uses_env_override_first(tmp_path, monkeypatch):
-    env_cli = _make_fake_cli(tmp_path, "env-kicad-cli")
-    fallback_cli = _make_fake_cli(tmp_path, "fallback-kicad-cli")
+FAKE_CLI_SCRIPT = (
+    b"#!/bin/sh\n"
+    b'if [ "$1" = "--version" ]; then\n'
+    b'  echo "KiCad CLI 9.0"\n'
+    b"  exit 0\n"
+    b"fi\n"
+    b"exit 0\n"
+)
 
-    monkeypatch.setenv("KICAD_CLI_PATH", env_cli)
-    monkeypatch.delenv("KICAD_CLI", raising=False)
-    monkeypatch.setattr(kicad_cli.shutil, "which", lambda _: None)
-    monkeypatch.setattr(kicad_cli, "_platform_fallbacks", lambda: [fallback_cli])
 
-    result = kicad_cli.resolve_kicad_cli()
-    assert result["found"] is True
-    assert result["path"] == env_cli
-    assert result["source"] == "env:KICAD_CLI_PATH"
+@pytest.fixture(scope="session")
+def fake_cli_dir(tmp_path_factory) -> Path:
+    """One directory of executable fake kicad-cli scripts, shared by all tests"""
+    cli_dir = tmp_path_factory.mktemp("fake-kicad-cli")
+    for name in ("kicad-cli", "env-kicad-cli", "other-kicad-cli"):
+        fd = os.open(cli_dir / name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o755)
+        with os.fdopen(fd, "wb") as script:
+            script.write(FAKE_CLI_SCRIPT)
+    return cli_dir
+
+
+@pytest.fixture
+def empty_path(monkeypatch):
+    """Hide any real kicad-cli on PATH"""
+    monkeypatch.setenv("PATH", "")
 
 
-def test_resolve_falls_back_when_env_invalid(tmp_path, monkeypatch):
-    fallback_cli = _make_fake_cli(tmp_path, "fallback-kicad-cli")
+def _fake_installs(monkeypatch, *paths: str) -> List[str]:
+    """Treat exactly ``paths`` as working kicad-cli binaries, without touching disk
 
-    monkeypatch.setenv("KICAD_CLI_PATH", str(tmp_path / "does-not-exist"))
-    monkeypatch.setattr(kicad_cli.shutil, "which", lambda _: None)
+    For tests about candidate order only; the stat and --version checks are
+    covered by the tests that use fake_cli_dir.
+    """
+    normalized = [os.path.abspath(path) for path in paths]
+    installed = set(normalized)
+    monkeypatch.setattr(kicad_cli, "_is_executable_file", installed.__contains__)
+    monkeypatch.setattr(
+        kicad_cli, "_validate_kicad_cli", lambda path: (path in installed, "")
+    )
+    return normalized
+
+
+@pytest.mark.parametrize(
+    "env_value, expected_source",
+    [
+        ("/opt/env/kicad-cli", "env:KICAD_CLI_PATH"),
+        ("/opt/does-not-exist/kicad-cli", "fallback"),
+        (None, "fallback"),
+    ],
+    ids=["env-valid", "env-invalid", "env-absent"],
+)
+def test_resolve_prefers_env_then_fallback(
+    env_value, expected_source, empty_path, monkeypatch
+):
+    env_cli, fallback_cli = _fake_installs(
+        monkeypatch, "/opt/env/kicad-cli", "/opt/fallback/kicad-cli"
+    )
+    monkeypatch.delenv("KICAD_CLI", raising=False)
+    if env_value is None:
+        monkeypatch.delenv("KICAD_CLI_PATH", raising=False)
+    else:
+        monkeypatch.setenv("KICAD_CLI_PATH", env_value)
     monkeypatch.setattr(kicad_cli, "_platform_fallbacks", lambda: [fallback_cli])
 
     result = kicad_cli.resolve_kicad_cli()
     assert result["found"] is True
-    assert result["path"] == fallback_cli
-    assert fallback_cli in result["searched"]
+    assert result["source"] == expected_source
+    assert result["path"] == (
+        env_cli if expected_source.startswith("env:") else fallback_cli
+    )
+    assert result["searched"][-1] == result["path"]
 
 
-def test_resolve_reports_searched_paths_on_failure(tmp_path, monkeypatch):
-    missing_a = str(tmp_path / "missing-a")
-    missing_b = str(tmp_path / "missing-b")
+def test_resolve_reports_searched_paths_on_failure(empty_path, monkeypatch):
+    _fake_installs(monkeypatch)
+    missing_a = os.path.abspath("/opt/missing-a/kicad-cli")
+    missing_b = os.path.abspath("/opt/missing-b/kicad-cli")
 
     monkeypatch.delenv("KICAD_CLI", raising=False)
     monkeypatch.delenv("KICAD_CLI_PATH", raising=False)
-    monkeypatch.setattr(kicad_cli.shutil, "which", lambda _: None)
     monkeypatch.setattr(
         kicad_cli, "_platform_fallbacks", lambda: [missing_a, missing_b]
     )
@@ -60,3 +104,54 @@ def test_resolve_reports_searched_paths_on_failure(tmp_path, monkeypatch):
     assert result["found"] is False
     assert missing_a in result["searched"]
     assert missing_b in result["searched"]
+
+
+def test_resolve_reuses_result_until_env_changes(fake_cli_dir, empty_path, monkeypatch):
+    env_cli = str(fake_cli_dir / "env-kicad-cli")
+    other_cli = str(fake_cli_dir / "other-kicad-cli")
+
+    monkeypatch.setenv("KICAD_CLI", env_cli)
+    monkeypatch.setattr(kicad_cli, "_platform_fallbacks", lambda: [])
+
+    first = kicad_cli.resolve_kicad_cli()
+    runs = []
+    real_run = kicad_cli.subprocess.run
+    monkeypatch.setattr(
+        kicad_cli.subprocess,
+        "run",
+        lambda *args, **kwargs: runs.append(args) or real_run(*args, **kwargs),
+    )
+    second = kicad_cli.resolve_kicad_cli()
+    assert second == first and second["path"] == env_cli
+    assert runs == []
+
+    monkeypatch.setenv("KICAD_CLI", other_cli)
+    assert kicad_cli.resolve_kicad_cli()["path"] == other_cli
+    assert len(runs) == 1
+
+    # Switching back validates nothing new: the binary is unchanged
+    monkeypatch.setenv("KICAD_CLI", env_cli)
+    assert kicad_cli.resolve_kicad_cli()["path"] == env_cli
+    assert len(runs) == 1
+
+
+def test_resolve_skips_fallback_globs_when_path_matches(fake_cli_dir, monkeypatch):
+    path_cli = str(fake_cli_dir / "kicad-cli")
+    globbed = []
+
+    monkeypatch.delenv("KICAD_CLI", raising=False)
+    monkeypatch.delenv("KICAD_CLI_PATH", raising=False)
+    monkeypatch.setenv("PATH", str(fake_cli_dir))
+    monkeypatch.setattr(
+        kicad_cli,
+        "_platform_fallbacks",
+        lambda: [str(fake_cli_dir / "*" / "kicad-cli")],
+    )
+    monkeypatch.setattr(
+        kicad_cli.glob, "glob", lambda pattern: globbed.append(pattern) or []
+    )
+
+    result = kicad_cli.resolve_kicad_cli()
+    assert result["source"] == "PATH"
+    assert result["searched"] == [path_cli]
+    assert globbed == []
@@ -0,0 +1,166 @@
+import functools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+import types
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+PYTHON_DIR = str(Path(__file__).parent.parent / "python")
+
+
+# Executed once per session. kicad_interface picks its backend at import, so
+# it is loaded with the SWIG backend forced and a stand-in pcbnew module.
+@functools.lru_cache(maxsize=None)
+def _load_kicad_interface():
+    pcbnew = types.ModuleType("pcbnew")
+    setattr(pcbnew, "__file__", "pcbnew.py")
+    setattr(pcbnew, "GetBuildVersion", lambda: "9.0.0")
+    env = {"KICAD_BACKEND": "swig", "KICAD_AUTO_LAUNCH": "false"}
+    with mock.patch.dict(os.environ, env), mock.patch.dict(
+        sys.modules, {"pcbnew": pcbnew}
+    ), mock.patch.object(sys, "path", [PYTHON_DIR, *sys.path]):
+        import kicad_interface
+    return kicad_interface
+
+
+@pytest.fixture
+def interface(monkeypatch):
+    module = _load_kicad_interface()
+    calls = []
+
+    def _fake_handle_command(self, command, params):
+        calls.append(command)
+        if command == "fail":
+            return {"success": False, "message": "failed"}
+        return {"success": True, "echo": params.get("value")}
+
+    monkeypatch.setattr(module.KiCADInterface, "handle_command", _fake_handle_command)
+    # KiCADInterface uses __slots__, so the call log is returned alongside
+    return module, module.KiCADInterface(), calls
+
+
+def test_handle_batch_rejects_oversize_batch(interface, monkeypatch):
+    module, instance, calls = interface
+    monkeypatch.setattr(module, "MAX_BATCH_SIZE", 2)
+
+    responses = instance.handle_batch(
+        [{"id": n, "command": "ok", "params": {}} for n in range(3)]
+    )
+
+    assert len(responses) == 1
+    assert responses[0]["id"] is None
+    assert responses[0]["result"]["success"] is False
+    assert "exceeds the limit of 2" in responses[0]["result"]["message"]
+    assert calls == []
+
+
+def test_handle_batch_answers_missing_and_duplicate_ids_per_item(interface):
+    _, instance, calls = interface
+
+    responses = instance.handle_batch(
+        [
+            {"command": "ok", "params": {"value": 1}},
+            {"id": "a", "command": "ok", "params": {"value": 2}},
+            {"id": "a", "command": "ok", "params": {"value": 3}},
+        ]
+    )
+
+    assert [r["id"] for r in responses] == [None, "a", "a"]
+    assert "requires a string or number id" in responses[0]["result"]["message"]
+    assert responses[1]["result"] == {"success": True, "echo": 2}
+    assert "Duplicate batch request id: a" in responses[2]["result"]["message"]
+    assert calls == ["ok"]
+
+
+def test_handle_batch_keeps_request_order_for_mixed_results(interface):
+    _, instance, calls = interface
+
+    responses = instance.handle_batch(
+        [
+            {"id": 1, "command": "ok", "params": {"value": "first"}},
+            {"id": 2, "command": "fail"},
+            {"id": 3, "params": {}},
+            {"id": 4, "command": "ok", "params": {"value": "last"}},
+        ]
+    )
+
+    assert [r["id"] for r in responses] == [1, 2, 3, 4]
+    assert [r["result"]["success"] for r in responses] == [True, False, False, True]
+    assert responses[0]["result"]["echo"] == "first"
+    assert responses[2]["result"]["message"] == "Missing command"
+    assert responses[3]["result"]["echo"] == "last"
+    assert calls == ["ok", "fail", "ok"]
+
+
+def test_dispatch_table_is_separate_from_command_routes():
+    instance = _load_kicad_interface().KiCADInterface()
+
+    # handle_command memoizes resolved handlers into the dispatch table
+    assert instance._dispatch == instance.command_routes
+    assert instance._dispatch is not instance.command_routes
+
+
+def test_log_preview_decodes_raw_request_bytes():
+    module = _load_kicad_interface()
+
+    preview = module._log_preview(b'{"command": "ping", "note": "\xc2\xb5"}\n')
+
+    assert preview.strip() == '{"command": "ping", "note": "µ"}'
+    assert len(module._log_preview(b"x" * 1000)) == 500
+
+
+def test_handle_batch_reports_a_failed_commit_and_drops_it(interface):
+    module, instance, calls = interface
+    board_api = mock.Mock(_current_commit="commit")
+    board_api.commit_transaction.side_effect = RuntimeError("push failed")
+    board_api.rollback_transaction.side_effect = RuntimeError("drop failed")
+    instance.ipc_board_api = board_api
+    instance._ipc_commands = frozenset({"ok"})
+
+    responses = instance.handle_batch([{"id": 1, "command": "ok", "params": {}}])
+
+    assert [r["id"] for r in responses] == [1, None]
+    assert responses[1]["result"]["success"] is False
+    assert responses[1]["result"]["errorDetails"] == "push failed"
+    assert board_api._current_commit is None
+    assert calls == ["ok"]
+
+
+def test_dumps_bytes_matches_json_for_non_ascii_and_wide_ints():
+    module = _load_kicad_interface()
+    payload = {"note": "µ Ω 🔌", "big": 2**70, "ok": [1, "a"]}
+
+    data = module._dumps_bytes(payload)
+
+    assert data.isascii()
+    assert data == json.dumps(payload, separators=(",", ":")).encode("ascii")
+
+
+def test_log_listener_flushes_buffered_records_when_idle(monkeypatch):
+    module = _load_kicad_interface()
+    monkeypatch.setattr(module._FlushingQueueListener, "FLUSH_INTERVAL", 0.01)
+    written = []
+    target = logging.Handler()
+    target.emit = written.append
+    buffered = logging.handlers.MemoryHandler(64, target=target)
+    listener = module._FlushingQueueListener(queue.Queue(-1), buffered)
+
+    listener.start()
+    try:
+        listener.queue.put(
+            logging.makeLogRecord({"msg": "idle", "levelno": logging.INFO})
+        )
+        deadline = time.monotonic() + 5
+        while not written and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        listener.stop()
+
+    assert [record.msg for record in written] == ["idle"]
@@ -0,0 +1,31 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "python"))
+
+import utils.kicad_process as kicad_process
+
+KiCADProcessManager = kicad_process.KiCADProcessManager
+
+
+@pytest.mark.skipif(not hasattr(os, "posix_spawn"), reason="requires posix_spawn")
+def test_spawn_detached_runs_in_new_session_and_is_reaped(tmp_path):
+    marker = tmp_path / "sid.txt"
+    script = (
+        "import os, sys, pathlib; print('noise'); "
+        f"pathlib.Path({str(marker)!r}).write_text(str(os.getsid(0)))"
+    )
+    KiCADProcessManager._spawn_detached([sys.executable, "-c", script])
+
+    for _ in range(50):
+        KiCADProcessManager._reap_spawned()
+        if not kicad_process._spawned_pids:
+            break
+        time.sleep(0.05)
+
+    assert not kicad_process._spawned_pids
+    assert marker.read_text() != str(os.getsid(0))
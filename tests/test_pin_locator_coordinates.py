@@ -1,48 +1,14 @@
-import sys
-import types
-import importlib.util
-from pathlib import Path
+from commands import pin_locator
+from tests._fakes import FakeSchematic
 
-ROOT = Path(__file__).parent.parent
-PIN_LOCATOR_PATH = ROOT / "python" / "commands" / "pin_locator.py"
 
+def test_pin_locator_inverts_symbol_y_for_schematic_space(monkeypatch, tmp_path):
+    PinLocator = pin_locator.PinLocator
 
-def _load_pin_locator_module():
-    if "skip" not in sys.modules:
-        skip_module = types.ModuleType("skip")
-        setattr(skip_module, "Schematic", object)
-        sys.modules["skip"] = skip_module
-
-    spec = importlib.util.spec_from_file_location(
-        "commands.pin_locator", PIN_LOCATOR_PATH
-    )
-    assert spec is not None
-    assert spec.loader is not None
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
+    class _FakeSchematic(FakeSchematic):
+        origin = (100.0, 100.0)
 
-def test_pin_locator_inverts_symbol_y_for_schematic_space(monkeypatch, tmp_path):
-    module = _load_pin_locator_module()
-    PinLocator = module.PinLocator
-
-    class _Obj:
-        def __init__(self, **kwargs):
-            for key, value in kwargs.items():
-                setattr(self, key, value)
-
-    class _FakeSchematic:
-        def __init__(self, _path):
-            self.symbol = [
-                _Obj(
-                    property=_Obj(Reference=_Obj(value="R1")),
-                    at=_Obj(value=[100.0, 100.0, 0.0]),
-                    lib_id=_Obj(value="Device:R"),
-                )
-            ]
-
-    monkeypatch.setattr(module, "Schematic", _FakeSchematic)
+    monkeypatch.setattr(pin_locator, "Schematic", _FakeSchematic)
 
     locator = PinLocator()
     monkeypatch.setattr(
@@ -60,3 +26,68 @@ def test_pin_locator_inverts_symbol_y_for_schematic_space(monkeypatch, tmp_path)
     assert pin is not None
     assert round(pin["x"], 2) == 100.0
     assert round(pin["y"], 2) == 96.19
+
+
+def test_pin_locator_reuses_parse_until_schematic_changes(monkeypatch, tmp_path):
+    PinLocator = pin_locator.PinLocator
+    parses = []
+
+    class _FakeSchematic(FakeSchematic):
+        origin = (100.0, 100.0)
+
+        def __init__(self, path):
+            parses.append(path)
+            super().__init__(path)
+
+    monkeypatch.setattr(pin_locator, "Schematic", _FakeSchematic)
+
+    locator = PinLocator()
+    monkeypatch.setattr(
+        locator,
+        "get_symbol_pins",
+        lambda *_args, **_kwargs: {
+            "1": {"x": 0.0, "y": 3.81, "angle": 270.0, "name": "~"},
+            "2": {"x": 0.0, "y": -3.81, "angle": 90.0, "name": "~"},
+        },
+    )
+
+    sch_path = tmp_path / "cached.kicad_sch"
+    sch_path.write_text("(kicad_sch)", encoding="utf-8")
+
+    first = locator.get_pin_info(sch_path, "R1", "1")
+    assert locator.get_pin_info(sch_path, "R1", "1") == first
+    assert locator.get_pin_info(sch_path, "R1", "2") is not None
+    assert len(parses) == 1
+
+    sch_path.write_text("(kicad_sch (wire))", encoding="utf-8")
+    assert locator.get_pin_info(sch_path, "R1", "1") == first
+    assert len(parses) == 2
+
+
+def test_pin_locator_caches_keep_only_recent_schematics(monkeypatch, tmp_path):
+    PinLocator = pin_locator.PinLocator
+
+    class _FakeSchematic(FakeSchematic):
+        origin = (100.0, 100.0)
+
+    monkeypatch.setattr(pin_locator, "Schematic", _FakeSchematic)
+    monkeypatch.setattr(PinLocator, "SCHEMATIC_CACHE_SIZE", 2)
+
+    locator = PinLocator()
+    monkeypatch.setattr(
+        locator,
+        "get_symbol_pins",
+        lambda *_args, **_kwargs: {
+            "1": {"x": 0.0, "y": 3.81, "angle": 270.0, "name": "~"}
+        },
+    )
+
+    paths = []
+    for name in ("a", "b", "c"):
+        sch_path = tmp_path / f"{name}.kicad_sch"
+        sch_path.write_text("(kicad_sch)", encoding="utf-8")
+        paths.append(str(sch_path))
+        assert locator.get_pin_info(sch_path, "R1", "1") is not None
+
+    assert list(locator.schematic_cache) == paths[1:]
+    assert list(locator.pin_info_cache) == paths[1:]
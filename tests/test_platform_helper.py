@@ -141,6 +141,57 @@ class TestDetectPlatform:
         assert all(p.isdigit() for p in parts)
 
 
+class TestKiCADPathCache:
+    """Test caching of KiCAD Python path discovery"""
+
+    def _setup(self, monkeypatch, tmp_path):
+        root = tmp_path / "KiCad"
+        site_packages = root / "9.0" / "lib" / "python3" / "dist-packages"
+        site_packages.mkdir(parents=True)
+        scans = []
+
+        def fake_scan():
+            scans.append(1)
+            return [site_packages]
+
+        monkeypatch.setattr(PlatformHelper, "get_cache_dir", lambda: tmp_path / "cache")
+        monkeypatch.setattr(PlatformHelper, "get_kicad_install_roots", lambda: [root])
+        monkeypatch.setattr(PlatformHelper, "get_kicad_python_paths", fake_scan)
+        return root, scans
+
+    def test_cached_paths_skip_rescan(self, monkeypatch, tmp_path):
+        """Test that a second lookup with unchanged installs reuses the cache"""
+        root, scans = self._setup(monkeypatch, tmp_path)
+
+        first = PlatformHelper.get_cached_kicad_python_paths()
+        second = PlatformHelper.get_cached_kicad_python_paths()
+
+        assert first == second == [root / "9.0" / "lib" / "python3" / "dist-packages"]
+        assert len(scans) == 1
+        assert (tmp_path / "cache" / "kicad_paths.json").exists()
+
+    def test_install_root_change_invalidates_cache(self, monkeypatch, tmp_path):
+        """Test that adding a KiCAD version triggers a fresh scan"""
+        root, scans = self._setup(monkeypatch, tmp_path)
+
+        PlatformHelper.get_cached_kicad_python_paths()
+        (root / "10.0").mkdir()
+        os.utime(root, ns=(0, 0))
+        PlatformHelper.get_cached_kicad_python_paths()
+
+        assert len(scans) == 2
+
+    def test_missing_cached_path_invalidates_cache(self, monkeypatch, tmp_path):
+        """Test that a removed KiCAD Python path is not served from the cache"""
+        root, scans = self._setup(monkeypatch, tmp_path)
+
+        PlatformHelper.get_cached_kicad_python_paths()
+        (root / "9.0" / "lib" / "python3" / "dist-packages").rmdir()
+        PlatformHelper.get_cached_kicad_python_paths()
+
+        assert len(scans) == 2
+
+
 @pytest.mark.integration
 class TestKiCADPathDetection:
     """Tests that require KiCAD to be installed"""
@@ -0,0 +1,35 @@
+import os
+
+from commands import schematic
+
+
+def test_load_schematic_cached_reparses_only_on_change(tmp_path, monkeypatch):
+    parses = []
+
+    class _CountingSchematic:
+        def __init__(self, path):
+            parses.append(path)
+
+    monkeypatch.setattr(schematic, "Schematic", _CountingSchematic)
+    manager = schematic.SchematicManager
+    monkeypatch.setattr(manager, "_schematic_cache", type(manager._schematic_cache)())
+
+    sch_path = tmp_path / "cached.kicad_sch"
+    sch_path.write_text("(kicad_sch)", encoding="utf-8")
+
+    first = manager.load_schematic_cached(str(sch_path))
+    second = manager.load_schematic_cached(str(sch_path))
+    assert first is second
+    assert len(parses) == 1
+
+    sch_path.write_text("(kicad_sch (version 1))", encoding="utf-8")
+    third = manager.load_schematic_cached(str(sch_path))
+    assert third is not first
+    assert len(parses) == 2
+
+    manager.invalidate_cache(str(sch_path))
+    manager.load_schematic_cached(str(sch_path))
+    assert len(parses) == 3
+
+    os.remove(sch_path)
+    assert manager.load_schematic_cached(str(sch_path)) is None
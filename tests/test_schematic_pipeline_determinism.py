@@ -1,83 +1,51 @@
-import sys
-import types
-import importlib.util
-from pathlib import Path
+import pytest
 
-ROOT = Path(__file__).parent.parent
-SCHEMATIC_QUALITY_PATH = ROOT / "python" / "commands" / "schematic_quality.py"
-
-if "commands" not in sys.modules:
-    commands_pkg = types.ModuleType("commands")
-    sys.modules["commands"] = commands_pkg
-
-
-class _FakeConnectionManager:
-    @staticmethod
-    def generate_netlist(*_args, **_kwargs):
-        return {"nets": []}
-
-    @staticmethod
-    def connect_to_net(*_args, **_kwargs):
-        return True
+from commands import schematic_quality as sq
+from tests._fakes import FakeSchematic as _FakeSchematic
 
+ConnectionManager = sq.ConnectionManager
 
-if "commands.connection_schematic" not in sys.modules:
-    connection_module = types.ModuleType("commands.connection_schematic")
-    setattr(connection_module, "ConnectionManager", _FakeConnectionManager)
-    sys.modules["commands.connection_schematic"] = connection_module
 
-if "skip" not in sys.modules:
-    skip_module = types.ModuleType("skip")
-    setattr(skip_module, "Schematic", object)
-    sys.modules["skip"] = skip_module
+@pytest.fixture
+def vcc_netlist(monkeypatch):
+    """Netlist every schematic as R1.1 on VCC; returns the call counter"""
+    calls = {"count": 0}
 
+    def _fake_generate_netlist(*_args, **_kwargs):
+        calls["count"] += 1
+        return {
+            "nets": [{"name": "VCC", "connections": [{"component": "R1", "pin": "1"}]}]
+        }
 
-def _load_schematic_quality():
-    spec = importlib.util.spec_from_file_location(
-        "commands.schematic_quality", SCHEMATIC_QUALITY_PATH
+    monkeypatch.setattr(ConnectionManager, "generate_netlist", _fake_generate_netlist)
+    monkeypatch.setattr(
+        ConnectionManager, "connect_to_net", lambda *_args, **_kwargs: True
     )
-    assert spec is not None
-    assert spec.loader is not None
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+    return calls
 
 
-sq = _load_schematic_quality()
-ConnectionManager = sq.ConnectionManager
-
+@pytest.fixture
+def fake_clear_connectivity(monkeypatch):
+    """Pretend one wire was cleared from disk; returns the call counter"""
+    calls = {"count": 0}
 
-class _Obj:
-    def __init__(self, **kwargs):
-        for key, value in kwargs.items():
-            setattr(self, key, value)
-
-
-class _FakeSchematic:
-    def __init__(self, _path):
-        symbol = _Obj(
-            property=_Obj(Reference=_Obj(value="R1")),
-            at=_Obj(value=[10.0, 10.0, 0]),
-        )
-        self.symbol = [symbol]
-        self.wire = []
+    def _fake_clear(_path):
+        calls["count"] += 1
+        return {"wire": 1}
 
-    def write(self, _path):
-        return None
+    monkeypatch.setattr(
+        sq.SchematicQualityManager, "_clear_connectivity_primitives", _fake_clear
+    )
+    return calls
 
 
-def test_auto_layout_refuses_unsafe_when_connectivity_exists(tmp_path, monkeypatch):
+def test_auto_layout_refuses_unsafe_when_connectivity_exists(
+    tmp_path, monkeypatch, vcc_netlist
+):
     sch_path = tmp_path / "guard.kicad_sch"
     sch_path.write_text("(kicad_sch)", encoding="utf-8")
 
     monkeypatch.setattr(sq, "Schematic", _FakeSchematic)
-    monkeypatch.setattr(
-        ConnectionManager,
-        "generate_netlist",
-        lambda *_args, **_kwargs: {
-            "nets": [{"name": "VCC", "connections": [{"component": "R1", "pin": "1"}]}]
-        },
-    )
 
     result = sq.SchematicQualityManager.auto_layout(
         sch_path,
@@ -89,30 +57,14 @@ def test_auto_layout_refuses_unsafe_when_connectivity_exists(tmp_path, monkeypat
     assert result["guard"] == "connectivity_present"
 
 
-def test_auto_layout_preserves_membership_and_reports_rebuild(tmp_path, monkeypatch):
+def test_auto_layout_preserves_membership_and_reports_rebuild(
+    tmp_path, monkeypatch, vcc_netlist
+):
     sch_path = tmp_path / "preserve.kicad_sch"
     sch_path.write_text("(kicad_sch)", encoding="utf-8")
 
     monkeypatch.setattr(sq, "Schematic", _FakeSchematic)
 
-    netlist_calls = {"count": 0}
-
-    def _fake_generate_netlist(*_args, **_kwargs):
-        netlist_calls["count"] += 1
-        return {
-            "nets": [
-                {
-                    "name": "VCC",
-                    "connections": [{"component": "R1", "pin": "1"}],
-                }
-            ]
-        }
-
-    monkeypatch.setattr(ConnectionManager, "generate_netlist", _fake_generate_netlist)
-    monkeypatch.setattr(
-        ConnectionManager, "connect_to_net", lambda *_args, **_kwargs: True
-    )
-
     result = sq.SchematicQualityManager.auto_layout(
         sch_path,
         preserve_connectivity=True,
@@ -122,10 +74,13 @@ def test_auto_layout_preserves_membership_and_reports_rebuild(tmp_path, monkeypa
     assert result["success"] is True
     assert result["connectivityPreserved"] is True
     assert result["rebuiltConnections"] == 1
-    assert netlist_calls["count"] >= 2
+    # Labels and pin contacts are positional, so the layout is still re-netlisted.
+    assert vcc_netlist["count"] == 2
 
 
-def test_auto_layout_rebuilds_after_clearing_wires(tmp_path, monkeypatch):
+def test_auto_layout_rebuilds_after_clearing_wires(
+    tmp_path, monkeypatch, vcc_netlist, fake_clear_connectivity
+):
     sch_path = tmp_path / "wires_guard.kicad_sch"
     sch_path.write_text("(kicad_sch)", encoding="utf-8")
 
@@ -135,26 +90,6 @@ def test_auto_layout_rebuilds_after_clearing_wires(tmp_path, monkeypatch):
             self.wire = [object()]
 
     monkeypatch.setattr(sq, "Schematic", _WireSchematic)
-    monkeypatch.setattr(
-        ConnectionManager,
-        "generate_netlist",
-        lambda *_args, **_kwargs: {
-            "nets": [{"name": "VCC", "connections": [{"component": "R1", "pin": "1"}]}]
-        },
-    )
-    monkeypatch.setattr(
-        ConnectionManager, "connect_to_net", lambda *_args, **_kwargs: True
-    )
-
-    clear_calls = {"count": 0}
-
-    def _fake_clear(_path):
-        clear_calls["count"] += 1
-        return {"wire": 1}
-
-    monkeypatch.setattr(
-        sq.SchematicQualityManager, "_clear_connectivity_primitives", _fake_clear
-    )
 
     result = sq.SchematicQualityManager.auto_layout(
         sch_path,
@@ -164,4 +99,57 @@ def test_auto_layout_rebuilds_after_clearing_wires(tmp_path, monkeypatch):
 
     assert result["success"] is True
     assert result["rebuiltConnections"] == 1
-    assert clear_calls["count"] == 1
+    assert fake_clear_connectivity["count"] == 1
+    assert vcc_netlist["count"] == 2
+
+
+def test_auto_layout_strips_wires_from_parsed_tree_before_single_write(
+    tmp_path, monkeypatch, vcc_netlist
+):
+    sch_path = tmp_path / "in_memory.kicad_sch"
+    sch_path.write_text("(kicad_sch)", encoding="utf-8")
+    wire = [sq.Symbol("wire"), [sq.Symbol("pts")]]
+    label = [sq.Symbol("label"), "VCC"]
+    tree = [sq.Symbol("kicad_sch"), wire, label]
+    writes = {"count": 0}
+
+    class _TreeSchematic(_FakeSchematic):
+        def __init__(self, _path):
+            super().__init__(_path)
+            self.wire = [object()]
+            self.tree = tree
+
+        def write(self, _path):
+            writes["count"] += 1
+
+    monkeypatch.setattr(sq, "Schematic", _TreeSchematic)
+
+    def _unexpected_clear(_path):
+        raise AssertionError("schematic should not be re-read to clear wires")
+
+    monkeypatch.setattr(
+        sq.SchematicQualityManager, "_clear_connectivity_primitives", _unexpected_clear
+    )
+
+    result = sq.SchematicQualityManager.auto_layout(sch_path)
+
+    assert result["success"] is True
+    assert result["clearedPrimitives"]["wire"] == 1
+    assert result["clearedPrimitives"]["label"] == 1
+    assert tree == [sq.Symbol("kicad_sch")]
+    assert writes["count"] == 1
+
+
+def test_membership_equal_reports_nets_only_present_after():
+    manager = sq.SchematicQualityManager
+    before = manager._membership_digests(
+        {"VCC": {("R1", "1"), ("C1", "1")}, "EMPTY": set()}
+    )
+    after = manager._membership_digests(
+        {"VCC": {("C1", "1"), ("R1", "1")}, "GND": {("R1", "2")}}
+    )
+
+    ok, mismatches = manager._membership_equal(before, after)
+
+    assert ok is False
+    assert mismatches == ["GND"]